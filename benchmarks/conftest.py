@@ -0,0 +1,181 @@
+"""Benchmark harness for the job pipeline.
+
+Benchmarks are ordinary pytest tests that time a callable through the
+``bench`` fixture. They are only collected when the benchmarks directory
+is passed explicitly, so ``python -m pytest`` / ``pytest tests`` never run
+them:
+
+    python -m pytest benchmarks -q                  # compare with baseline
+    python -m pytest benchmarks -q --bench-save     # record a new baseline
+    python -m pytest benchmarks -q --bench-threshold 1.2
+
+Each benchmark runs its callable for at least ``--bench-min-time`` seconds
+(and at least three rounds) and reports the median and fastest round.
+With a baseline file present, a benchmark fails when its fastest round is
+slower than the baseline's fastest round times the threshold (default
+1.5, i.e. 50% slower); the minimum is far less sensitive to scheduler
+noise than the median.
+
+Shared and virtual machines change speed over periods of seconds, so each
+benchmark also times a fixed pure-Python reference workload right before
+and after it, and the comparison uses times relative to that reference.
+Baselines are machine specific, so the default file is keyed by host name
+and kept out of version control (benchmarks/.baselines/).
+"""
+
+import gc
+import json
+import platform
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import pytest
+
+BENCHMARKS_DIR = Path(__file__).parent
+DEFAULT_BASELINE = BENCHMARKS_DIR / ".baselines" / f"{platform.node() or 'default'}.json"
+
+_results: Dict[str, Dict[str, float]] = {}
+
+
+def _reference_workload() -> None:
+    """Fixed interpreter-bound work (about a millisecond)."""
+    total = 0
+    for i in range(20_000):
+        total += i % 7
+    sorted(str(i) for i in range(2_000))
+
+
+def _reference_time(rounds: int = 5) -> float:
+    """Fastest of several runs of the reference workload."""
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        _reference_workload()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("bench", "job pipeline benchmarks")
+    group.addoption("--bench-save", action="store_true",
+                    help="Store the results as the new baseline")
+    group.addoption("--bench-baseline", type=Path, default=DEFAULT_BASELINE,
+                    help="Baseline file (default: benchmarks/.baselines/<host>.json)")
+    group.addoption("--bench-threshold", type=float, default=1.5,
+                    help="Fail when more than threshold times slower than baseline (default: 1.5)")
+    group.addoption("--bench-min-time", type=float, default=0.5,
+                    help="Minimum measuring time per benchmark in seconds (default: 0.5)")
+
+
+def pytest_ignore_collect(collection_path, config):
+    """Collect benchmarks only when benchmarks/ (or a file in it) is requested."""
+    if collection_path == BENCHMARKS_DIR:
+        return None
+    requested = [Path(arg.split("::")[0]).resolve() for arg in config.args]
+    if any(path == BENCHMARKS_DIR or BENCHMARKS_DIR in path.parents for path in requested):
+        return None
+    return True
+
+
+def _load_baseline(path: Path) -> Dict[str, Dict[str, float]]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+class Bench:
+    """Time a callable and compare it with the stored baseline."""
+
+    def __init__(self, name: str, config):
+        self.name = name
+        self.min_time = config.getoption("--bench-min-time")
+        self.threshold = config.getoption("--bench-threshold")
+        self.baseline = _load_baseline(config.getoption("--bench-baseline")).get(name)
+        self.compare = not config.getoption("--bench-save")
+        self.stats: Dict[str, float] = {}
+
+    def __call__(self, func: Callable[..., Any], *args: Any, min_rounds: int = 3, **kwargs: Any) -> Any:
+        """Run func(*args, **kwargs) repeatedly and record its timing.
+
+        Args:
+            func: Callable to benchmark
+            *args: Positional arguments for func
+            min_rounds: Minimum number of timed rounds
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Return value of the last call
+        """
+        result = func(*args, **kwargs)  # warm-up (imports, caches)
+        times = []
+        deadline = time.perf_counter() + self.min_time
+        # Like timeit, keep garbage collection out of the timed rounds
+        gc.collect()
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            reference = _reference_time()
+            while len(times) < min_rounds or time.perf_counter() < deadline:
+                start = time.perf_counter()
+                result = func(*args, **kwargs)
+                times.append(time.perf_counter() - start)
+            reference = min(reference, _reference_time())
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+        self.stats = {
+            "median": statistics.median(times),
+            "min": min(times),
+            "rounds": len(times),
+            "relative": min(times) / reference,
+        }
+        _results[self.name] = self.stats
+
+        if self.compare and self.baseline:
+            ratio = self.stats["relative"] / self.baseline["relative"]
+            if ratio > self.threshold:
+                pytest.fail(
+                    f"{self.name}: {ratio:.2f}x slower than baseline relative to the "
+                    f"reference workload ({self.stats['min'] * 1000:.3f} ms vs "
+                    f"{self.baseline['min'] * 1000:.3f} ms), threshold {self.threshold}x",
+                    pytrace=False
+                )
+        return result
+
+
+@pytest.fixture
+def bench(request) -> Bench:
+    """Benchmark fixture: ``result = bench(func, *args)``."""
+    name = request.node.nodeid.split("::", 1)[-1]
+    return Bench(f"{Path(request.node.fspath).stem}::{name}", request.config)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    config = session.config
+    if not _results or not config.getoption("--bench-save"):
+        return
+    path = config.getoption("--bench-baseline")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    baseline = _load_baseline(path)
+    baseline.update(_results)
+    path.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    if not _results:
+        return
+    baseline = _load_baseline(config.getoption("--bench-baseline"))
+    terminalreporter.section("benchmarks")
+    terminalreporter.write_line(f"{'benchmark':<72}{'median ms':>12}{'min ms':>12}{'rounds':>8}{'vs base':>9}")
+    for name, stats in sorted(_results.items()):
+        base = baseline.get(name)
+        ratio = f"{stats['relative'] / base['relative']:.2f}x" if base and not config.getoption("--bench-save") else "-"
+        terminalreporter.write_line(
+            f"{name:<72}{stats['median'] * 1000:>12.3f}{stats['min'] * 1000:>12.3f}"
+            f"{int(stats['rounds']):>8}{ratio:>9}"
+        )
+    if config.getoption("--bench-save"):
+        terminalreporter.write_line(f"baseline saved to {config.getoption('--bench-baseline')}")
@@ -0,0 +1,108 @@
+"""Synthetic lattice fixtures derived from templates/lattice_setting/*.yml.
+
+The shipped lattice definitions are small (8-30 spheres, a handful of
+sweep values). Benchmarks scale them up in the two directions that matter
+for the pipeline:
+
+- supercell(): tile the unit cell n x n x n, merging spheres and beams on
+  shared faces, for geometry/render/validation cost at growing sizes
+- with_sweep_size(): replace the sweeps with two sweeps whose product is
+  about n parameter sets, for expansion and generation throughput
+"""
+
+from pathlib import Path
+from typing import Dict, Tuple
+
+import numpy as np
+
+from src.data.models.custom_lattice import Beam, CustomLatticeJob, ParametricSweep, Sphere
+from src.parsers import load_custom_lattice_yaml
+
+TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
+LATTICE_DIR = TEMPLATES_DIR / "lattice_setting"
+
+
+def load_lattice(name: str) -> CustomLatticeJob:
+    """Load a lattice definition from templates/lattice_setting.
+
+    Args:
+        name: File name without extension, e.g. 'simple_cubic'
+
+    Returns:
+        CustomLatticeJob
+    """
+    return load_custom_lattice_yaml(LATTICE_DIR / f"{name}.yml", strict=False)
+
+
+def supercell(job: CustomLatticeJob, n: int) -> CustomLatticeJob:
+    """Tile the unit cell n times along each axis.
+
+    Spheres at the same position (shared faces, edges and corners) are
+    merged and beams between the same spheres are deduplicated, so the
+    result is a valid lattice of the same type.
+
+    Args:
+        job: Lattice to tile
+        n: Repetitions per axis (1 returns a copy)
+
+    Returns:
+        New CustomLatticeJob with about n**3 times the spheres and beams
+    """
+    cell = np.asarray(job.job.unit_cell_size, dtype=float)
+    spheres: Dict[Tuple[float, ...], Sphere] = {}
+    beams: Dict[Tuple[int, int], Beam] = {}
+
+    for offset in np.ndindex(n, n, n):
+        shift = cell * np.asarray(offset)
+        new_ids = {}
+        for sphere in job.geometry.spheres:
+            position = [float(x) for x in np.round(np.asarray(sphere.position) + shift, 9)]
+            key = tuple(position)
+            if key not in spheres:
+                spheres[key] = sphere.model_copy(update={'id': len(spheres) + 1, 'position': position})
+            new_ids[sphere.id] = spheres[key].id
+        for beam in job.geometry.beams:
+            a, b = (new_ids[e] for e in beam.endpoints)
+            key = (min(a, b), max(a, b))
+            if key not in beams:
+                beams[key] = beam.model_copy(update={'id': len(beams) + 1, 'endpoints': [a, b]})
+
+    tiled = job.model_copy(deep=True)
+    tiled.job.unit_cell_size = [float(x) for x in cell * n]
+    tiled.geometry.spheres = list(spheres.values())
+    tiled.geometry.beams = list(beams.values())
+    return tiled
+
+
+def with_sweep_size(job: CustomLatticeJob, num_sets: int) -> CustomLatticeJob:
+    """Replace the sweeps with a sphere x beam grid of about num_sets sets.
+
+    Values stay close to the lattice defaults so that generated geometries
+    remain valid.
+
+    Args:
+        job: Lattice definition
+        num_sets: Target number of parameter sets
+
+    Returns:
+        New CustomLatticeJob (constraints and sampling removed)
+    """
+    radius = job.job.parametric.default.get('sphere.radius', 1.0)
+    thickness = job.job.parametric.default.get('beam.thickness', 0.5)
+    num_radii = max(int(np.sqrt(num_sets)), 1)
+    num_thicknesses = max(num_sets // num_radii, 1)
+
+    swept = job.model_copy(deep=True)
+    swept.job.parametric.sampling = None
+    swept.job.parametric.constraints = []
+    swept.job.parametric.sweeps = [
+        ParametricSweep(
+            parameter='sphere.radius',
+            values=[float(v) for v in np.linspace(radius, radius * 1.2, num_radii)]
+        ),
+        ParametricSweep(
+            parameter='beam.thickness',
+            values=[float(v) for v in np.linspace(thickness * 0.8, thickness, num_thicknesses)]
+        ),
+    ]
+    return swept
@@ -0,0 +1,56 @@
+"""Benchmarks for geometry building and validation at growing sizes."""
+
+import pytest
+
+from src.data.models.custom_lattice import Beam, Geometry, Sphere
+from src.services.geometry_builder import GeometryBuilder
+from src.services.parametric_generator import ParametricGenerator
+from src.validators.geometry_validator import GeometryValidator
+from synthetic import load_lattice, supercell
+
+LATTICES = [
+    ('simple_cubic', 1), ('simple_cubic', 3),
+    ('fcc', 1), ('fcc', 2), ('fcc', 3),
+]
+
+
+def first_parameter_set(job):
+    """First parameter set of a lattice's sweep."""
+    return ParametricGenerator(job).generate_parameter_sets()[0]
+
+
+def resolved_geometry(geometry_data):
+    """Geometry with applied radii and thicknesses, as JobGenerator validates it."""
+    spheres = geometry_data.spheres
+    return Geometry(
+        lattice_constant=geometry_data.lattice_constant,
+        spheres=[Sphere(id=s.id, position=s.position, radius=s.radius, ratio=s.ratio) for s in spheres],
+        beams=[
+            Beam(
+                id=b.id,
+                endpoints=[spheres[b.endpoint1_index].id, spheres[b.endpoint2_index].id],
+                thickness=b.thickness,
+                ratio=b.ratio
+            ) for b in geometry_data.beams
+        ]
+    )
+
+
+@pytest.mark.parametrize("lattice,n", LATTICES)
+def test_build_geometry_data(bench, lattice, n):
+    """GeometryBuilder.build_geometry_data on an n x n x n supercell."""
+    job = supercell(load_lattice(lattice), n)
+    param_set = first_parameter_set(job)
+
+    geometry = bench(GeometryBuilder().build_geometry_data, job, param_set)
+    assert len(geometry.spheres) == len(job.geometry.spheres)
+
+
+@pytest.mark.parametrize("lattice,n", LATTICES)
+def test_validate_geometry(bench, lattice, n):
+    """GeometryValidator.validate on an n x n x n supercell."""
+    job = supercell(load_lattice(lattice), n)
+    geometry = resolved_geometry(GeometryBuilder().build_geometry_data(job, first_parameter_set(job)))
+
+    result = bench(GeometryValidator().validate, geometry)
+    assert result.is_valid
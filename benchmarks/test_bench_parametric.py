@@ -0,0 +1,15 @@
+"""Benchmarks for parameter set expansion."""
+
+import pytest
+
+from src.services.parametric_generator import ParametricGenerator
+from synthetic import load_lattice, with_sweep_size
+
+
+@pytest.mark.parametrize("num_sets", [100, 1_000, 10_000, 100_000])
+def test_expand_parameter_sets(bench, num_sets):
+    """Expand a two-parameter sweep grid into ParameterSets."""
+    job = with_sweep_size(load_lattice('simple_cubic'), num_sets)
+
+    sets = bench(lambda: ParametricGenerator(job).generate_parameter_sets())
+    assert len(sets) >= num_sets * 0.99
@@ -0,0 +1,89 @@
+"""Benchmarks for end-to-end generation throughput and reading runs back."""
+
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from src.data.metadata_io import RUN_TABLE_FILENAME, load_run_metadata
+from src.services.job_generator import JobGenerator
+from src.services.parametric_generator import ParametricGenerator
+from src.services.run_manifest import read_manifest
+from synthetic import TEMPLATES_DIR, load_lattice, with_sweep_size
+
+# Generate on tmpfs when available so that disk speed does not dominate
+TMPFS = Path('/dev/shm')
+NUM_JOBS = 20
+NUM_READ_JOBS = 200
+
+
+@pytest.fixture(scope='module')
+def work_dir():
+    """Scratch directory on tmpfs (falls back to the default temp dir)."""
+    base = TMPFS if TMPFS.is_dir() else None
+    path = Path(tempfile.mkdtemp(prefix='bench_pipeline_', dir=base))
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def make_generator(output_dir, metadata_format='yaml', run_table=False):
+    """JobGenerator with the default (certified) validation path."""
+    return JobGenerator(
+        template_dir=TEMPLATES_DIR,
+        output_base_dir=output_dir,
+        metadata_format=metadata_format,
+        metadata_run_table=run_table,
+        record_events=False,
+        profile=False
+    )
+
+
+@pytest.mark.parametrize("lattice", ['simple_cubic', 'fcc'])
+@pytest.mark.parametrize("metadata_format", ['yaml', 'json'])
+def test_generate_parametric_study_jobs(bench, work_dir, lattice, metadata_format):
+    """Generate NUM_JOBS jobs per round (one run per round)."""
+    job = with_sweep_size(load_lattice(lattice), NUM_JOBS)
+    param_sets = ParametricGenerator(job).generate_parameter_sets()[:NUM_JOBS]
+    generator = make_generator(work_dir / f"{lattice}_{metadata_format}", metadata_format)
+
+    result = bench(
+        generator.generate_parametric_study_jobs,
+        job,
+        param_sets=param_sets,
+        keep_job_results=False
+    )
+    assert result['total_jobs'] == len(param_sets)
+
+
+@pytest.fixture(scope='module')
+def generated_run(work_dir):
+    """A run of NUM_READ_JOBS jobs with sidecars and a Parquet run table."""
+    job = with_sweep_size(load_lattice('simple_cubic'), NUM_READ_JOBS)
+    generator = make_generator(work_dir / 'read', metadata_format='json', run_table=True)
+    result = generator.generate_parametric_study_jobs(job, run_id='run_read', keep_job_results=False)
+    return result['run_dir'], result['total_jobs']
+
+
+def test_read_manifest(bench, generated_run):
+    """Stream the job records of a run manifest."""
+    run_dir, total_jobs = generated_run
+    records = bench(lambda: list(read_manifest(run_dir, 'job')))
+    assert len(records) == total_jobs
+
+
+def test_load_run_metadata_sidecars(bench, generated_run, tmp_path):
+    """Load job metadata from per-job sidecar files."""
+    source_dir, total_jobs = generated_run
+    run_dir = tmp_path / 'run_sidecars'
+    shutil.copytree(source_dir, run_dir, ignore=shutil.ignore_patterns(RUN_TABLE_FILENAME))
+
+    df = bench(load_run_metadata, run_dir)
+    assert len(df) == total_jobs
+
+
+def test_load_run_metadata_parquet(bench, generated_run):
+    """Load job metadata from the run-level Parquet table."""
+    run_dir, total_jobs = generated_run
+    df = bench(load_run_metadata, run_dir)
+    assert len(df) == total_jobs
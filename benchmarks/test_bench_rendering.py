@@ -0,0 +1,44 @@
+"""Benchmarks for custom lattice rendering and Java validation."""
+
+import pytest
+
+from src.services.job_generator import JobGenerator
+from src.services.parametric_generator import ParametricGenerator
+from src.validators.template_validator import validate_generated_java
+from synthetic import TEMPLATES_DIR, load_lattice, supercell
+
+SIZES = [('simple_cubic', 1), ('fcc', 1), ('fcc', 2), ('fcc', 3)]
+
+
+@pytest.fixture
+def generator(tmp_path):
+    """JobGenerator validating every job in full (no certification)."""
+    return JobGenerator(
+        template_dir=TEMPLATES_DIR,
+        output_base_dir=tmp_path,
+        certify_templates=False,
+        record_events=False,
+        profile=False
+    )
+
+
+@pytest.mark.parametrize("lattice,n", SIZES)
+def test_render_custom_lattice_java(bench, generator, tmp_path, lattice, n):
+    """Geometry, render, full Java validation and write for one job."""
+    job = supercell(load_lattice(lattice), n)
+    param_set = ParametricGenerator(job).generate_parameter_sets()[0]
+
+    java_file, _ = bench(generator._generate_custom_lattice_java, tmp_path, job, 'job_001', param_set)
+    assert java_file.stat().st_size > 0
+
+
+@pytest.mark.parametrize("lattice,n", SIZES)
+def test_validate_generated_java(bench, generator, tmp_path, lattice, n):
+    """validate_generated_java on the rendered Java of a supercell."""
+    job = supercell(load_lattice(lattice), n)
+    param_set = ParametricGenerator(job).generate_parameter_sets()[0]
+    java_file, _ = generator._generate_custom_lattice_java(tmp_path, job, 'job_001', param_set)
+    java_code = java_file.read_text(encoding='utf-8')
+
+    result = bench(validate_generated_java, java_code)
+    assert result.is_valid
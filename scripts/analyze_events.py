@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Summarize per-stage timings from run event logs (events.jsonl).
+
+Prints count, error count, p50/p95/max and total time of each stage
+(geometry build, validation, render, file writes, execution, ...),
+aggregated across all jobs of one or more runs. Stages are sorted by
+total time so the most expensive stage comes first.
+
+Usage:
+    python scripts/analyze_events.py jobs/comsol/run_xxx
+    python scripts/analyze_events.py jobs/comsol/run_a jobs/comsol/run_b --json
+"""
+
+import argparse
+import itertools
+import json
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.services.event_log import EVENT_STAGE, read_events, summarize_stages
+
+
+def main():
+    """Main entry point for CLI."""
+    parser = argparse.ArgumentParser(
+        description='Summarize per-stage p50/p95 timings of runs'
+    )
+    parser.add_argument(
+        'paths',
+        type=Path,
+        nargs='+',
+        help='events.jsonl files, or run directories containing one'
+    )
+    parser.add_argument(
+        '--json',
+        action='store_true',
+        help='Print the summary as JSON'
+    )
+
+    args = parser.parse_args()
+
+    for path in args.paths:
+        if not path.exists():
+            print(f"Error: Path not found: {path}")
+            return 1
+
+    events = itertools.chain.from_iterable(read_events(path, EVENT_STAGE) for path in args.paths)
+    summary = summarize_stages(events)
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return 0
+
+    if not summary:
+        print("No stage events found")
+        return 0
+
+    print(f"{'stage':<22}{'count':>7}{'errors':>8}{'p50 ms':>11}{'p95 ms':>11}{'max ms':>11}{'total s':>10}")
+    for name, stats in sorted(summary.items(), key=lambda item: -item[1]['total_ms']):
+        print(
+            f"{name:<22}{stats['count']:>7}{stats['errors']:>8}"
+            f"{stats['p50_ms']:>11.3f}{stats['p95_ms']:>11.3f}{stats['max_ms']:>11.3f}"
+            f"{stats['total_ms'] / 1000.0:>10.3f}"
+        )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
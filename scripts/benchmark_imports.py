@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Benchmark import (startup) time of CLI entry points.
+
+Runs each target in a fresh interpreter with ``python -X importtime`` and
+reports the total wall time plus the modules with the largest cumulative
+import time, so that regressions (a package __init__ importing pymatgen,
+a module loading config at import time, ...) are easy to spot.
+
+Usage:
+    python scripts/benchmark_imports.py
+    python scripts/benchmark_imports.py -m src.services.job_generator --top 20
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+DEFAULT_MODULES = [
+    'src.services.batch_executor',
+    'src.data.metadata_io',
+    'src.services.job_generator',
+]
+
+# Modules that CLI startup should not import
+HEAVY_MODULES = ['pymatgen', 'matplotlib', 'sqlalchemy', 'scipy', 'jinja2']
+
+
+def import_profile(module: str, repeat: int) -> Tuple[float, List[Tuple[int, str]], List[str]]:
+    """Import a module in fresh interpreters.
+
+    Args:
+        module: Module to import
+        repeat: Number of runs; the fastest wall time is reported
+
+    Returns:
+        Tuple of (best wall time in seconds, [(cumulative us, module)] from
+        the last run, heavy modules that were imported)
+    """
+    check = f"import sys, {module}; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', check],
+            cwd=project_root, capture_output=True, text=True, check=True
+        )
+        best = min(best, time.perf_counter() - start)
+
+    entries = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        entries.append((int(cumulative), name.strip()))
+    heavy = [m for m in proc.stdout.strip().split(',') if m]
+    return best, sorted(entries, reverse=True), heavy
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark module import time")
+    parser.add_argument('-m', '--module', action='append', help="Module to import (repeatable)")
+    parser.add_argument('--top', type=int, default=10, help="Slowest modules to list")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per module")
+    args = parser.parse_args()
+
+    for module in args.module or DEFAULT_MODULES:
+        wall, entries, heavy = import_profile(module, args.repeat)
+        print(f"\n{module}: {wall * 1000:.0f} ms (interpreter included)")
+        print(f"  heavy modules imported: {', '.join(heavy) or 'none'}")
+        for cumulative, name in entries[:args.top]:
+            print(f"  {cumulative / 1000:8.1f} ms  {name}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Benchmark template cold-start and per-job render cost.
+
+Measures:
+  - cold start without bytecode cache (compile templates from source)
+  - cold start with a warm bytecode cache (what a new process pays)
+  - template lookup: Environment.get_template vs JobGenerator.get_template
+  - per-job generation time for a parametric study
+
+Usage:
+    python scripts/benchmark_templates.py
+    python scripts/benchmark_templates.py -i templates/lattice_setting/mimetic_Cu.yml --jobs 50
+"""
+
+import argparse
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.config.loader import get_config_path_for_env, load_config
+from src.parsers import load_custom_lattice_yaml
+from src.services.job_generator import JobGenerator
+from src.services.parametric_generator import ParametricGenerator
+from src.services.template_cache import (
+    clear_template_environments,
+    get_template_environment,
+)
+
+TEMPLATES = ['custom_lattice.java.j2', 'run.bat.j2']
+
+
+def time_cold_start(template_dir: Path, jinja_config: dict, cache_dir, repeat: int) -> float:
+    """Average time to create an environment and compile all templates."""
+    total = 0.0
+    for _ in range(repeat):
+        clear_template_environments()
+        start = time.perf_counter()
+        env = get_template_environment(template_dir, jinja_config, cache_dir=cache_dir)
+        for name in TEMPLATES:
+            env.get_template(name)
+        total += time.perf_counter() - start
+    return total / repeat
+
+
+def time_lookup(lookup, repeat: int) -> float:
+    """Average time of one template lookup."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        lookup('custom_lattice.java.j2')
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    """Main entry point for CLI."""
+    parser = argparse.ArgumentParser(description='Benchmark template compile and render cost')
+    parser.add_argument(
+        '-i', '--input',
+        type=Path,
+        default=project_root / 'templates' / 'lattice_setting' / 'simple_cubic.yml',
+        help='Custom lattice YAML used for per-job rendering'
+    )
+    parser.add_argument('--jobs', type=int, default=20, help='Maximum number of jobs to generate')
+    parser.add_argument('--repeat', type=int, default=5, help='Repetitions for cold-start timings')
+    args = parser.parse_args()
+
+    template_dir = project_root / 'templates'
+    jinja_config = load_config(get_config_path_for_env('job_generator'))['jinja2']
+    work_dir = Path(tempfile.mkdtemp(prefix='bench_templates_'))
+    cache_dir = work_dir / 'bytecode'
+
+    try:
+        no_cache = time_cold_start(template_dir, jinja_config, None, args.repeat)
+
+        # Populate the bytecode cache once, then measure loading from it
+        time_cold_start(template_dir, jinja_config, cache_dir, 1)
+        warm_cache = time_cold_start(template_dir, jinja_config, cache_dir, args.repeat)
+
+        clear_template_environments()
+        generator = JobGenerator(
+            template_dir=template_dir,
+            output_base_dir=work_dir / 'jobs',
+            template_cache_dir=cache_dir
+        )
+        env_lookup = time_lookup(generator.jinja_env.get_template, 1000)
+        generator_lookup = time_lookup(generator.get_template, 1000)
+
+        custom_job = load_custom_lattice_yaml(args.input, strict=False)
+        param_sets = ParametricGenerator(custom_job).generate_parameter_sets()[:args.jobs]
+        start = time.perf_counter()
+        result = generator.generate_parametric_study_jobs(
+            custom_job,
+            run_id='bench',
+            param_sets=param_sets,
+            keep_job_results=False
+        )
+        per_job = (time.perf_counter() - start) / max(result['total_jobs'], 1)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    print("=" * 60)
+    print("Template Benchmark")
+    print("=" * 60)
+    print(f"Cold start, no bytecode cache:   {no_cache * 1000:10.2f} ms")
+    print(f"Cold start, warm bytecode cache: {warm_cache * 1000:10.2f} ms "
+          f"({no_cache / warm_cache:.1f}x faster)")
+    print(f"Environment.get_template:        {env_lookup * 1e6:10.2f} us/call")
+    print(f"JobGenerator.get_template:       {generator_lookup * 1e6:10.2f} us/call")
+    print(f"Per-job generation ({result['total_jobs']} jobs):   {per_job * 1000:10.2f} ms/job")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
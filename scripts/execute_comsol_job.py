@@ -7,13 +7,16 @@ and monitoring execution status.
 
 import sys
 from pathlib import Path
+from typing import Optional
 import argparse
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.services.batch_executor import BatchExecutor, BatchExecutionError
+from src.services.metrics import MetricsExporter, get_job_metrics
 from src.config.loader import setup_logging, get_logger
+from src.data.metadata_io import find_metadata_file
 
 # Setup logging
 setup_logging({
@@ -41,18 +44,19 @@ def verify_job_structure(job_dir: Path) -> bool:
         return False
     logger.info(f"  ✓ Found: run.bat")
 
-    # Either config.yml (standard lattice) or metadata.yml (custom lattice) is required
+    # Either config.yml (standard lattice) or metadata (custom lattice) is required
+    # Metadata may be stored as metadata.yml, metadata.json or metadata.msgpack
     has_config = (job_dir / 'config.yml').exists()
-    has_metadata = (job_dir / 'metadata.yml').exists()
+    metadata_file = find_metadata_file(job_dir)
 
-    if not (has_config or has_metadata):
-        logger.error(f"  ✗ Missing: config.yml or metadata.yml")
+    if not (has_config or metadata_file):
+        logger.error(f"  ✗ Missing: config.yml or metadata file")
         return False
 
     if has_config:
         logger.info(f"  ✓ Found: config.yml (standard lattice)")
-    if has_metadata:
-        logger.info(f"  ✓ Found: metadata.yml (custom lattice)")
+    if metadata_file:
+        logger.info(f"  ✓ Found: {metadata_file.name} (custom lattice)")
 
     missing_files = []
 
@@ -175,13 +179,15 @@ def check_execution_results(job_dir: Path) -> dict:
 
 
 def execute_single_job(job_dir: Path, timeout: int = 3600,
-                       check_comsol: bool = True) -> bool:
+                       check_comsol: bool = True,
+                       profile: Optional[bool] = None) -> bool:
     """Execute a single COMSOL job.
 
     Args:
         job_dir: Path to job directory
         timeout: Execution timeout in seconds
         check_comsol: Whether to check COMSOL availability first
+        profile: Profile the execution (default: ESP_PROFILE variable)
 
     Returns:
         True if execution succeeded, False otherwise
@@ -197,7 +203,7 @@ def execute_single_job(job_dir: Path, timeout: int = 3600,
         return False
 
     # Initialize executor
-    executor = BatchExecutor(timeout=timeout)
+    executor = BatchExecutor(timeout=timeout, profile=profile)
 
     # Check COMSOL availability
     if check_comsol:
@@ -335,6 +341,12 @@ Examples:
 
   # Execute most recent job
   python scripts/execute_comsol_job.py --latest
+
+  # Profile execution (artifacts in <run_dir>/profile/)
+  python scripts/execute_comsol_job.py -j jobs/comsol/run_20251130_120000 --profile
+
+  # Expose queue depth, running/finished jobs and runtimes to Prometheus
+  python scripts/execute_comsol_job.py -j jobs/comsol/run_20251130_120000 --metrics-port 9464
         """
     )
 
@@ -364,9 +376,37 @@ Examples:
         action='store_true',
         help='Skip COMSOL availability check'
     )
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Write cProfile stats and collapsed stacks to <run_dir>/profile/ '
+             '(also enabled by ESP_PROFILE=1)'
+    )
+    parser.add_argument(
+        '--metrics-port',
+        type=int,
+        default=None,
+        help='Serve Prometheus metrics at http://127.0.0.1:PORT/metrics while running'
+    )
+    parser.add_argument(
+        '--metrics-textfile',
+        type=Path,
+        default=None,
+        help='Write Prometheus metrics to this file every 15s and on exit '
+             '(e.g. for the node_exporter textfile collector)'
+    )
 
     args = parser.parse_args()
 
+    if args.metrics_port is not None or args.metrics_textfile is not None:
+        with MetricsExporter(port=args.metrics_port, textfile=args.metrics_textfile):
+            return run(args, parser)
+    return run(args, parser)
+
+
+def run(args: argparse.Namespace, parser: argparse.ArgumentParser) -> int:
+    """Run the command selected by the parsed arguments."""
+
     # Determine base directory
     project_root = Path(__file__).parent.parent
     jobs_base_dir = project_root / "jobs" / "comsol"
@@ -437,13 +477,16 @@ Examples:
 
         successes = 0
         failures = 0
+        metrics = get_job_metrics()
 
         for i, sub_job in enumerate(sub_jobs, 1):
+            metrics.jobs_queued.set(len(sub_jobs) - i)
             logger.info(f"\nExecuting job {i}/{len(sub_jobs)}: {sub_job.name}")
             success = execute_single_job(
                 job_dir=sub_job,
                 timeout=args.timeout,
-                check_comsol=not args.no_check_comsol
+                check_comsol=not args.no_check_comsol,
+                profile=args.profile or None
             )
 
             if success:
@@ -468,7 +511,8 @@ Examples:
         success = execute_single_job(
             job_dir=job_dir,
             timeout=args.timeout,
-            check_comsol=not args.no_check_comsol
+            check_comsol=not args.no_check_comsol,
+            profile=args.profile or None
         )
 
         return 0 if success else 1
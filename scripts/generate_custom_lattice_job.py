@@ -9,6 +9,7 @@ Usage:
     python scripts/generate_custom_lattice_job.py -i lattice.yml
     python scripts/generate_custom_lattice_job.py -i lattice.yml -o jobs/comsol
     python scripts/generate_custom_lattice_job.py -i lattice.yml --run-id my_run
+    python scripts/generate_custom_lattice_job.py -i lattice.yml --profile
 """
 
 import argparse
@@ -21,7 +22,9 @@ sys.path.insert(0, str(project_root))
 
 from src.parsers import load_custom_lattice_yaml, YAMLParseError
 from src.services.job_generator import JobGenerator
+from src.services.metrics import REGISTRY
 from src.services.parametric_generator import get_parameter_summary
+from src.utils.profiling import PROFILE_DIRNAME, profiling_enabled
 
 
 def main():
@@ -45,6 +48,9 @@ Examples:
 
   # Skip confirmation for batch generation
   python scripts/generate_custom_lattice_job.py -i my_lattice.yml -y
+
+  # Profile generation (artifacts in <run_dir>/profile/)
+  python scripts/generate_custom_lattice_job.py -i my_lattice.yml --profile
         """
     )
 
@@ -107,6 +113,35 @@ Examples:
         help='Do not save .mph files (saves disk space)'
     )
 
+    parser.add_argument(
+        '--metadata-format',
+        choices=['yaml', 'json', 'msgpack'],
+        default=None,
+        help='Metadata file format (default: metadata.format from config)'
+    )
+
+    parser.add_argument(
+        '--metadata-table',
+        action='store_true',
+        default=None,
+        help='Also write a run-level Parquet table of all job metadata'
+    )
+
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Write cProfile stats and collapsed stacks to <run_dir>/profile/ '
+             '(also enabled by ESP_PROFILE=1)'
+    )
+
+    parser.add_argument(
+        '--metrics-textfile',
+        type=Path,
+        default=None,
+        help='Write Prometheus metrics (jobs generated, generation time) to '
+             'this file when done, e.g. for the node_exporter textfile collector'
+    )
+
     args = parser.parse_args()
 
     # Print header
@@ -153,13 +188,22 @@ Examples:
     generator = ParametricGenerator(custom_job)
     sweep_info = generator.get_sweep_info()
 
-    if sweep_info['num_sweeps'] > 0:
+    if sweep_info['num_sweeps'] > 0 or 'sampling' in sweep_info:
         print("Parametric Study:")
         print(f"  Number of sweeps: {sweep_info['num_sweeps']}")
         print(f"  Total jobs to generate: {sweep_info['total_jobs']}")
+        if 'pruned_by_constraints' in sweep_info:
+            print(f"  Pruned by constraints: {sweep_info['pruned_by_constraints']} "
+                  f"of {sweep_info['total_combinations']} combinations")
         for i, dim in enumerate(sweep_info['sweep_dimensions'], 1):
+            linked = " linked" if dim.get('linked') else ""
             print(f"  Sweep {i}: {dim['parameter']} "
-                  f"({dim['num_values']} values)")
+                  f"({dim['num_values']}{linked} values)")
+        if 'sampling' in sweep_info:
+            sampling = sweep_info['sampling']
+            params = ', '.join(r['parameter'] for r in sampling['ranges'])
+            print(f"  Sampling: {sampling['method']} "
+                  f"({sampling['num_samples']} samples over {params})")
     else:
         print("Single job (no parametric sweeps)")
 
@@ -178,7 +222,10 @@ Examples:
             template_dir=args.template_dir,
             output_base_dir=args.output,
             num_cores=args.num_cores,
-            save_mph=not args.no_save_mph
+            save_mph=not args.no_save_mph,
+            metadata_format=args.metadata_format,
+            metadata_run_table=args.metadata_table,
+            profile=args.profile or None
         )
     except Exception as e:
         print(f"✗ Failed to initialize job generator:")
@@ -190,7 +237,8 @@ Examples:
     try:
         result = job_gen.generate_parametric_study_jobs(
             custom_job,
-            run_id=args.run_id
+            run_id=args.run_id,
+            keep_job_results=False
         )
     except Exception as e:
         print(f"✗ Job generation failed:")
@@ -213,7 +261,11 @@ Examples:
     print(f"  Save .mph files: {'No' if args.no_save_mph else 'Yes'}")
     if result.get('skipped_jobs', 0) > 0:
         print(f"  Jobs skipped: {result['skipped_jobs']}")
-        print(f"  (See {result['run_dir']}/metadata.yml for details)")
+        print(f"  (See {result['manifest']} for details)")
+    if profiling_enabled(args.profile or None):
+        print(f"  Profile: {result['run_dir'] / PROFILE_DIRNAME}")
+    if args.metrics_textfile is not None:
+        print(f"  Metrics: {REGISTRY.write_textfile(args.metrics_textfile)}")
     print()
 
     # Show next steps
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Inspect job/run metadata in any supported format.
+
+Metadata may be written as YAML, JSON or msgpack, and a run may also hold
+a jobs_metadata.parquet table. This script prints metadata as YAML for
+human inspection, or converts it to a YAML file next to the original.
+
+Usage:
+    python scripts/inspect_metadata.py jobs/comsol/run_xxx/job_001
+    python scripts/inspect_metadata.py jobs/comsol/run_xxx/metadata.json
+    python scripts/inspect_metadata.py jobs/comsol/run_xxx --table
+    python scripts/inspect_metadata.py jobs/comsol/run_xxx/job_001 --to-yaml
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import yaml
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.data.metadata_io import (
+    convert_metadata,
+    load_metadata,
+    load_run_metadata,
+)
+
+
+def main():
+    """Main entry point for CLI."""
+    parser = argparse.ArgumentParser(
+        description='Print job/run metadata as YAML (any stored format)'
+    )
+    parser.add_argument(
+        'path',
+        type=Path,
+        help='Metadata file, or job/run directory containing one'
+    )
+    parser.add_argument(
+        '--table',
+        action='store_true',
+        help='Load metadata of all jobs in a run directory as a table'
+    )
+    parser.add_argument(
+        '--to-yaml',
+        action='store_true',
+        help='Write a metadata.yml copy next to the original file'
+    )
+
+    args = parser.parse_args()
+
+    if not args.path.exists():
+        print(f"Error: Path not found: {args.path}")
+        return 1
+
+    if args.table:
+        df = load_run_metadata(args.path)
+        if df.empty:
+            print("No job metadata found")
+            return 1
+        print(df.to_string(index=False))
+        return 0
+
+    if args.to_yaml:
+        output_path = convert_metadata(args.path, fmt='yaml')
+        print(f"Wrote: {output_path}")
+        return 0
+
+    metadata = load_metadata(args.path)
+    print(yaml.dump(metadata, default_flow_style=False, allow_unicode=True))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,2 +1,2 @@
 # Makes the config package importable
-from .loader import load_config, setup_logging, get_logger
+from .loader import load_config, clear_config_cache, setup_logging, get_logger
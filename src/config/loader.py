@@ -1,18 +1,26 @@
 from __future__ import annotations
 
+import atexit
+import copy
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 import re
-from typing import Any, Dict, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 import yaml
 
 # Public API
 __all__ = [
     "load_config",
+    "clear_config_cache",
     "setup_logging",
+    "setup_worker_logging",
+    "shutdown_logging",
+    "get_log_queue",
     "get_logger",
     "get_config_path_for_env",
     "get_current_env",
@@ -29,9 +37,32 @@ _ENV_MAP = {
     "prod": "prod",
 }
 
+# Parsed configs: (resolved path, resolve_vars) -> (mtime_ns, size, config)
+_config_cache: Dict[Tuple[str, bool], Tuple[int, int, Dict[str, Any]]] = {}
+_config_cache_lock = threading.Lock()
+_dotenv_loaded = False
+
+# Queue logging state (see setup_logging: logging.queue)
+_log_queue: Any = None
+_queue_listener: Optional[QueueListener] = None
+_DROP_POLICIES = ("drop", "block")
+
 
 # ---- Environment utilities ----
 
+def _load_dotenv_once() -> None:
+    """Load .env (if python-dotenv is available) once per process."""
+    global _dotenv_loaded
+    if _dotenv_loaded:
+        return
+    _dotenv_loaded = True
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass
+
+
 def get_current_env() -> str:
     """Get the current environment from ENV variable.
 
@@ -51,13 +82,7 @@ def get_current_env() -> str:
     >>> get_current_env()
     'prod'
     """
-    # Try to load from .env file if python-dotenv is available
-    try:
-        from dotenv import load_dotenv
-        load_dotenv()
-    except ImportError:
-        pass
-
+    _load_dotenv_once()
     env_value = os.getenv("ENV", "development").lower()
     return _ENV_MAP.get(env_value, "dev")
 
@@ -135,6 +160,9 @@ def load_config(path: Union[str, os.PathLike], resolve_vars: bool = True) -> Dic
     - Supports simple placeholder interpolation like ${a.b.c} referencing other
       keys in the same config. Interpolation runs a few passes until stable.
     - Does not execute arbitrary code (safe_load).
+    - Parsed configs are cached per process, keyed by resolved path and the
+      file's mtime and size; an edited file is re-read on the next call.
+      Each call returns a deep copy, so callers may modify the result.
 
     Parameters
     ----------
@@ -148,13 +176,44 @@ def load_config(path: Union[str, os.PathLike], resolve_vars: bool = True) -> Dic
     dict
         Configuration dictionary.
     """
-    with open(path, "r", encoding="utf-8") as f:
+    resolved = Path(path).resolve()
+    stat = resolved.stat()
+    key = (str(resolved), resolve_vars)
+
+    with _config_cache_lock:
+        cached = _config_cache.get(key)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return copy.deepcopy(cached[2])
+
+    with open(resolved, "r", encoding="utf-8") as f:
         cfg: Dict[str, Any] = yaml.safe_load(f) or {}
 
     if resolve_vars:
         cfg = _resolve_placeholders(cfg)
 
-    return cfg
+    with _config_cache_lock:
+        _config_cache[key] = (stat.st_mtime_ns, stat.st_size, cfg)
+    return copy.deepcopy(cfg)
+
+
+def clear_config_cache(path: Optional[Union[str, os.PathLike]] = None) -> None:
+    """Drop cached configs so the next load_config re-reads the file.
+
+    Needed only when a file is replaced within the filesystem's mtime
+    resolution without changing size; edits are otherwise detected.
+
+    Parameters
+    ----------
+    path : str | Path, optional
+        Config file to invalidate. If None, the whole cache is cleared.
+    """
+    with _config_cache_lock:
+        if path is None:
+            _config_cache.clear()
+            return
+        resolved = str(Path(path).resolve())
+        for key in [k for k in _config_cache if k[0] == resolved]:
+            del _config_cache[key]
 
 
 def _resolve_placeholders(cfg: Dict[str, Any], max_passes: int = 3) -> Dict[str, Any]:
@@ -196,6 +255,40 @@ def _resolve_placeholders(cfg: Dict[str, Any], max_passes: int = 3) -> Dict[str,
 
 # ---- Logging setup ----
 
+class _BoundedQueueHandler(QueueHandler):
+    """QueueHandler that applies a policy when the queue is full.
+
+    With policy 'drop', records below WARNING are discarded (and counted in
+    ``dropped``) instead of blocking the logging thread; warnings and errors
+    always wait for room. With policy 'block', every record waits.
+    """
+
+    def __init__(self, log_queue: Any, drop_policy: str = "drop") -> None:
+        super().__init__(log_queue)
+        self.drop_policy = drop_policy
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if self.drop_policy == "drop" and record.levelno < logging.WARNING:
+                self.dropped += 1
+            else:
+                self.queue.put(record)
+
+
+def _stop_queue_listener() -> None:
+    """Flush queued records and stop the writer thread, if running."""
+    global _queue_listener, _log_queue
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+    _log_queue = None
+
+
 def setup_logging(cfg: Dict[str, Any] | None = None) -> logging.Logger:
     """
     Configure project logging using settings from config["logging"].
@@ -216,9 +309,21 @@ def setup_logging(cfg: Dict[str, Any] | None = None) -> logging.Logger:
           rotate: true
           max_bytes: 1048576
           backup_count: 5
+        queue:
+          enabled: false        # write records on a background thread
+          max_size: 10000       # bounded queue (0 = unbounded)
+          drop_policy: drop     # drop (records below WARNING) | block
+          multiprocess: false   # multiprocessing queue for worker processes
+
+    In queue mode the project logger only enqueues records; a QueueListener
+    thread owns the console/file handlers and does the I/O. Worker
+    processes pass get_log_queue() to setup_worker_logging() so that one
+    writer handles every process. Call shutdown_logging() to flush (it is
+    also registered with atexit).
 
     Returns the configured project logger.
     """
+    global _log_queue, _queue_listener
     log_cfg = (cfg or {}).get("logging", {}) if isinstance(cfg, dict) else {}
 
     def to_level(x: Any, default: int = logging.INFO) -> int:
@@ -234,23 +339,28 @@ def setup_logging(cfg: Dict[str, Any] | None = None) -> logging.Logger:
 
     console_cfg = log_cfg.get("console", {}) or {}
     file_cfg = log_cfg.get("file", {}) or {}
+    queue_cfg = log_cfg.get("queue", {}) or {}
 
     logger = logging.getLogger(_LOGGER_NAME)
     logger.setLevel(base_level)
     logger.propagate = False
 
     # Avoid duplicate handlers in repeated calls
+    _stop_queue_listener()
     if logger.handlers:
+        for handler in logger.handlers:
+            handler.close()
         logger.handlers.clear()
 
     formatter = logging.Formatter(fmt=fmt, datefmt=datefmt)
+    handlers = []
 
     # Console handler
     if console_cfg.get("enabled", True):
         ch = logging.StreamHandler()
         ch.setLevel(to_level(console_cfg.get("level", base_level)))
         ch.setFormatter(formatter)
-        logger.addHandler(ch)
+        handlers.append(ch)
 
     # File handler
     if file_cfg.get("enabled", True):
@@ -269,7 +379,27 @@ def setup_logging(cfg: Dict[str, Any] | None = None) -> logging.Logger:
             fh = logging.FileHandler(file_path)
         fh.setLevel(file_level)
         fh.setFormatter(formatter)
-        logger.addHandler(fh)
+        handlers.append(fh)
+
+    if queue_cfg.get("enabled", False):
+        drop_policy = str(queue_cfg.get("drop_policy", "drop"))
+        if drop_policy not in _DROP_POLICIES:
+            raise ValueError(
+                f"Invalid logging.queue.drop_policy: {drop_policy!r} "
+                f"(expected one of {_DROP_POLICIES})"
+            )
+        max_size = int(queue_cfg.get("max_size", 10_000))
+        if queue_cfg.get("multiprocess", False):
+            import multiprocessing
+            _log_queue = multiprocessing.Queue(max_size)
+        else:
+            _log_queue = queue.Queue(max_size)
+        _queue_listener = QueueListener(_log_queue, *handlers, respect_handler_level=True)
+        _queue_listener.start()
+        logger.addHandler(_BoundedQueueHandler(_log_queue, drop_policy))
+    else:
+        for handler in handlers:
+            logger.addHandler(handler)
 
     # Make root permissive so handlers decide, but don't add handlers to root
     logging.getLogger().setLevel(logging.WARNING)
@@ -278,6 +408,60 @@ def setup_logging(cfg: Dict[str, Any] | None = None) -> logging.Logger:
     return logger
 
 
+def setup_worker_logging(
+    log_queue: Any,
+    level: Union[int, str] = logging.INFO,
+    drop_policy: str = "drop"
+) -> logging.Logger:
+    """Configure logging in a worker process to forward records to a queue.
+
+    Use as a process pool initializer with the queue from get_log_queue()
+    of a parent configured with logging.queue.multiprocess: true::
+
+        ProcessPoolExecutor(initializer=setup_worker_logging,
+                            initargs=(get_log_queue(), "INFO"))
+
+    Parameters
+    ----------
+    log_queue : queue
+        Queue read by the parent's QueueListener.
+    level : int | str
+        Project logger level in the worker.
+    drop_policy : str
+        'drop' or 'block' (see setup_logging).
+
+    Returns
+    -------
+    logging.Logger
+        The project logger of the worker.
+    """
+    logger = logging.getLogger(_LOGGER_NAME)
+    logger.setLevel(level.upper() if isinstance(level, str) else level)
+    logger.propagate = False
+    for handler in logger.handlers:
+        handler.close()
+    logger.handlers.clear()
+    logger.addHandler(_BoundedQueueHandler(log_queue, drop_policy))
+    return logger
+
+
+def get_log_queue() -> Any:
+    """Queue of the running QueueListener, or None if queue mode is off."""
+    return _log_queue
+
+
+def shutdown_logging() -> None:
+    """Flush queued log records and stop the background writer."""
+    logger = logging.getLogger(_LOGGER_NAME)
+    _stop_queue_listener()
+    for handler in logger.handlers:
+        if isinstance(handler, QueueHandler):
+            logger.removeHandler(handler)
+
+
+atexit.register(_stop_queue_listener)
+
+
 def get_logger(name: str | None = None) -> logging.Logger:
     """Get the project logger or a named child logger."""
     base = logging.getLogger(_LOGGER_NAME)
@@ -1,30 +1,25 @@
-"""Data loading utilities for the project."""
+"""Data loading utilities for the project.
 
-# Re-export ELF loader (optional - only if elf module exists)
-try:
-	from .elf import (
-		ELFData,
-		find_elf_file,
-		load_elf,
-		load_elf_with_spacing,
-		elf_to_npz,
-		resample_grid_linear,
-		resample_elf,
-		resize_to_match,
-		interpolate_nd_linear,
+Exports are loaded lazily (PEP 562): the VASP loaders import pymatgen,
+which is only needed when they are used. Importing a lightweight module
+such as src.data.metadata_io does not import it.
+"""
+
+from importlib.util import find_spec
+from typing import TYPE_CHECKING
+
+from src.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+	from .vasp import (
+		VASPCalculation,
+		parse_poscar,
+		parse_kpoints,
+		parse_elastic_tensor,
+		load_vasp_calculation,
+		load_elastic_constants_csv,
+		analyze_kpoint_convergence,
 	)
-	_HAS_ELF = True
-except ImportError:
-	_HAS_ELF = False
-from .vasp import (
-	VASPCalculation,
-	parse_poscar,
-	parse_kpoints,
-	parse_elastic_tensor,
-	load_vasp_calculation,
-	load_elastic_constants_csv,
-	analyze_kpoint_convergence,
-)
 
 _base_all = [
 	"VASPCalculation",
@@ -48,8 +43,16 @@ _elf_all = [
 	"interpolate_nd_linear",
 ]
 
+# Re-export ELF loader (optional - only if elf module exists)
+_HAS_ELF = find_spec(f"{__name__}.elf") is not None
+
+_EXPORTS = {name: f"{__name__}.vasp" for name in _base_all}
+if _HAS_ELF:
+	_EXPORTS.update({name: f"{__name__}.elf" for name in _elf_all})
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
 if _HAS_ELF:
 	__all__ = _base_all + _elf_all
 else:
 	__all__ = _base_all
-
@@ -0,0 +1,158 @@
+"""Asyncio database access for the ESP project.
+
+AsyncDatabaseManager mirrors DatabaseManager for asyncio code such as a job
+supervisor that records state transitions while it waits on running jobs:
+database round trips are awaited instead of blocking the event loop. It
+takes the same DatabaseConfig (pool sizing, pre-ping, SQLite pragmas) and
+switches the URL to the asyncio driver (asyncpg for PostgreSQL, aiosqlite
+for SQLite).
+
+Requires SQLAlchemy's asyncio extra (greenlet) and the driver:
+``pip install "sqlalchemy[asyncio]" asyncpg aiosqlite``.
+"""
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from src.config.loader import get_logger
+from src.data.db import DatabaseConfig, DatabaseManager, set_sqlite_pragma
+from src.data.models.base import Base
+
+log = get_logger(__name__)
+
+
+class AsyncDatabaseManager:
+    """Manages asyncio database connections and sessions."""
+
+    def __init__(self, config: DatabaseConfig):
+        """
+        Initialize async database manager.
+
+        Args:
+            config: Database configuration (the URL may name the sync
+                driver; it is switched to the asyncio driver)
+        """
+        self.config = config
+        self.engine: Optional[AsyncEngine] = None
+        self.SessionLocal: Optional[async_sessionmaker] = None
+
+    def initialize(self) -> None:
+        """Initialize async database engine and session factory."""
+        if self.engine is not None:
+            log.warning("Async database already initialized")
+            return
+
+        url = self.config.async_database_url
+        log.info(f"Initializing async database connection: {DatabaseManager._mask_url(url)}")
+
+        self.engine = create_async_engine(url, **self.config.create_async_engine_config())
+
+        # Same SQLite pragmas as the sync engine (listeners go on the sync engine)
+        if self.config.is_sqlite:
+            event.listen(self.engine.sync_engine, "connect", set_sqlite_pragma)
+
+        # expire_on_commit=False: attributes stay readable after commit
+        # without an implicit (blocking) refresh
+        self.SessionLocal = async_sessionmaker(
+            bind=self.engine,
+            autoflush=False,
+            expire_on_commit=False
+        )
+
+        log.info("Async database initialized successfully")
+
+    async def create_tables(self) -> None:
+        """Create all tables defined in models."""
+        if self.engine is None:
+            raise RuntimeError("Database not initialized. Call initialize() first.")
+
+        log.info("Creating database tables...")
+        async with self.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        log.info("Tables created successfully")
+
+    async def drop_tables(self) -> None:
+        """Drop all tables. Use with caution!"""
+        if self.engine is None:
+            raise RuntimeError("Database not initialized. Call initialize() first.")
+
+        log.warning("Dropping all database tables...")
+        async with self.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+        log.info("Tables dropped")
+
+    def get_session(self) -> AsyncSession:
+        """
+        Get a new async database session.
+
+        Returns:
+            SQLAlchemy AsyncSession
+
+        Note:
+            Caller is responsible for closing the session (await session.close()).
+        """
+        if self.SessionLocal is None:
+            raise RuntimeError("Database not initialized. Call initialize() first.")
+
+        return self.SessionLocal()
+
+    @asynccontextmanager
+    async def session_scope(self) -> AsyncIterator[AsyncSession]:
+        """
+        Provide a transactional scope around a series of async operations.
+
+        Yields:
+            SQLAlchemy AsyncSession
+
+        Example:
+            async with db_manager.session_scope() as session:
+                job.status = 'running'
+                session.add(job)
+                # Automatically commits on success, rolls back on exception
+        """
+        session = self.get_session()
+        try:
+            yield session
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            log.error(f"Database transaction failed: {e}")
+            raise
+        finally:
+            await session.close()
+
+    async def close(self) -> None:
+        """Close database connections and dispose engine."""
+        if self.engine is not None:
+            log.info("Closing async database connections...")
+            await self.engine.dispose()
+            self.engine = None
+            self.SessionLocal = None
+            log.info("Async database connections closed")
+
+
+async def init_async_db(
+    database_url: Optional[str] = None,
+    create_tables: bool = True
+) -> AsyncDatabaseManager:
+    """
+    Initialize async database with optional table creation.
+
+    Args:
+        database_url: Database connection URL (sync or async driver)
+        create_tables: Whether to create tables (default: True)
+
+    Returns:
+        AsyncDatabaseManager instance
+    """
+    config = DatabaseConfig(database_url=database_url)
+    db_manager = AsyncDatabaseManager(config)
+    db_manager.initialize()
+
+    if create_tables:
+        await db_manager.create_tables()
+
+    return db_manager
@@ -1,18 +1,128 @@
 """Database connection and session management for the ESP project."""
 
+import datetime
+import io
+import json
 import os
-from typing import Optional, Generator
+from itertools import islice
+from typing import Any, Dict, Generator, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
 from contextlib import contextmanager
-from sqlalchemy import create_engine, event
-from sqlalchemy.engine import Engine
+from sqlalchemy import Table, create_engine, event, insert
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import NullPool, QueuePool
 
 from src.config.loader import get_logger
 from src.data.models.base import Base
+# Import table modules so that every table is registered on Base
+from src.data.models import comsol, material, vasp  # noqa: F401
 
 log = get_logger(__name__)
 
+# Table or ORM model class accepted by the bulk write helpers
+TableLike = Union[Table, type]
+
+BULK_METHODS = ('insert', 'copy')
+
+
+def _resolve_table(table: TableLike) -> Table:
+    """Core Table of an ORM model class (or the Table itself)."""
+    resolved = getattr(table, '__table__', table)
+    if not isinstance(resolved, Table):
+        raise TypeError(f"Expected a Table or mapped model class, got {table!r}")
+    return resolved
+
+
+# Async drivers used by src.data.async_db for each sync URL scheme
+ASYNC_DRIVERS = {
+    'sqlite': 'sqlite+aiosqlite',
+    'postgresql': 'postgresql+asyncpg',
+    'postgres': 'postgresql+asyncpg',
+}
+
+
+def set_sqlite_pragma(dbapi_conn, connection_record) -> None:
+    """Enable foreign keys and WAL journaling on a new SQLite connection."""
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.close()
+
+
+def _copy_field(value: Any) -> str:
+    """One field of PostgreSQL CSV COPY input.
+
+    NULL is an unquoted empty field; every other value except numbers is
+    quoted, so an empty string stays an empty string. Mappings and lists
+    are written as JSON (for JSON/JSONB columns).
+    """
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, (Mapping, list, tuple)):
+        value = json.dumps(value)
+    elif isinstance(value, (datetime.date, datetime.time)):
+        value = value.isoformat()
+    else:
+        value = str(value)
+    return '"' + value.replace('"', '""') + '"'
+
+
+class _RowContext:
+    """Stand-in execution context for column defaults evaluated outside SQLAlchemy."""
+
+    def __init__(self, row: Mapping[str, Any]):
+        self.row = row
+
+    def get_current_parameters(self, isolate_multiinsert_groups: bool = True) -> Mapping[str, Any]:
+        return self.row
+
+
+def copy_csv_payload(table: Table, batch: List[Mapping[str, Any]]) -> Tuple[List[str], str]:
+    """
+    Columns and CSV text for COPY ... FROM STDIN WITH (FORMAT csv).
+
+    COPY bypasses SQLAlchemy, so client-side column defaults (e.g.
+    created_at, or ComsolJob.parameter_hash computed from the row) missing
+    from the rows are applied here.
+
+    Args:
+        table: Target table
+        batch: Rows with the same keys
+
+    Returns:
+        Tuple of (column names, CSV payload)
+    """
+    defaults = {
+        column.name: column.default for column in table.columns
+        if column.default is not None and column.name not in batch[0]
+        and (column.default.is_scalar or column.default.is_callable)
+    }
+    columns = list(batch[0]) + list(defaults)
+
+    lines = []
+    for row in batch:
+        values = [row[name] for name in batch[0]]
+        for default in defaults.values():
+            values.append(default.arg if default.is_scalar else default.arg(_RowContext(row)))
+        lines.append(','.join(_copy_field(value) for value in values) + '\n')
+    return columns, ''.join(lines)
+
+
+def _batches(rows: Iterable[Mapping[str, Any]], size: int) -> Iterator[List[Mapping[str, Any]]]:
+    """Split rows into lists of at most size rows without materializing them."""
+    if size < 1:
+        raise ValueError(f"Batch size must be positive, got {size}")
+    iterator = iter(rows)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
 
 class DatabaseConfig:
     """Database configuration manager."""
@@ -24,6 +134,7 @@ class DatabaseConfig:
         max_overflow: int = 10,
         pool_timeout: int = 30,
         echo: bool = False,
+        bulk_batch_size: int = 1000,
     ):
         """
         Initialize database configuration.
@@ -34,6 +145,8 @@ class DatabaseConfig:
             max_overflow: Maximum overflow connections (default: 10)
             pool_timeout: Connection timeout in seconds (default: 30)
             echo: Echo SQL statements (default: False)
+            bulk_batch_size: Rows per statement for bulk_insert() and
+                upsert() (default: 1000)
         """
         self.database_url = database_url or os.getenv('DATABASE_URL')
         if not self.database_url:
@@ -46,9 +159,11 @@ class DatabaseConfig:
         self.max_overflow = max_overflow
         self.pool_timeout = pool_timeout
         self.echo = echo
+        self.bulk_batch_size = bulk_batch_size
 
         # Detect database type
         self.is_sqlite = self.database_url.startswith('sqlite')
+        self.is_postgresql = self.database_url.startswith('postgres')
 
     def create_engine_config(self) -> dict:
         """Create engine configuration based on database type."""
@@ -71,6 +186,36 @@ class DatabaseConfig:
 
         return config
 
+    @property
+    def async_database_url(self) -> str:
+        """
+        Database URL with the matching asyncio driver.
+
+        sqlite:// becomes sqlite+aiosqlite:// and postgresql:// (or
+        postgresql+psycopg2://) becomes postgresql+asyncpg://. URLs that
+        already name another driver are returned unchanged.
+        """
+        scheme, separator, rest = self.database_url.partition('://')
+        dialect, _, driver = scheme.partition('+')
+        if dialect in ASYNC_DRIVERS and driver in ('', 'psycopg2', 'pysqlite'):
+            return f"{ASYNC_DRIVERS[dialect]}{separator}{rest}"
+        return self.database_url
+
+    def create_async_engine_config(self) -> dict:
+        """Create async engine configuration based on database type."""
+        config = {'echo': self.echo}
+
+        if self.is_sqlite:
+            config['poolclass'] = NullPool  # Disable pooling for SQLite
+        else:
+            # The async engine uses AsyncAdaptedQueuePool by default
+            config['pool_size'] = self.pool_size
+            config['max_overflow'] = self.max_overflow
+            config['pool_timeout'] = self.pool_timeout
+            config['pool_pre_ping'] = True  # Verify connections before using
+
+        return config
+
 
 class DatabaseManager:
     """Manages database connections and sessions."""
@@ -99,12 +244,7 @@ class DatabaseManager:
 
         # Add SQLite specific optimizations
         if self.config.is_sqlite:
-            @event.listens_for(self.engine, "connect")
-            def set_sqlite_pragma(dbapi_conn, connection_record):
-                cursor = dbapi_conn.cursor()
-                cursor.execute("PRAGMA foreign_keys=ON")
-                cursor.execute("PRAGMA journal_mode=WAL")
-                cursor.close()
+            event.listen(self.engine, "connect", set_sqlite_pragma)
 
         self.SessionLocal = sessionmaker(
             autocommit=False,
@@ -171,6 +311,176 @@ class DatabaseManager:
         finally:
             session.close()
 
+    def bulk_insert(
+        self,
+        table: TableLike,
+        rows: Iterable[Mapping[str, Any]],
+        batch_size: Optional[int] = None,
+        method: str = 'insert',
+    ) -> int:
+        """
+        Insert many rows in one transaction, bypassing the ORM unit of work.
+
+        Rows are consumed in batches of batch_size, so a generator of any
+        length is inserted with bounded memory. Each batch is one Core
+        INSERT executed as executemany, which SQLAlchemy sends as
+        multi-row VALUES statements. All rows of a batch must have the same
+        keys; column defaults (e.g. created_at) are applied.
+
+        Args:
+            table: Table or ORM model class (e.g. VASPResult)
+            rows: Row dictionaries keyed by column name
+            batch_size: Rows per statement (default: config.bulk_batch_size)
+            method: 'insert' (any database) or 'copy' (PostgreSQL COPY FROM
+                STDIN via psycopg2/psycopg; fastest for large backfills)
+
+        Returns:
+            Number of rows inserted
+
+        Raises:
+            ValueError: If method is unknown or 'copy' is used on a database
+                other than PostgreSQL
+
+        Example:
+            n = db_manager.bulk_insert(VASPResult, (parse(d) for d in dirs))
+        """
+        if method not in BULK_METHODS:
+            raise ValueError(f"Unknown bulk insert method '{method}'. Use one of {BULK_METHODS}")
+        if method == 'copy' and not self.config.is_postgresql:
+            raise ValueError("COPY is only available for PostgreSQL")
+
+        table = _resolve_table(table)
+        batch_size = batch_size or self.config.bulk_batch_size
+        count = 0
+        with self._begin() as conn:
+            for batch in _batches(rows, batch_size):
+                if method == 'copy':
+                    self._copy_batch(conn, table, batch)
+                else:
+                    conn.execute(insert(table), batch)
+                count += len(batch)
+        log.info(f"Bulk inserted {count} rows into {table.name} ({method})")
+        return count
+
+    def upsert(
+        self,
+        table: TableLike,
+        rows: Iterable[Mapping[str, Any]],
+        conflict_columns: Optional[Sequence[str]] = None,
+        update_columns: Optional[Sequence[str]] = None,
+        batch_size: Optional[int] = None,
+    ) -> int:
+        """
+        Insert rows, updating existing rows on conflict (idempotent writes).
+
+        Uses INSERT ... ON CONFLICT DO UPDATE (PostgreSQL and SQLite), so
+        re-running an ingestion updates rows instead of duplicating them or
+        failing. Rows are written in batches of batch_size in one
+        transaction.
+
+        Args:
+            table: Table or ORM model class
+            rows: Row dictionaries keyed by column name
+            conflict_columns: Columns of a primary key or unique constraint
+                identifying a row (default: the primary key)
+            update_columns: Columns overwritten on conflict (default: every
+                column of the first row except the conflict columns, plus
+                columns with an onupdate such as updated_at and columns
+                derived from updated ones, such as ComsolJob.parameter_hash).
+                An empty list inserts new rows and leaves existing rows
+                unchanged
+            batch_size: Rows per statement (default: config.bulk_batch_size)
+
+        Returns:
+            Number of rows inserted or updated
+
+        Raises:
+            ValueError: If the database does not support ON CONFLICT
+
+        Example:
+            db_manager.upsert(ComsolJob, records, conflict_columns=['comsol_run_id', 'job_id'])
+        """
+        if self.config.is_postgresql:
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        elif self.config.is_sqlite:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        else:
+            raise ValueError("Upsert is only supported for PostgreSQL and SQLite")
+
+        table = _resolve_table(table)
+        if conflict_columns is None:
+            conflict_columns = [column.name for column in table.primary_key.columns]
+        batch_size = batch_size or self.config.bulk_batch_size
+
+        count = 0
+        statement = None
+        with self._begin() as conn:
+            for batch in _batches(rows, batch_size):
+                if statement is None:
+                    statement = self._upsert_statement(
+                        dialect_insert(table), batch[0], conflict_columns, update_columns
+                    )
+                conn.execute(statement, batch)
+                count += len(batch)
+        log.info(f"Upserted {count} rows into {table.name}")
+        return count
+
+    @staticmethod
+    def _upsert_statement(
+        statement,
+        first_row: Mapping[str, Any],
+        conflict_columns: Sequence[str],
+        update_columns: Optional[Sequence[str]],
+    ):
+        """Add the ON CONFLICT clause to a dialect-specific INSERT."""
+        if update_columns is None:
+            update_columns = [name for name in first_row if name not in conflict_columns]
+            update_columns += [
+                column.name for column in statement.table.columns
+                if (column.onupdate is not None
+                    or set(column.info.get('derived_from', ())) & set(update_columns))
+                and column.name not in update_columns
+                and column.name not in conflict_columns
+            ]
+        if not update_columns:
+            return statement.on_conflict_do_nothing(index_elements=list(conflict_columns))
+
+        set_: Dict[str, Any] = {name: statement.excluded[name] for name in update_columns}
+        return statement.on_conflict_do_update(index_elements=list(conflict_columns), set_=set_)
+
+    def _copy_batch(self, conn: Connection, table: Table, batch: List[Mapping[str, Any]]) -> None:
+        """Write a batch with PostgreSQL COPY FROM STDIN (CSV)."""
+        columns, payload = copy_csv_payload(table, batch)
+        buffer = io.StringIO(payload)
+
+        preparer = conn.dialect.identifier_preparer
+        sql = (
+            f"COPY {preparer.format_table(table)} "
+            f"({', '.join(preparer.quote(name) for name in columns)}) "
+            f"FROM STDIN WITH (FORMAT csv)"
+        )
+        dbapi_conn = conn.connection.driver_connection
+        with dbapi_conn.cursor() as cursor:
+            if hasattr(cursor, 'copy_expert'):  # psycopg2
+                cursor.copy_expert(sql, buffer)
+            elif hasattr(cursor, 'copy'):  # psycopg 3
+                with cursor.copy(sql) as copy:
+                    copy.write(payload)
+            else:
+                raise ValueError(f"COPY is not supported by the {conn.dialect.driver} driver")
+
+    @contextmanager
+    def _begin(self) -> Generator[Connection, None, None]:
+        """Connection with a transaction committed on success."""
+        if self.engine is None:
+            raise RuntimeError("Database not initialized. Call initialize() first.")
+        try:
+            with self.engine.begin() as conn:
+                yield conn
+        except Exception as e:
+            log.error(f"Bulk write failed: {e}")
+            raise
+
     def close(self) -> None:
         """Close database connections and dispose engine."""
         if self.engine is not None:
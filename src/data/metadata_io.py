@@ -0,0 +1,312 @@
+"""Reading and writing of job/run metadata sidecar files.
+
+Job and run metadata can be stored as YAML (human readable), JSON (via
+``orjson`` when available) or msgpack. In addition, a run can store all of
+its job metadata as a single Parquet table so that a whole campaign is
+loaded with one file read. Loaders detect the format from the file suffix.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import yaml
+
+from src.config.loader import get_logger
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+
+_logger = get_logger("data.metadata_io")
+
+# Supported per-file formats and their suffixes
+METADATA_FORMATS = {
+    'yaml': '.yml',
+    'json': '.json',
+    'msgpack': '.msgpack',
+}
+
+_SUFFIX_TO_FORMAT = {
+    '.yml': 'yaml',
+    '.yaml': 'yaml',
+    '.json': 'json',
+    '.msgpack': 'msgpack',
+}
+
+# Run-level table holding one metadata row per job
+RUN_TABLE_FILENAME = "jobs_metadata.parquet"
+
+
+def _require_msgpack():
+    """Import msgpack or raise an informative error."""
+    try:
+        import msgpack
+    except ImportError as e:
+        raise ImportError(
+            "msgpack is required for the 'msgpack' metadata format. "
+            "Install msgpack."
+        ) from e
+    return msgpack
+
+
+def check_metadata_format(fmt: str) -> str:
+    """Validate a metadata format name.
+
+    Args:
+        fmt: Format name ('yaml', 'json' or 'msgpack')
+
+    Returns:
+        Normalized (lower-case) format name
+
+    Raises:
+        ValueError: If the format is not supported
+    """
+    normalized = str(fmt).lower()
+    if normalized not in METADATA_FORMATS:
+        raise ValueError(
+            f"Unsupported metadata format '{fmt}'. "
+            f"Must be one of: {', '.join(METADATA_FORMATS)}"
+        )
+    if normalized == 'msgpack':
+        _require_msgpack()
+    return normalized
+
+
+def dump_metadata(metadata: Dict[str, Any], fmt: str = 'yaml') -> bytes:
+    """Serialize metadata to bytes in the given format.
+
+    Args:
+        metadata: Metadata dictionary
+        fmt: Format name ('yaml', 'json' or 'msgpack')
+
+    Returns:
+        Serialized metadata
+    """
+    fmt = check_metadata_format(fmt)
+
+    if fmt == 'json':
+        if _HAS_ORJSON:
+            return orjson.dumps(metadata, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(metadata, ensure_ascii=False).encode('utf-8')
+
+    if fmt == 'msgpack':
+        return _require_msgpack().packb(metadata, use_bin_type=True)
+
+    return yaml.dump(
+        metadata, default_flow_style=False, allow_unicode=True
+    ).encode('utf-8')
+
+
+def parse_metadata(data: bytes, fmt: str) -> Dict[str, Any]:
+    """Deserialize metadata bytes in the given format.
+
+    Args:
+        data: Serialized metadata
+        fmt: Format name ('yaml', 'json' or 'msgpack')
+
+    Returns:
+        Metadata dictionary
+    """
+    fmt = check_metadata_format(fmt)
+
+    if fmt == 'json':
+        return orjson.loads(data) if _HAS_ORJSON else json.loads(data)
+
+    if fmt == 'msgpack':
+        return _require_msgpack().unpackb(data, raw=False)
+
+    return yaml.safe_load(data) or {}
+
+
+def write_metadata(
+    directory: Path | str,
+    metadata: Dict[str, Any],
+    fmt: str = 'yaml',
+    stem: str = 'metadata'
+) -> Path:
+    """Write a metadata sidecar file into a directory.
+
+    Args:
+        directory: Job or run directory
+        metadata: Metadata dictionary
+        fmt: Format name ('yaml', 'json' or 'msgpack')
+        stem: File name without suffix (default: 'metadata')
+
+    Returns:
+        Path to the written file
+    """
+    fmt = check_metadata_format(fmt)
+    path = Path(directory) / f"{stem}{METADATA_FORMATS[fmt]}"
+    path.write_bytes(dump_metadata(metadata, fmt))
+    return path
+
+
+def find_metadata_file(
+    directory: Path | str,
+    stem: str = 'metadata'
+) -> Optional[Path]:
+    """Find the metadata sidecar in a directory, whatever its format.
+
+    Args:
+        directory: Job or run directory
+        stem: File name without suffix (default: 'metadata')
+
+    Returns:
+        Path to the metadata file, or None if no metadata file exists
+    """
+    directory = Path(directory)
+    for suffix in _SUFFIX_TO_FORMAT:
+        candidate = directory / f"{stem}{suffix}"
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def load_metadata(path: Path | str) -> Dict[str, Any]:
+    """Load a metadata file, detecting the format from its suffix.
+
+    Args:
+        path: Metadata file, or a directory containing one
+
+    Returns:
+        Metadata dictionary
+
+    Raises:
+        FileNotFoundError: If no metadata file is found
+        ValueError: If the file suffix is not a known metadata format
+    """
+    path = Path(path)
+    if path.is_dir():
+        found = find_metadata_file(path)
+        if found is None:
+            raise FileNotFoundError(f"No metadata file found in: {path}")
+        path = found
+
+    fmt = _SUFFIX_TO_FORMAT.get(path.suffix.lower())
+    if fmt is None:
+        raise ValueError(f"Unknown metadata file format: {path}")
+
+    return parse_metadata(path.read_bytes(), fmt)
+
+
+def convert_metadata(path: Path | str, fmt: str = 'yaml') -> Path:
+    """Convert a metadata file to another format next to the original.
+
+    Mainly used to get a YAML copy of binary metadata for inspection.
+
+    Args:
+        path: Metadata file, or a directory containing one
+        fmt: Target format (default: 'yaml')
+
+    Returns:
+        Path to the converted file
+    """
+    path = Path(path)
+    if path.is_dir():
+        found = find_metadata_file(path)
+        if found is None:
+            raise FileNotFoundError(f"No metadata file found in: {path}")
+        path = found
+
+    metadata = load_metadata(path)
+    return write_metadata(path.parent, metadata, fmt=fmt, stem=path.stem)
+
+
+def flatten_metadata(
+    metadata: Dict[str, Any],
+    sep: str = '.',
+    prefix: str = ''
+) -> Dict[str, Any]:
+    """Flatten nested metadata dictionaries into a single-level row.
+
+    Args:
+        metadata: Nested metadata dictionary
+        sep: Separator used to join nested keys
+        prefix: Prefix for the generated keys
+
+    Returns:
+        Flat dictionary suitable for one table row
+    """
+    row = {}
+    for key, value in metadata.items():
+        name = f"{prefix}{sep}{key}" if prefix else str(key)
+        if isinstance(value, dict):
+            row.update(flatten_metadata(value, sep=sep, prefix=name))
+        else:
+            row[name] = value
+    return row
+
+
+def write_metadata_table(
+    path: Path | str,
+    records: Iterable[Dict[str, Any]]
+) -> Path:
+    """Write job metadata records as a single Parquet table.
+
+    Args:
+        path: Output Parquet file
+        records: Metadata dictionaries, one per job
+
+    Returns:
+        Path to the written table
+    """
+    import pandas as pd
+
+    path = Path(path)
+    rows = [flatten_metadata(record) for record in records]
+    df = pd.DataFrame(rows)
+    df.to_parquet(path, index=False)
+
+    _logger.info(f"Wrote metadata table with {len(df)} rows: {path}")
+    return path
+
+
+def load_run_metadata(run_dir: Path | str) -> 'pd.DataFrame':
+    """Load metadata of all jobs in a run as a DataFrame.
+
+    Uses the run-level Parquet table when present (a single file read) and
+    falls back to reading each job's metadata sidecar otherwise.
+
+    Args:
+        run_dir: Run directory containing job_* subdirectories
+
+    Returns:
+        DataFrame with one flattened metadata row per job
+    """
+    import pandas as pd
+
+    run_dir = Path(run_dir)
+    table_path = run_dir / RUN_TABLE_FILENAME
+    if table_path.exists():
+        return pd.read_parquet(table_path)
+
+    rows: List[Dict[str, Any]] = []
+    for job_dir in sorted(d for d in run_dir.glob("job_*") if d.is_dir()):
+        metadata_file = find_metadata_file(job_dir)
+        if metadata_file is not None:
+            rows.append(flatten_metadata(load_metadata(metadata_file)))
+
+    _logger.debug(f"Loaded metadata of {len(rows)} jobs from sidecars in {run_dir}")
+    return pd.DataFrame(rows)
+
+
+__all__ = [
+    "METADATA_FORMATS",
+    "RUN_TABLE_FILENAME",
+    "check_metadata_format",
+    "dump_metadata",
+    "parse_metadata",
+    "write_metadata",
+    "find_metadata_file",
+    "load_metadata",
+    "convert_metadata",
+    "flatten_metadata",
+    "write_metadata_table",
+    "load_run_metadata",
+]
@@ -1,8 +1,35 @@
-"""Database models for the ESP project."""
+"""Database models for the ESP project.
 
-from .base import Base
-from .material import MaterialSystem
-from .vasp import VASPResult, ElasticConstants, MechanicalProperties
+Exports are loaded lazily (PEP 562) so that importing the pydantic job
+models (src.data.models.custom_lattice) does not import SQLAlchemy.
+src.data.db imports the table modules itself, so every table is
+registered on Base before create_all().
+"""
+
+from typing import TYPE_CHECKING
+
+from src.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .base import Base
+    from .comsol import ComsolExecution, ComsolJob, ComsolRun, StiffnessMatrix, parameter_hash
+    from .material import MaterialSystem
+    from .vasp import VASPResult, ElasticConstants, MechanicalProperties
+
+_EXPORTS = {
+    "Base": "src.data.models.base",
+    "MaterialSystem": "src.data.models.material",
+    "VASPResult": "src.data.models.vasp",
+    "ElasticConstants": "src.data.models.vasp",
+    "MechanicalProperties": "src.data.models.vasp",
+    "ComsolRun": "src.data.models.comsol",
+    "ComsolJob": "src.data.models.comsol",
+    "ComsolExecution": "src.data.models.comsol",
+    "StiffnessMatrix": "src.data.models.comsol",
+    "parameter_hash": "src.data.models.comsol",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "Base",
@@ -10,4 +37,9 @@ __all__ = [
     "VASPResult",
     "ElasticConstants",
     "MechanicalProperties",
-]
\ No newline at end of file
+    "ComsolRun",
+    "ComsolJob",
+    "ComsolExecution",
+    "StiffnessMatrix",
+    "parameter_hash",
+]
@@ -0,0 +1,276 @@
+"""COMSOL run, job, execution and stiffness result models for the ESP project.
+
+A parametric study (run) generates jobs; each job is one parameter set and
+may be executed several times (attempts); a successful attempt yields a
+stiffness matrix. Every job stores its applied parameters as JSON together
+with parameter_hash, a hash of the canonicalized parameters, so
+"has this parameter set been simulated before?" is an indexed lookup across
+all historical runs. The hash is derived from parameters on assignment
+(ORM) and as a column default (Core inserts, upserts and COPY), so writers
+never compute it themselves::
+
+    with session_scope() as session:
+        done = session.scalars(ComsolJob.select_by_parameters(
+            {'sphere.radius': 1.75, 'beam.thickness': 1.0}, status='succeeded'
+        )).first()
+"""
+
+import datetime
+import hashlib
+import json
+from typing import Any, Mapping, Optional
+
+from sqlalchemy import (
+    JSON,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    select,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import relationship, validates
+from sqlalchemy.sql import Select
+
+from .base import Base, TimestampMixin
+
+# JSONB on PostgreSQL (indexable with GIN), JSON elsewhere
+JSONType = JSON().with_variant(JSONB(), 'postgresql')
+
+# Job statuses (execution outcomes match the metrics in src.services.metrics)
+JOB_STATUSES = ('generated', 'queued', 'running', 'succeeded', 'failed', 'timeout', 'error')
+
+# Sweep parameters with expression indexes for range filters
+INDEXED_PARAMETERS = ('sphere.radius', 'beam.thickness')
+
+# Significant digits kept when hashing float parameters, so that values
+# such as 1.7500000000000002 (from linspace) and 1.75 hash the same
+_HASH_DIGITS = 12
+
+
+def _canonical(value: Any) -> Any:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return float(f"{float(value):.{_HASH_DIGITS}g}")
+    if isinstance(value, Mapping):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    return value
+
+
+def parameter_hash(parameters: Mapping[str, Any]) -> str:
+    """Stable hash of a parameter set.
+
+    Keys are sorted and numbers are normalized (2 and 2.0 are equal,
+    floats are rounded to 12 significant digits) before hashing.
+
+    Args:
+        parameters: Parameter name -> value (e.g. {'sphere.radius': 1.5})
+
+    Returns:
+        64-character hexadecimal SHA-256 digest
+    """
+    canonical = json.dumps(_canonical(parameters), sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def _parameter_hash_default(context) -> str:
+    """Column default: hash of the parameters of the row being inserted."""
+    return parameter_hash(context.get_current_parameters().get('parameters') or {})
+
+
+class ComsolRun(Base, TimestampMixin):
+    """Model for a parametric study run (one run directory)."""
+
+    __tablename__ = 'comsol_runs'
+
+    id = Column(Integer, primary_key=True)
+    run_id = Column(String(64), nullable=False, unique=True)  # run_YYYYMMDD_HHMMSS_...
+    job_name = Column(String(255), nullable=False, index=True)
+    description = Column(Text, nullable=True)
+    run_dir = Column(String(255), nullable=True)
+    generated_at = Column(DateTime, nullable=True)
+
+    # Sweep summary (parametric_study section of the run metadata)
+    mesh_size = Column(Integer, nullable=True)
+    total_jobs = Column(Integer, nullable=True)
+    jobs_generated = Column(Integer, nullable=True)
+    jobs_skipped = Column(Integer, nullable=True)
+    sweep_info = Column(JSONType, nullable=True)
+
+    jobs = relationship("ComsolJob", back_populates="run", cascade="all, delete-orphan")
+
+    def __repr__(self):
+        return f"<ComsolRun(run_id='{self.run_id}', job_name='{self.job_name}')>"
+
+
+class ComsolJob(Base, TimestampMixin):
+    """Model for a generated job (one parameter set of a run)."""
+
+    __tablename__ = 'comsol_jobs'
+
+    id = Column(Integer, primary_key=True)
+    comsol_run_id = Column(Integer, ForeignKey('comsol_runs.id', ondelete='CASCADE'), nullable=False)
+    job_id = Column(String(50), nullable=False)  # job_001
+    status = Column(String(20), nullable=False, default='generated')
+    parameter_set_index = Column(Integer, nullable=True)
+
+    # Applied parameters and their hash (see parameter_hash)
+    parameters = Column(JSONType, nullable=False, default=dict)
+    # Upserts that update parameters also update the hash (see DatabaseManager.upsert)
+    parameter_hash = Column(
+        String(64), nullable=False, default=_parameter_hash_default,
+        info={'derived_from': ('parameters',)}
+    )
+    mesh_size = Column(Integer, nullable=True)
+
+    job_dir = Column(String(255), nullable=True)
+    java_file = Column(String(255), nullable=True)
+    generated_at = Column(DateTime, nullable=True)
+    job_metadata = Column(JSONType, nullable=True)  # full job metadata file
+
+    run = relationship("ComsolRun", back_populates="jobs")
+    executions = relationship(
+        "ComsolExecution", back_populates="job", cascade="all, delete-orphan",
+        order_by="ComsolExecution.attempt"
+    )
+    stiffness_matrices = relationship(
+        "StiffnessMatrix", back_populates="job", cascade="all, delete-orphan"
+    )
+
+    __table_args__ = (
+        UniqueConstraint('comsol_run_id', 'job_id', name='uq_comsol_jobs_run_job'),
+        # Jobs of a run by status (progress, retry queues)
+        Index('ix_comsol_jobs_run_status', 'comsol_run_id', 'status'),
+        # Historical lookup of a parameter set, optionally by status
+        Index('ix_comsol_jobs_parameter_hash_status', 'parameter_hash', 'status'),
+        # Containment queries on PostgreSQL (parameters @> '{...}')
+        Index('ix_comsol_jobs_parameters_gin', 'parameters', postgresql_using='gin').ddl_if(
+            dialect='postgresql'
+        ),
+    )
+
+    @validates('parameters')
+    def _hash_parameters(self, key: str, parameters: Mapping[str, Any]) -> Mapping[str, Any]:
+        """Keep parameter_hash in sync when parameters are assigned."""
+        self.parameter_hash = parameter_hash(parameters or {})
+        return parameters
+
+    @classmethod
+    def parameter(cls, name: str):
+        """SQL expression for a numeric parameter, e.g. parameter('sphere.radius') > 1.5.
+
+        Matches the expression indexes created for INDEXED_PARAMETERS.
+        """
+        return cls.parameters[name].as_float()
+
+    @classmethod
+    def select_by_parameters(
+        cls,
+        parameters: Mapping[str, Any],
+        status: Optional[str] = None,
+        mesh_size: Optional[int] = None
+    ) -> Select:
+        """Select jobs with exactly this parameter set (indexed by hash).
+
+        Args:
+            parameters: Parameter name -> value
+            status: Only jobs with this status (e.g. 'succeeded')
+            mesh_size: Only jobs generated with this mesh size
+
+        Returns:
+            SELECT statement for ComsolJob, newest first
+        """
+        statement = select(cls).where(cls.parameter_hash == parameter_hash(parameters))
+        if status is not None:
+            statement = statement.where(cls.status == status)
+        if mesh_size is not None:
+            statement = statement.where(cls.mesh_size == mesh_size)
+        return statement.order_by(cls.id.desc())
+
+    def __repr__(self):
+        return f"<ComsolJob(id={self.id}, job_id='{self.job_id}', status='{self.status}')>"
+
+
+# Expression indexes on common sweep parameters (range filters via ComsolJob.parameter)
+for _name in INDEXED_PARAMETERS:
+    Index(f"ix_comsol_jobs_param_{_name.replace('.', '_')}", ComsolJob.parameter(_name))
+
+
+class ComsolExecution(Base):
+    """Model for one execution attempt of a job."""
+
+    __tablename__ = 'comsol_executions'
+
+    id = Column(Integer, primary_key=True)
+    comsol_job_id = Column(Integer, ForeignKey('comsol_jobs.id', ondelete='CASCADE'), nullable=False)
+    attempt = Column(Integer, nullable=False, default=1)
+    status = Column(String(20), nullable=False)  # succeeded / failed / timeout / error
+    returncode = Column(Integer, nullable=True)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    duration_s = Column(Float, nullable=True)
+    host = Column(String(255), nullable=True)
+    error = Column(Text, nullable=True)
+
+    created_at = Column(DateTime, default=datetime.datetime.now)
+
+    job = relationship("ComsolJob", back_populates="executions")
+    stiffness_matrix = relationship("StiffnessMatrix", uselist=False, back_populates="execution")
+
+    __table_args__ = (
+        UniqueConstraint('comsol_job_id', 'attempt', name='uq_comsol_executions_job_attempt'),
+        Index('ix_comsol_executions_status_finished', 'status', 'finished_at'),
+    )
+
+
+class StiffnessMatrix(Base):
+    """
+    Homogenized 6x6 stiffness matrix of a lattice (Voigt notation).
+    Stores the 21 independent components of the symmetric matrix.
+    """
+
+    __tablename__ = 'stiffness_matrices'
+
+    id = Column(Integer, primary_key=True)
+    comsol_job_id = Column(
+        Integer, ForeignKey('comsol_jobs.id', ondelete='CASCADE'), nullable=False, index=True
+    )
+    execution_id = Column(Integer, ForeignKey('comsol_executions.id', ondelete='SET NULL'), nullable=True)
+    unit = Column(String(20), nullable=False, default='GPa')
+    source_file = Column(String(255), nullable=True)  # e.g. results/kirchhoff.txt
+
+    # Stiffness matrix C_ij - 21 independent components
+    c11 = Column(Float, nullable=True)
+    c12 = Column(Float, nullable=True)
+    c13 = Column(Float, nullable=True)
+    c14 = Column(Float, nullable=True)
+    c15 = Column(Float, nullable=True)
+    c16 = Column(Float, nullable=True)
+    c22 = Column(Float, nullable=True)
+    c23 = Column(Float, nullable=True)
+    c24 = Column(Float, nullable=True)
+    c25 = Column(Float, nullable=True)
+    c26 = Column(Float, nullable=True)
+    c33 = Column(Float, nullable=True)
+    c34 = Column(Float, nullable=True)
+    c35 = Column(Float, nullable=True)
+    c36 = Column(Float, nullable=True)
+    c44 = Column(Float, nullable=True)
+    c45 = Column(Float, nullable=True)
+    c46 = Column(Float, nullable=True)
+    c55 = Column(Float, nullable=True)
+    c56 = Column(Float, nullable=True)
+    c66 = Column(Float, nullable=True)
+
+    created_at = Column(DateTime, default=datetime.datetime.now)
+
+    job = relationship("ComsolJob", back_populates="stiffness_matrices")
+    execution = relationship("ComsolExecution", back_populates="stiffness_matrix")
@@ -8,9 +8,11 @@ Design version: v2.0 (2025-12-13)
 Based on: docs/feature/FU01_custom_lattice.md
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Literal, Optional, Union
 from pydantic import BaseModel, Field, field_validator, model_validator
 
+from ...utils.expressions import compile_expression
+
 
 class Sphere(BaseModel):
     """Sphere geometry definition.
@@ -173,15 +175,136 @@ class ParametricSweep(BaseModel):
     values: List[float] = Field(..., min_length=1)
 
 
+class ParametricSweepGroup(BaseModel):
+    """Linked sweeps varied together in lockstep (zip semantics).
+
+    The i-th job of the group uses the i-th value of every member sweep, so
+    a group of k coupled parameters with N values adds N jobs, not N^k.
+    Groups and plain sweeps are combined with each other as a product.
+
+    Attributes:
+        zip: Member sweeps, all with the same number of values
+    """
+    zip: List[ParametricSweep] = Field(..., min_length=1)
+
+    @property
+    def parameters(self) -> List[str]:
+        """Names of the linked parameters."""
+        return [sweep.parameter for sweep in self.zip]
+
+    @property
+    def num_values(self) -> int:
+        """Number of steps along the linked dimension."""
+        return len(self.zip[0].values)
+
+    @model_validator(mode='after')
+    def validate_equal_lengths(self):
+        """Validate that all member sweeps have the same number of values."""
+        lengths = {sweep.parameter: len(sweep.values) for sweep in self.zip}
+        if len(set(lengths.values())) > 1:
+            raise ValueError(
+                f"Linked sweeps must have the same number of values, got {lengths}"
+            )
+        return self
+
+
+class ParameterRange(BaseModel):
+    """Continuous range of one parameter for space-filling sampling.
+
+    Attributes:
+        parameter: Parameter name (e.g., 'sphere.radius')
+        min: Lower bound
+        max: Upper bound
+        log: Sample uniformly in log space (requires min > 0)
+    """
+    parameter: str
+    min: float
+    max: float
+    log: bool = False
+
+    @model_validator(mode='after')
+    def validate_bounds(self):
+        """Validate that the range is non-empty (and positive for log)."""
+        if self.min >= self.max:
+            raise ValueError(
+                f"Range for '{self.parameter}': min ({self.min}) must be less than max ({self.max})"
+            )
+        if self.log and self.min <= 0:
+            raise ValueError(f"Log range for '{self.parameter}' requires min > 0")
+        return self
+
+
+class ParametricSampling(BaseModel):
+    """Space-filling design over continuous parameter ranges.
+
+    Attributes:
+        method: Sampler type ('lhs', 'sobol' or 'halton')
+        num_samples: Number of sample points (powers of 2 are best for Sobol)
+        seed: Random seed (fixed by default for reproducible designs)
+        scramble: Scramble Sobol/Halton sequences
+        ranges: Parameter ranges spanning the design space
+    """
+    method: Literal['lhs', 'sobol', 'halton'] = 'lhs'
+    num_samples: int = Field(..., ge=1)
+    seed: Optional[int] = 0
+    scramble: bool = True
+    ranges: List[ParameterRange] = Field(..., min_length=1)
+
+
 class Parametric(BaseModel):
     """Parametric study configuration.
 
+    Sampled points (if any) are combined with every sweep combination.
+    Combinations that violate any constraint are never generated.
+
     Attributes:
         default: Default parameter values
-        sweeps: List of parametric sweeps
+        sweeps: List of parametric sweeps and linked sweep groups
+        sampling: Optional space-filling sampling over parameter ranges
+        constraints: Expressions over parameter names that every generated
+                     combination must satisfy, e.g.
+                     'beam.thickness * 0.795 / 2 < sphere.radius - 0.01'
     """
     default: Dict[str, float] = Field(default_factory=dict)
-    sweeps: List[ParametricSweep] = Field(default_factory=list)
+    sweeps: List[Union[ParametricSweep, ParametricSweepGroup]] = Field(default_factory=list)
+    sampling: Optional[ParametricSampling] = None
+    constraints: List[str] = Field(default_factory=list)
+
+    @property
+    def parameter_names(self) -> List[str]:
+        """Names of all varied parameters (sweeps and sampled ranges)."""
+        names = []
+        for sweep in self.sweeps:
+            if isinstance(sweep, ParametricSweepGroup):
+                names.extend(sweep.parameters)
+            else:
+                names.append(sweep.parameter)
+        if self.sampling is not None:
+            names.extend(r.parameter for r in self.sampling.ranges)
+        return names
+
+    @model_validator(mode='after')
+    def validate_unique_parameters(self):
+        """Validate that no parameter is varied twice."""
+        names = self.parameter_names
+        duplicates = sorted({n for n in names if names.count(n) > 1})
+        if duplicates:
+            raise ValueError(f"Parameters varied more than once: {duplicates}")
+        return self
+
+    @model_validator(mode='after')
+    def validate_constraints(self):
+        """Validate constraint syntax and the parameters they reference."""
+        known = set(self.default) | set(self.parameter_names)
+        for constraint in self.constraints:
+            expression = compile_expression(constraint)
+            unknown = [name for name in expression.parameters if name not in known]
+            if unknown:
+                raise ValueError(
+                    f"Constraint '{constraint}' references parameters that are "
+                    f"neither swept nor defaulted: {unknown}"
+                )
+        return self
 
 
 class Job(BaseModel):
@@ -243,8 +366,7 @@ class CustomLatticeJob(BaseModel):
             'beam.',     # Allows beam.0.thickness, beam.1.ratio, etc.
         ]
 
-        for sweep in self.job.parametric.sweeps:
-            param = sweep.parameter
+        for param in self.job.parametric.parameter_names:
             is_valid = any(param.startswith(pattern) for pattern in valid_patterns)
 
             if not is_valid:
@@ -0,0 +1,68 @@
+"""Optimizers module for parametric studies.
+
+This module provides surrogate models and search strategies that decide
+which parameter sets are worth spending COMSOL time on.
+
+Exports are loaded lazily (PEP 562); optional backends (scikit-learn,
+LightGBM, Optuna) are only imported by the optimizer that uses them.
+"""
+
+from typing import TYPE_CHECKING
+
+from src.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from src.optimizers.surrogate import (
+        MODEL_TYPES,
+        PrescreenResult,
+        SurrogateModel,
+        SurrogatePrediction,
+        load_training_frame,
+    )
+    from src.optimizers.adaptive_grid import AdaptiveGridRefiner, GridCell
+    from src.optimizers.multi_fidelity import FidelityResult, Rung, SuccessiveHalving
+    from src.optimizers.optuna_optimizer import (
+        OptimizationController,
+        SearchParameter,
+        TrialRecord,
+        search_space_from_sweeps,
+        target_objective,
+    )
+
+_EXPORTS = {
+    "MODEL_TYPES": "src.optimizers.surrogate",
+    "PrescreenResult": "src.optimizers.surrogate",
+    "SurrogateModel": "src.optimizers.surrogate",
+    "SurrogatePrediction": "src.optimizers.surrogate",
+    "load_training_frame": "src.optimizers.surrogate",
+    "AdaptiveGridRefiner": "src.optimizers.adaptive_grid",
+    "GridCell": "src.optimizers.adaptive_grid",
+    "FidelityResult": "src.optimizers.multi_fidelity",
+    "Rung": "src.optimizers.multi_fidelity",
+    "SuccessiveHalving": "src.optimizers.multi_fidelity",
+    "OptimizationController": "src.optimizers.optuna_optimizer",
+    "SearchParameter": "src.optimizers.optuna_optimizer",
+    "TrialRecord": "src.optimizers.optuna_optimizer",
+    "search_space_from_sweeps": "src.optimizers.optuna_optimizer",
+    "target_objective": "src.optimizers.optuna_optimizer",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = [
+    "MODEL_TYPES",
+    "PrescreenResult",
+    "SurrogateModel",
+    "SurrogatePrediction",
+    "load_training_frame",
+    "AdaptiveGridRefiner",
+    "GridCell",
+    "FidelityResult",
+    "Rung",
+    "SuccessiveHalving",
+    "OptimizationController",
+    "SearchParameter",
+    "TrialRecord",
+    "search_space_from_sweeps",
+    "target_objective",
+]
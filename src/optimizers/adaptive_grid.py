@@ -0,0 +1,313 @@
+"""Adaptive grid refinement around property gradients.
+
+Instead of a uniform fine grid, a study starts from the coarse grid given
+by the `sweeps` values. Once results are in, each grid cell (the box
+between neighbouring sweep values) whose target property changes by more
+than a tolerance, or crosses a threshold, is split at its midpoints. Only
+the new corner points of the split cells become new ParameterSets; points
+that already have results are reused. Refinement repeats until no cell
+needs splitting, the maximum depth is reached, or the budget is spent.
+Points violating the study's constraints are never requested, and cells
+with an infeasible corner are not split.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import product
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.config.loader import get_logger
+from src.data.models.custom_lattice import ParametricSweepGroup
+from src.services.parametric_generator import ParameterSet
+from src.utils.expressions import compile_expression
+
+_logger = get_logger("optimizers.adaptive_grid")
+
+Point = Tuple[float, ...]
+
+# Decimals used to identify grid points (avoids float round-off duplicates)
+_POINT_DECIMALS = 9
+
+
+def _key(point: Sequence[float]) -> Point:
+    """Normalize a grid point for use as a dictionary key."""
+    return tuple(round(float(x), _POINT_DECIMALS) for x in point)
+
+
+@dataclass
+class GridCell:
+    """Axis-aligned grid cell.
+
+    Attributes:
+        lower: Lower corner coordinates
+        upper: Upper corner coordinates
+        level: Refinement level (0 = coarse grid)
+    """
+    lower: Point
+    upper: Point
+    level: int = 0
+
+    def corners(self) -> List[Point]:
+        """All 2^d corner points of the cell."""
+        return [_key(c) for c in product(*zip(self.lower, self.upper))]
+
+    def split(self) -> List['GridCell']:
+        """Split the cell at its midpoints into 2^d children."""
+        mid = [(lo + hi) / 2.0 for lo, hi in zip(self.lower, self.upper)]
+        children = []
+        for halves in product((0, 1), repeat=len(mid)):
+            lower = [self.lower[i] if h == 0 else mid[i] for i, h in enumerate(halves)]
+            upper = [mid[i] if h == 0 else self.upper[i] for i, h in enumerate(halves)]
+            children.append(GridCell(_key(lower), _key(upper), self.level + 1))
+        return children
+
+
+class AdaptiveGridRefiner:
+    """Refine a parametric grid where the target property changes sharply."""
+
+    def __init__(
+        self,
+        axes: Dict[str, Sequence[float]],
+        tolerance: Optional[float] = None,
+        thresholds: Optional[Sequence[float]] = None,
+        max_level: int = 3,
+        budget: Optional[int] = None,
+        defaults: Optional[Dict[str, float]] = None,
+        constraints: Optional[Sequence[str]] = None
+    ):
+        """Initialize the refiner.
+
+        Args:
+            axes: Coarse grid values per parameter, e.g.
+                  {'sphere.radius': [0.5, 2.9, 5.3], 'beam.thickness': [...]}
+            tolerance: Refine cells whose target range (max - min over the
+                       corners) exceeds this value
+            thresholds: Refine cells whose corner values straddle any of
+                        these values (e.g. a Zener ratio of 1.0)
+            max_level: Maximum number of times a coarse cell is halved
+            budget: Maximum number of evaluated points, coarse grid included
+            defaults: Parameter values applied to every ParameterSet
+                      (e.g. job.parametric.default)
+            constraints: Expressions every requested point must satisfy
+                         (e.g. job.parametric.constraints); infeasible
+                         points are skipped and do not count against the
+                         budget
+        """
+        if tolerance is None and not thresholds:
+            raise ValueError("Either tolerance or thresholds must be given")
+        for name, values in axes.items():
+            if len(set(values)) < 2:
+                raise ValueError(f"Axis '{name}' needs at least 2 distinct values")
+
+        self.parameter_names = list(axes)
+        self.tolerance = tolerance
+        self.thresholds = list(thresholds or [])
+        self.max_level = max_level
+        self.budget = budget
+        self.defaults = dict(defaults or {})
+        self.constraints = [compile_expression(c) for c in constraints or []]
+
+        # Evaluated points -> target value (None for failed jobs)
+        self.results: Dict[Point, Optional[float]] = {}
+        self._pending: Dict[Point, ParameterSet] = {}
+        self._feasible: Dict[Point, bool] = {}
+        self._job_counter = 0
+
+        coarse = [sorted(set(float(v) for v in axes[name])) for name in self.parameter_names]
+        self.cells: List[GridCell] = [
+            GridCell(
+                _key(values[i] for values, i in zip(coarse, idx)),
+                _key(values[i + 1] for values, i in zip(coarse, idx))
+            )
+            for idx in product(*[range(len(values) - 1) for values in coarse])
+        ]
+        self._coarse_points = [_key(p) for p in product(*coarse)]
+
+    @classmethod
+    def from_job(cls, custom_job: 'CustomLatticeJob', **kwargs) -> 'AdaptiveGridRefiner':
+        """Create a refiner whose coarse grid is the job's sweeps.
+
+        Args:
+            custom_job: CustomLatticeJob with parametric sweeps
+            **kwargs: Passed to AdaptiveGridRefiner (tolerance, thresholds, ...)
+
+        Returns:
+            AdaptiveGridRefiner
+
+        Raises:
+            ValueError: If the job uses linked sweep groups
+        """
+        parametric = custom_job.job.parametric
+        if any(isinstance(sweep, ParametricSweepGroup) for sweep in parametric.sweeps):
+            raise ValueError(
+                "Adaptive grid refinement needs a rectilinear grid; "
+                "linked sweep groups are not supported"
+            )
+        axes = {sweep.parameter: sweep.values for sweep in parametric.sweeps}
+        kwargs.setdefault('defaults', parametric.default)
+        kwargs.setdefault('constraints', parametric.constraints)
+        return cls(axes, **kwargs)
+
+    @property
+    def num_evaluated(self) -> int:
+        """Number of points with results (successful or failed)."""
+        return len(self.results)
+
+    def _remaining_budget(self) -> Optional[int]:
+        """Number of points that may still be requested (None = unlimited)."""
+        if self.budget is None:
+            return None
+        return max(0, self.budget - len(self.results) - len(self._pending))
+
+    def is_feasible(self, point: Sequence[float]) -> bool:
+        """Whether a grid point satisfies all constraints."""
+        point = _key(point)
+        feasible = self._feasible.get(point)
+        if feasible is None:
+            values = self.defaults.copy()
+            values.update(zip(self.parameter_names, point))
+            feasible = all(bool(c.evaluate(values)) for c in self.constraints)
+            self._feasible[point] = feasible
+        return feasible
+
+    def _make_parameter_set(self, point: Point) -> ParameterSet:
+        """Create a ParameterSet for a grid point."""
+        self._job_counter += 1
+        params = self.defaults.copy()
+        params.update(zip(self.parameter_names, point))
+        return ParameterSet(
+            job_id=f"job_{self._job_counter:03d}",
+            parameters=params,
+            sweep_indices=()
+        )
+
+    def _request(self, points: Sequence[Point]) -> List[ParameterSet]:
+        """Create ParameterSets for feasible points that are neither evaluated nor pending."""
+        new_sets = []
+        for point in points:
+            if point in self.results or point in self._pending or not self.is_feasible(point):
+                continue
+            param_set = self._make_parameter_set(point)
+            self._pending[point] = param_set
+            new_sets.append(param_set)
+        return new_sets
+
+    def initial_parameter_sets(self) -> List[ParameterSet]:
+        """ParameterSets of the coarse grid that have no results yet."""
+        points = [p for p in self._coarse_points if self.is_feasible(p)]
+        remaining = self._remaining_budget()
+        if remaining is not None:
+            points = [p for p in points if p not in self.results][:remaining]
+        return self._request(points)
+
+    def add_result(self, param_set: ParameterSet, value: Optional[float]) -> None:
+        """Record the target value of an evaluated ParameterSet.
+
+        Args:
+            param_set: Evaluated parameter set (from this refiner or any
+                       earlier run on the same grid)
+            value: Target property value, or None if the job failed
+        """
+        point = _key(param_set.parameters[name] for name in self.parameter_names)
+        self._pending.pop(point, None)
+        self.results[point] = None if value is None else float(value)
+
+    def _cell_change(self, cell: GridCell) -> Optional[float]:
+        """Return the target range over a cell if it needs refinement, else None.
+
+        Cells with failed, missing or infeasible corners are not refined.
+        """
+        values = [self.results.get(c) for c in cell.corners()]
+        if any(v is None for v in values):
+            return None
+        low, high = min(values), max(values)
+
+        crosses = any(low < t < high for t in self.thresholds)
+        exceeds = self.tolerance is not None and high - low > self.tolerance
+        return high - low if (crosses or exceeds) else None
+
+    def refine(self) -> List[ParameterSet]:
+        """Split cells that need refinement and return their new points.
+
+        Cells are split in order of decreasing target change so that the
+        budget, if any, is spent where the response changes most.
+
+        Returns:
+            New ParameterSets to evaluate (empty when converged)
+        """
+        candidates = []
+        for cell in self.cells:
+            if cell.level >= self.max_level:
+                continue
+            change = self._cell_change(cell)
+            if change is not None:
+                candidates.append((change, cell))
+        candidates.sort(key=lambda item: -item[0])
+
+        new_sets: List[ParameterSet] = []
+        split_cells = []
+        for _, cell in candidates:
+            children = cell.split()
+            missing = {
+                c for child in children for c in child.corners()
+                if c not in self.results and c not in self._pending and self.is_feasible(c)
+            }
+            remaining = self._remaining_budget()
+            if remaining is not None and len(missing) > remaining:
+                continue
+            split_cells.append((cell, children))
+            new_sets.extend(self._request(sorted(missing)))
+
+        for cell, children in split_cells:
+            self.cells.remove(cell)
+            self.cells.extend(children)
+
+        _logger.info(
+            f"Refined {len(split_cells)} of {len(candidates)} flagged cells; "
+            f"{len(new_sets)} new points ({self.num_evaluated} evaluated)"
+        )
+        return new_sets
+
+    def run(
+        self,
+        evaluate: Callable[[List[ParameterSet]], Sequence[Optional[float]]],
+        max_iterations: int = 10
+    ) -> Dict[Point, Optional[float]]:
+        """Run coarse evaluation and refinement until converged.
+
+        Args:
+            evaluate: Runs a batch of ParameterSets (e.g. generate and
+                      execute jobs) and returns their target values in the
+                      same order (None for failed jobs)
+            max_iterations: Maximum number of refinement rounds
+
+        Returns:
+            All evaluated points and their target values
+        """
+        batch = self.initial_parameter_sets()
+        for iteration in range(max_iterations + 1):
+            if not batch:
+                break
+            values = list(evaluate(batch))
+            if len(values) != len(batch):
+                raise ValueError(
+                    f"evaluate returned {len(values)} values for {len(batch)} parameter sets"
+                )
+            for param_set, value in zip(batch, values):
+                self.add_result(param_set, value)
+            if iteration == max_iterations:
+                break
+            batch = self.refine()
+
+        _logger.info(
+            f"Adaptive refinement finished with {self.num_evaluated} evaluated points "
+            f"and {len(self.cells)} cells"
+        )
+        return dict(self.results)
+
+
+__all__ = [
+    "GridCell",
+    "AdaptiveGridRefiner",
+]
@@ -0,0 +1,295 @@
+"""Multi-fidelity parametric studies using mesh size as the fidelity knob.
+
+COMSOL's autoMeshSize (Mesh.size, 1=finest ... 9=coarsest) strongly drives
+runtime. A successive-halving schedule screens all parameter sets with a
+coarse mesh, then reruns only the most promising ones (plus those too close
+to the cut-off to call) at progressively finer meshes.
+
+Every job records its mesh size in metadata ('mesh.size') and every result
+record carries its fidelity, and candidates are only ever ranked against
+results from the same rung, so coarse and fine results are never mixed.
+"""
+
+from __future__ import annotations
+
+import math
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
+
+from src.config.loader import get_logger
+from src.services.batch_executor import execute_job
+from src.services.parametric_generator import ParameterSet, ParametricGenerator
+from src.utils.ids import generate_id
+
+_logger = get_logger("optimizers.multi_fidelity")
+
+JobExecutor = Callable[[Any], Any]
+ResultParser = Callable[[Dict[str, Any]], Mapping[str, float]]
+Score = Callable[[Mapping[str, float]], float]
+
+
+@dataclass
+class FidelityResult:
+    """Result of one parameter set evaluated at one fidelity.
+
+    Attributes:
+        parameter_set_index: 1-based index of the parameter set in the study
+        mesh_size: Mesh size (fidelity) the job ran with
+        run_id: Run ID of the rung
+        job_id: Job ID within the rung
+        parameters: Applied parameters
+        properties: Parsed result properties (None if the job failed)
+        score: Score from properties, lower is better (None if failed)
+        error: Error message for failed or skipped jobs
+    """
+    parameter_set_index: int
+    mesh_size: int
+    run_id: str
+    job_id: Optional[str]
+    parameters: Dict[str, float]
+    properties: Optional[Dict[str, float]] = None
+    score: Optional[float] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class Rung:
+    """One fidelity level of a successive-halving schedule.
+
+    Attributes:
+        mesh_size: Mesh size of this rung
+        run_id: Run ID the rung's jobs were generated under
+        results: Results of all candidates evaluated in this rung
+        promoted: Parameter set indices promoted to the next rung
+    """
+    mesh_size: int
+    run_id: str
+    results: List[FidelityResult] = field(default_factory=list)
+    promoted: List[int] = field(default_factory=list)
+
+
+class SuccessiveHalving:
+    """Successive-halving schedule over mesh fidelities."""
+
+    def __init__(
+        self,
+        custom_job: 'CustomLatticeJob',
+        generator: 'JobGenerator',
+        result_parser: ResultParser,
+        score: Score,
+        mesh_sizes: Sequence[int] = (8, 5, 2),
+        eta: float = 3.0,
+        uncertainty: float = 0.0,
+        executor: JobExecutor = execute_job,
+        n_parallel: int = 1,
+        run_id: Optional[str] = None
+    ):
+        """Initialize the schedule.
+
+        Args:
+            custom_job: CustomLatticeJob definition with parametric sweeps
+            generator: JobGenerator used to create jobs
+            result_parser: Called with the job result dict after execution;
+                           returns properties such as {'zener_ratio': ...}
+            score: Maps properties to a score to minimize
+                   (e.g. src.optimizers.target_objective)
+            mesh_sizes: Mesh sizes from coarsest to finest
+            eta: Keep the best 1/eta of candidates at each rung
+            uncertainty: Also promote candidates whose score is within this
+                         relative margin of the cut-off score, since coarse
+                         meshes cannot separate them reliably
+            executor: Runs a job directory (default: execute_job)
+            n_parallel: Number of jobs executed concurrently
+            run_id: Base run ID (auto-generated if None); each rung is
+                    generated as '<run_id>_mesh<size>'
+        """
+        mesh_sizes = list(mesh_sizes)
+        if not mesh_sizes:
+            raise ValueError("At least one mesh size is required")
+        for size in mesh_sizes:
+            if not 1 <= size <= 9:
+                raise ValueError(f"Mesh size must be 1-9, got {size}")
+        if any(a <= b for a, b in zip(mesh_sizes, mesh_sizes[1:])):
+            raise ValueError(
+                f"Mesh sizes must go from coarse to fine (strictly decreasing), got {mesh_sizes}"
+            )
+        if eta <= 1:
+            raise ValueError(f"eta must be greater than 1, got {eta}")
+
+        self.custom_job = custom_job
+        self.generator = generator
+        self.result_parser = result_parser
+        self.score = score
+        self.mesh_sizes = mesh_sizes
+        self.eta = eta
+        self.uncertainty = uncertainty
+        self.executor = executor
+        self.n_parallel = max(1, n_parallel)
+
+        if run_id is None:
+            run_id = generate_id("run")
+        self.run_id = run_id
+        self.rungs: List[Rung] = []
+
+    def _evaluate(self, job: Dict[str, Any], rung: Rung, param_set: ParameterSet) -> FidelityResult:
+        """Execute one job and score its results (worker thread)."""
+        result = FidelityResult(
+            parameter_set_index=job['parameter_set_index'],
+            mesh_size=rung.mesh_size,
+            run_id=rung.run_id,
+            job_id=job['job_id'],
+            parameters=dict(param_set.parameters)
+        )
+        try:
+            self.executor(job['job_dir'])
+            result.properties = dict(self.result_parser(job))
+            result.score = float(self.score(result.properties))
+        except Exception as e:
+            result.error = f"{type(e).__name__}: {e}"
+            _logger.warning(
+                f"Job {rung.run_id}/{job['job_id']} failed at mesh size {rung.mesh_size}: {result.error}"
+            )
+        return result
+
+    def _run_rung(self, mesh_size: int, candidates: Dict[int, ParameterSet]) -> Rung:
+        """Generate, execute and score all candidates at one fidelity."""
+        rung = Rung(mesh_size=mesh_size, run_id=f"{self.run_id}_mesh{mesh_size}")
+        indices = list(candidates)
+
+        study = self.generator.generate_parametric_study_jobs(
+            self.custom_job,
+            run_id=rung.run_id,
+            param_sets=[candidates[i] for i in indices],
+            mesh_size=mesh_size
+        )
+
+        # Map back to study-wide parameter set indices
+        jobs = []
+        for job in study['jobs']:
+            index = indices[job['parameter_set_index'] - 1]
+            jobs.append(dict(job, parameter_set_index=index))
+        generated = {job['parameter_set_index'] for job in jobs}
+        for index in indices:
+            if index not in generated:
+                rung.results.append(FidelityResult(
+                    parameter_set_index=index,
+                    mesh_size=mesh_size,
+                    run_id=rung.run_id,
+                    job_id=None,
+                    parameters=dict(candidates[index].parameters),
+                    error="Job generation skipped (see manifest)"
+                ))
+
+        with ThreadPoolExecutor(max_workers=self.n_parallel) as pool:
+            futures = [
+                pool.submit(self._evaluate, job, rung, candidates[job['parameter_set_index']])
+                for job in jobs
+            ]
+            rung.results.extend(f.result() for f in futures)
+
+        rung.results.sort(key=lambda r: r.parameter_set_index)
+        return rung
+
+    def _promote(self, rung: Rung, num_keep: int) -> List[int]:
+        """Select candidates for the next rung from this rung's results only."""
+        scored = sorted(
+            (r for r in rung.results if r.score is not None and r.mesh_size == rung.mesh_size),
+            key=lambda r: r.score
+        )
+        if not scored:
+            return []
+
+        keep = scored[:num_keep]
+        if self.uncertainty > 0 and len(scored) > num_keep:
+            cutoff = keep[-1].score
+            margin = self.uncertainty * max(abs(cutoff), 1e-12)
+            keep += [r for r in scored[num_keep:] if r.score <= cutoff + margin]
+
+        return [r.parameter_set_index for r in keep]
+
+    def run(self, param_sets: Optional[List[ParameterSet]] = None) -> List[Rung]:
+        """Run the schedule.
+
+        Args:
+            param_sets: Candidates to screen (default: the full sweep)
+
+        Returns:
+            List of rungs from coarsest to finest
+        """
+        if param_sets is None:
+            param_sets = ParametricGenerator(self.custom_job).generate_parameter_sets()
+
+        candidates = {i: ps for i, ps in enumerate(param_sets, 1)}
+        self.rungs = []
+
+        for level, mesh_size in enumerate(self.mesh_sizes):
+            _logger.info(
+                f"Rung {level}: evaluating {len(candidates)} candidates at mesh size {mesh_size}"
+            )
+            rung = self._run_rung(mesh_size, candidates)
+            self.rungs.append(rung)
+
+            if level == len(self.mesh_sizes) - 1:
+                break
+
+            num_keep = max(1, math.ceil(len(candidates) / self.eta))
+            rung.promoted = self._promote(rung, num_keep)
+            if not rung.promoted:
+                _logger.warning(f"No candidates succeeded at mesh size {mesh_size}; stopping")
+                break
+            candidates = {i: candidates[i] for i in rung.promoted}
+
+        total = sum(len(r.results) for r in self.rungs)
+        _logger.info(
+            f"Successive halving completed: {total} jobs over {len(self.rungs)} rungs "
+            f"(full grid at finest mesh would be {len(param_sets)} jobs)"
+        )
+        return self.rungs
+
+    def results(self, mesh_size: Optional[int] = None) -> List[FidelityResult]:
+        """Get results, optionally restricted to one fidelity.
+
+        Args:
+            mesh_size: Only return results at this mesh size
+
+        Returns:
+            List of FidelityResult
+        """
+        return [
+            r for rung in self.rungs for r in rung.results
+            if mesh_size is None or r.mesh_size == mesh_size
+        ]
+
+    def best(self) -> Optional[FidelityResult]:
+        """Best result at the finest fidelity that was reached."""
+        if not self.rungs:
+            return None
+        scored = [r for r in self.rungs[-1].results if r.score is not None]
+        return min(scored, key=lambda r: r.score) if scored else None
+
+    def results_frame(self) -> 'pd.DataFrame':
+        """All results as a DataFrame with one row per (parameter set, fidelity)."""
+        import pandas as pd
+
+        rows = []
+        for r in self.results():
+            row = {
+                'parameter_set_index': r.parameter_set_index,
+                'mesh_size': r.mesh_size,
+                'run_id': r.run_id,
+                'job_id': r.job_id,
+                'score': r.score,
+                'error': r.error,
+            }
+            row.update(r.parameters)
+            row.update(r.properties or {})
+            rows.append(row)
+        return pd.DataFrame(rows)
+
+
+__all__ = [
+    "FidelityResult",
+    "Rung",
+    "SuccessiveHalving",
+]
@@ -0,0 +1,384 @@
+"""Closed-loop Bayesian optimization over the job pipeline.
+
+The controller drives the optimization loop described in
+docs/project_design.md using Optuna's ask/tell interface:
+
+    propose -> generate -> execute -> analyze -> tell
+
+Parameter sets are proposed in the same namespace as parametric sweeps
+('sphere.radius', 'beam.thickness', 'beam.3.ratio', ...), turned into jobs
+with JobGenerator.generate_custom_lattice_job, executed several at a time,
+and each result is fed back to the study as soon as it is available so
+that the sampler can propose the next trial without waiting for the
+whole batch.
+"""
+
+from __future__ import annotations
+
+import math
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
+
+from src.config.loader import get_logger
+from src.data.models.custom_lattice import ParametricSweepGroup
+from src.services.batch_executor import execute_job
+from src.services.parametric_generator import ParameterSet
+from src.services.run_manifest import MANIFEST_FILENAME, RunManifest
+from src.utils.ids import generate_id
+
+_logger = get_logger("optimizers.optuna_optimizer")
+
+# Type aliases for the pluggable pipeline steps
+JobExecutor = Callable[[Path], Any]
+ResultParser = Callable[[Dict[str, Any]], Mapping[str, float]]
+Objective = Callable[[Mapping[str, float]], float]
+
+
+def _require_optuna():
+    """Import optuna or raise an informative error."""
+    try:
+        import optuna
+    except ImportError as e:
+        raise ImportError(
+            "optuna is required for the optimization controller. Install optuna."
+        ) from e
+    return optuna
+
+
+@dataclass
+class SearchParameter:
+    """A continuous search dimension.
+
+    Attributes:
+        name: Parameter name (e.g. 'sphere.radius', 'beam.2.ratio')
+        low: Lower bound
+        high: Upper bound
+        log: Sample on a log scale
+        step: Optional discretization step
+    """
+    name: str
+    low: float
+    high: float
+    log: bool = False
+    step: Optional[float] = None
+
+    def __post_init__(self):
+        if self.low >= self.high:
+            raise ValueError(
+                f"Search parameter '{self.name}': low ({self.low}) must be "
+                f"less than high ({self.high})"
+            )
+
+
+def search_space_from_sweeps(custom_job: 'CustomLatticeJob') -> List[SearchParameter]:
+    """Derive a search space from the parametric sweeps of a job.
+
+    Each sweep becomes a continuous dimension spanning the min and max of
+    its values. Sweeps with a single value are left out (kept at default).
+    Members of linked sweep groups become independent dimensions, and
+    sampling ranges are used as they are.
+
+    Args:
+        custom_job: CustomLatticeJob with parametric sweeps
+
+    Returns:
+        List of SearchParameter, one per varying sweep
+    """
+    space = []
+    sweeps = []
+    for sweep in custom_job.job.parametric.sweeps or []:
+        # Members of linked groups are searched independently
+        sweeps.extend(sweep.zip if isinstance(sweep, ParametricSweepGroup) else [sweep])
+
+    for sweep in sweeps:
+        low, high = min(sweep.values), max(sweep.values)
+        if low < high:
+            space.append(SearchParameter(sweep.parameter, float(low), float(high)))
+
+    sampling = custom_job.job.parametric.sampling
+    if sampling is not None:
+        space.extend(
+            SearchParameter(r.parameter, r.min, r.max, log=r.log)
+            for r in sampling.ranges
+        )
+    return space
+
+
+def target_objective(targets: Mapping[str, float], relative: bool = True) -> Objective:
+    """Build an objective measuring distance to target properties.
+
+    Args:
+        targets: Target property values, e.g. {'zener_ratio': 1.0}
+        relative: Use relative deviations (|value - target| / |target|)
+
+    Returns:
+        Objective returning the root-sum-square deviation (to minimize)
+    """
+    def objective(properties: Mapping[str, float]) -> float:
+        total = 0.0
+        for name, target in targets.items():
+            deviation = properties[name] - target
+            if relative and target != 0:
+                deviation /= abs(target)
+            total += deviation ** 2
+        return math.sqrt(total)
+
+    return objective
+
+
+@dataclass
+class TrialRecord:
+    """Outcome of one optimization trial.
+
+    Attributes:
+        number: Optuna trial number
+        job_id: Generated job ID
+        parameters: Parameters applied to the job
+        properties: Parsed result properties (None if the trial failed)
+        value: Objective value (None if the trial failed)
+        error: Error message for failed trials
+    """
+    number: int
+    job_id: str
+    parameters: Dict[str, float]
+    properties: Optional[Dict[str, float]] = None
+    value: Optional[float] = None
+    error: Optional[str] = None
+
+
+class OptimizationController:
+    """Ask/tell optimization loop over job generation and execution."""
+
+    def __init__(
+        self,
+        custom_job: 'CustomLatticeJob',
+        generator: 'JobGenerator',
+        result_parser: ResultParser,
+        objective: Objective,
+        search_space: Optional[Sequence[SearchParameter]] = None,
+        executor: JobExecutor = execute_job,
+        n_parallel: int = 2,
+        direction: str = 'minimize',
+        study: Optional['optuna.Study'] = None,
+        sampler: Optional['optuna.samplers.BaseSampler'] = None,
+        failure_value: Optional[float] = None,
+        run_id: Optional[str] = None
+    ):
+        """Initialize the controller.
+
+        Args:
+            custom_job: Base CustomLatticeJob; its parametric defaults are
+                        applied to every trial before proposed values
+            generator: JobGenerator used to create trial jobs
+            result_parser: Called with the job result dict after execution;
+                           returns properties such as {'zener_ratio': ...}
+            objective: Maps parsed properties to the value to optimize
+            search_space: Search dimensions (default: derived from sweeps)
+            executor: Runs a job directory (default: execute_job)
+            n_parallel: Number of trials executed concurrently
+            direction: 'minimize' or 'maximize' (ignored if study is given)
+            study: Existing Optuna study (e.g. with persistent storage)
+            sampler: Optuna sampler (default: TPE with constant_liar so
+                     that concurrent proposals do not collapse)
+            failure_value: Value told for failed trials; if None, failed
+                           trials are marked as FAIL and ignored by the sampler
+            run_id: Run ID grouping all trial jobs (auto-generated if None)
+        """
+        optuna = _require_optuna()
+
+        self.custom_job = custom_job
+        self.generator = generator
+        self.result_parser = result_parser
+        self.objective = objective
+        self.search_space = list(search_space) if search_space is not None \
+            else search_space_from_sweeps(custom_job)
+        self.executor = executor
+        self.n_parallel = max(1, n_parallel)
+        self.failure_value = failure_value
+
+        if not self.search_space:
+            raise ValueError(
+                "Search space is empty. Define parametric sweeps with at least "
+                "two values or pass search_space explicitly."
+            )
+
+        if study is None:
+            if sampler is None:
+                sampler = optuna.samplers.TPESampler(constant_liar=True, seed=0)
+            study = optuna.create_study(direction=direction, sampler=sampler)
+        self.study = study
+
+        if run_id is None:
+            run_id = generate_id("opt")
+        self.run_id = run_id
+        self.run_dir = generator.output_base_dir / run_id
+        self.trials: List[TrialRecord] = []
+
+        _logger.info(
+            f"OptimizationController initialized: {len(self.search_space)} parameters, "
+            f"n_parallel={self.n_parallel}, run_id={run_id}"
+        )
+
+    def _suggest(self, trial: 'optuna.Trial') -> Dict[str, float]:
+        """Propose parameters for a trial."""
+        params = dict(self.custom_job.job.parametric.default)
+        for dim in self.search_space:
+            params[dim.name] = trial.suggest_float(
+                dim.name, dim.low, dim.high, log=dim.log, step=dim.step
+            )
+        return params
+
+    def _run_job(self, job_result: Dict[str, Any]) -> Dict[str, float]:
+        """Execute a generated job and parse its results (worker thread)."""
+        self.executor(job_result['job_dir'])
+        return dict(self.result_parser(job_result))
+
+    def _submit(
+        self,
+        pool: ThreadPoolExecutor,
+        manifest: RunManifest
+    ) -> Optional[tuple]:
+        """Ask for a trial, generate its job and submit it for execution.
+
+        Returns:
+            (trial, record, future), or None if the job could not be generated
+        """
+        trial = self.study.ask()
+        params = self._suggest(trial)
+        job_id = f"job_{trial.number + 1:03d}"
+        record = TrialRecord(number=trial.number, job_id=job_id, parameters=params)
+
+        try:
+            job_result = self.generator.generate_custom_lattice_job(
+                self.custom_job,
+                job_id=job_id,
+                run_id=self.run_id,
+                param_set=ParameterSet(job_id=job_id, parameters=params, sweep_indices=())
+            )
+        except Exception as e:
+            # Invalid geometry for the proposed parameters (ValueError) or any
+            # other generation error fails this trial, not the optimization
+            record.error = f"{type(e).__name__}: {e}"
+            self._finish(trial, record, manifest)
+            return None
+
+        return trial, record, pool.submit(self._run_job, job_result)
+
+    def _finish(
+        self,
+        trial: 'optuna.Trial',
+        record: TrialRecord,
+        manifest: RunManifest,
+        future: Optional[Future] = None
+    ) -> None:
+        """Tell the study the outcome of a trial and record it."""
+        optuna = _require_optuna()
+
+        if future is not None:
+            try:
+                record.properties = future.result()
+                record.value = float(self.objective(record.properties))
+            except Exception as e:
+                record.error = f"{type(e).__name__}: {e}"
+
+        if record.error is None:
+            self.study.tell(trial, record.value)
+            _logger.info(f"Trial {record.number} ({record.job_id}): value={record.value:.6g}")
+        elif self.failure_value is not None:
+            self.study.tell(trial, self.failure_value)
+            _logger.warning(f"Trial {record.number} ({record.job_id}) failed: {record.error}")
+        else:
+            self.study.tell(trial, state=optuna.trial.TrialState.FAIL)
+            _logger.warning(f"Trial {record.number} ({record.job_id}) failed: {record.error}")
+
+        entry = {
+            'trial_number': record.number,
+            'job_id': record.job_id,
+            'parameters': record.parameters,
+            'properties': record.properties,
+            'value': record.value,
+        }
+        if record.error is None:
+            manifest.write_job(entry)
+        else:
+            manifest.write_skipped(dict(entry, error=record.error))
+        self.trials.append(record)
+
+    def optimize(self, n_trials: int) -> 'optuna.Study':
+        """Run the optimization loop.
+
+        Up to n_parallel jobs run at once. Whenever one finishes, its result
+        is told to the study and a new trial is asked for immediately.
+
+        Args:
+            n_trials: Total number of trials to run
+
+        Returns:
+            The Optuna study
+        """
+        self.run_dir.mkdir(parents=True, exist_ok=True)
+        asked = 0
+        pending: Dict[Future, tuple] = {}
+
+        with RunManifest(self.run_dir / MANIFEST_FILENAME) as manifest, \
+                ThreadPoolExecutor(max_workers=self.n_parallel) as pool:
+            manifest.write_header(
+                run_id=self.run_id,
+                job_name=self.custom_job.job.name,
+                started_at=datetime.now().isoformat(),
+                n_trials=n_trials,
+                n_parallel=self.n_parallel,
+                search_space=[vars(dim) for dim in self.search_space]
+            )
+
+            while asked < n_trials or pending:
+                # Keep the pool full
+                while asked < n_trials and len(pending) < self.n_parallel:
+                    asked += 1
+                    submitted = self._submit(pool, manifest)
+                    if submitted is not None:
+                        trial, record, future = submitted
+                        pending[future] = (trial, record)
+
+                if not pending:
+                    continue
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    trial, record = pending.pop(future)
+                    self._finish(trial, record, manifest, future)
+
+            best = self.best_trial
+            manifest.write_summary(
+                jobs_generated=manifest.num_jobs,
+                jobs_skipped=manifest.num_skipped,
+                best_job_id=best.job_id if best else None,
+                best_value=best.value if best else None
+            )
+
+        _logger.info(
+            f"Optimization completed: {len(self.trials)} trials, "
+            f"best value={best.value if best else None}"
+        )
+        return self.study
+
+    @property
+    def best_trial(self) -> Optional[TrialRecord]:
+        """Best completed trial record, or None if no trial succeeded."""
+        completed = {t.number: t for t in self.trials if t.error is None}
+        if not completed:
+            return None
+        best = min if self.study.direction.name == 'MINIMIZE' else max
+        return best(completed.values(), key=lambda t: t.value)
+
+
+__all__ = [
+    "SearchParameter",
+    "TrialRecord",
+    "OptimizationController",
+    "search_space_from_sweeps",
+    "target_objective",
+]
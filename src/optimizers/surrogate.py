@@ -0,0 +1,448 @@
+"""Surrogate models for prescreening parametric sweeps.
+
+A surrogate is trained on completed jobs (applied parameters -> simulated
+properties such as C11, Zener ratio or Poisson ratio) and predicts the
+properties of parameter sets that have not been run yet, together with an
+uncertainty estimate. Candidates are then ranked by their probability of
+meeting the target property ranges, and candidates that cannot plausibly
+meet them are pruned before any COMSOL time is spent.
+
+Supported model types:
+- 'gp': Gaussian process regression (scikit-learn), predictive std
+- 'forest': random forest (scikit-learn), std across trees
+- 'lightgbm': LightGBM quantile regression, std from the 16/84% quantiles
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from src.config.loader import get_logger
+from src.services.parametric_generator import ParameterSet
+
+_logger = get_logger("optimizers.surrogate")
+
+MODEL_TYPES = ('gp', 'forest', 'lightgbm')
+
+# Prefix of applied parameter columns in flattened job metadata
+_APPLIED_PARAMETER_PREFIX = 'parametric.applied_parameters.'
+
+ParameterLike = Union[ParameterSet, Mapping[str, float]]
+
+
+def _require_sklearn():
+    """Import scikit-learn or raise an informative error."""
+    try:
+        import sklearn  # noqa: F401
+    except ImportError as e:
+        raise ImportError(
+            "scikit-learn is required for surrogate models. Install scikit-learn."
+        ) from e
+
+
+def _parameters_of(item: ParameterLike) -> Mapping[str, float]:
+    """Return the parameter mapping of a ParameterSet or plain mapping."""
+    if isinstance(item, ParameterSet):
+        return item.parameters
+    return item
+
+
+def _as_parameter_set(item: ParameterLike, index: int) -> ParameterSet:
+    """Return a ParameterSet; plain mappings get job_id 'job_<index + 1>'."""
+    if isinstance(item, ParameterSet):
+        return item
+    return ParameterSet(job_id=f"job_{index + 1:03d}", parameters=dict(item), sweep_indices=())
+
+
+@dataclass
+class SurrogatePrediction:
+    """Predicted properties with uncertainty.
+
+    Attributes:
+        target_names: Names of the predicted properties (columns)
+        mean: Predicted means, shape (n_candidates, n_targets)
+        std: Predicted standard deviations, shape (n_candidates, n_targets)
+    """
+    target_names: List[str]
+    mean: np.ndarray
+    std: np.ndarray
+
+    def get(self, target: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Get (mean, std) arrays for one target property."""
+        idx = self.target_names.index(target)
+        return self.mean[:, idx], self.std[:, idx]
+
+
+@dataclass
+class PrescreenResult:
+    """Result of surrogate prescreening.
+
+    Attributes:
+        selected: Candidates to simulate, best first (ParameterSet instances,
+                  ready for generate_parametric_study_jobs(param_sets=...))
+        pruned: Candidates that cannot plausibly meet the targets
+        scores: Probability of meeting all targets, aligned with the input
+        prediction: Surrogate prediction for all input candidates
+    """
+    selected: List[ParameterSet]
+    pruned: List[ParameterSet]
+    scores: np.ndarray
+    prediction: SurrogatePrediction
+    summary: Dict[str, int] = field(default_factory=dict)
+
+
+class SurrogateModel:
+    """Surrogate model mapping sweep parameters to simulated properties."""
+
+    def __init__(
+        self,
+        model_type: str = 'gp',
+        parameter_names: Optional[Sequence[str]] = None,
+        random_state: int = 0
+    ):
+        """Initialize the surrogate.
+
+        Args:
+            model_type: 'gp', 'forest' or 'lightgbm'
+            parameter_names: Input parameter names (e.g. ['sphere.radius',
+                             'beam.thickness']). Inferred on fit if None.
+            random_state: Random seed for reproducible models
+        """
+        if model_type not in MODEL_TYPES:
+            raise ValueError(
+                f"Unknown surrogate model type '{model_type}'. "
+                f"Must be one of: {', '.join(MODEL_TYPES)}"
+            )
+        _require_sklearn()
+
+        self.model_type = model_type
+        self.parameter_names = list(parameter_names) if parameter_names else None
+        self.target_names: List[str] = []
+        self.random_state = random_state
+        self._scaler = None
+        self._models: List = []
+
+    @property
+    def is_fitted(self) -> bool:
+        """Whether the surrogate has been trained."""
+        return bool(self._models)
+
+    def _to_matrix(self, candidates: Sequence[ParameterLike]) -> np.ndarray:
+        """Convert candidates into an input matrix (n, n_parameters)."""
+        rows = []
+        for item in candidates:
+            params = _parameters_of(item)
+            try:
+                rows.append([float(params[name]) for name in self.parameter_names])
+            except KeyError as e:
+                raise KeyError(f"Candidate is missing parameter {e}") from e
+        return np.asarray(rows, dtype=float).reshape(len(rows), len(self.parameter_names))
+
+    def fit(
+        self,
+        candidates: Sequence[ParameterLike],
+        targets: Sequence[Mapping[str, float]],
+        target_names: Optional[Sequence[str]] = None
+    ) -> 'SurrogateModel':
+        """Train the surrogate on completed jobs.
+
+        Args:
+            candidates: Parameter sets (or parameter dicts) of completed jobs
+            targets: Simulated properties of each job, e.g.
+                     {'C11': ..., 'zener_ratio': ..., 'poisson_ratio': ...}
+            target_names: Properties to model (default: keys of first target)
+
+        Returns:
+            self
+        """
+        from sklearn.preprocessing import StandardScaler
+
+        if len(candidates) != len(targets):
+            raise ValueError(
+                f"Got {len(candidates)} parameter sets but {len(targets)} targets"
+            )
+        if len(candidates) < 2:
+            raise ValueError("At least 2 completed jobs are required to fit a surrogate")
+
+        if self.parameter_names is None:
+            first = _parameters_of(candidates[0])
+            # Only parameters that actually vary carry information
+            self.parameter_names = sorted(
+                name for name in first
+                if len({_parameters_of(c)[name] for c in candidates}) > 1
+            ) or sorted(first)
+        self.target_names = list(target_names or targets[0].keys())
+
+        X = self._to_matrix(candidates)
+        Y = np.asarray(
+            [[float(t[name]) for name in self.target_names] for t in targets],
+            dtype=float
+        )
+
+        self._scaler = StandardScaler().fit(X)
+        X_scaled = self._scaler.transform(X)
+
+        self._models = [self._fit_single(X_scaled, Y[:, j]) for j in range(Y.shape[1])]
+
+        _logger.info(
+            f"Trained {self.model_type} surrogate on {len(X)} jobs: "
+            f"{self.parameter_names} -> {self.target_names}"
+        )
+        return self
+
+    def fit_frame(
+        self,
+        df: 'pd.DataFrame',
+        parameter_columns: Sequence[str],
+        target_columns: Sequence[str]
+    ) -> 'SurrogateModel':
+        """Train the surrogate from a results DataFrame.
+
+        Args:
+            df: DataFrame with one row per completed job
+            parameter_columns: Parameter columns (e.g. 'sphere.radius')
+            target_columns: Property columns (e.g. 'C11', 'zener_ratio')
+
+        Returns:
+            self
+        """
+        clean = df.dropna(subset=list(parameter_columns) + list(target_columns))
+        self.parameter_names = list(parameter_columns)
+        candidates = clean[list(parameter_columns)].to_dict('records')
+        targets = clean[list(target_columns)].to_dict('records')
+        return self.fit(candidates, targets, target_names=target_columns)
+
+    def _fit_single(self, X: np.ndarray, y: np.ndarray):
+        """Fit the model for a single target property."""
+        if self.model_type == 'gp':
+            from sklearn.gaussian_process import GaussianProcessRegressor
+            from sklearn.gaussian_process.kernels import ConstantKernel, Matern, WhiteKernel
+
+            kernel = (
+                ConstantKernel(1.0) * Matern(length_scale=np.ones(X.shape[1]), nu=2.5)
+                + WhiteKernel(noise_level=1e-3)
+            )
+            model = GaussianProcessRegressor(
+                kernel=kernel,
+                normalize_y=True,
+                n_restarts_optimizer=2,
+                random_state=self.random_state
+            )
+            return model.fit(X, y)
+
+        if self.model_type == 'forest':
+            from sklearn.ensemble import RandomForestRegressor
+
+            model = RandomForestRegressor(
+                n_estimators=200,
+                min_samples_leaf=1,
+                random_state=self.random_state
+            )
+            return model.fit(X, y)
+
+        # LightGBM quantile models for the 16%, 50% and 84% quantiles
+        try:
+            import lightgbm as lgb
+        except ImportError as e:
+            raise ImportError(
+                "lightgbm is required for the 'lightgbm' surrogate. Install lightgbm."
+            ) from e
+
+        models = []
+        for alpha in (0.16, 0.5, 0.84):
+            model = lgb.LGBMRegressor(
+                objective='quantile',
+                alpha=alpha,
+                n_estimators=200,
+                min_child_samples=2,
+                random_state=self.random_state,
+                verbose=-1
+            )
+            models.append(model.fit(X, y))
+        return models
+
+    def _predict_single(self, model, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Predict (mean, std) for a single target property."""
+        if self.model_type == 'gp':
+            mean, std = model.predict(X, return_std=True)
+            return mean, std
+
+        if self.model_type == 'forest':
+            per_tree = np.stack([tree.predict(X) for tree in model.estimators_])
+            return per_tree.mean(axis=0), per_tree.std(axis=0)
+
+        low, median, high = (m.predict(X) for m in model)
+        return median, np.abs(high - low) / 2.0
+
+    def predict(self, candidates: Sequence[ParameterLike]) -> SurrogatePrediction:
+        """Predict properties of parameter sets that have not been run.
+
+        Args:
+            candidates: Parameter sets (or parameter dicts) to predict
+
+        Returns:
+            SurrogatePrediction with mean and std for every target
+        """
+        if not self.is_fitted:
+            raise RuntimeError("Surrogate not fitted. Call fit() first.")
+
+        n_targets = len(self.target_names)
+        if not candidates:
+            empty = np.empty((0, n_targets))
+            return SurrogatePrediction(list(self.target_names), empty, empty.copy())
+
+        X = self._scaler.transform(self._to_matrix(candidates))
+        means, stds = zip(*(self._predict_single(m, X) for m in self._models))
+
+        return SurrogatePrediction(
+            target_names=list(self.target_names),
+            mean=np.column_stack(means),
+            std=np.column_stack(stds)
+        )
+
+    def prescreen(
+        self,
+        candidates: Sequence[ParameterLike],
+        target_ranges: Mapping[str, Tuple[Optional[float], Optional[float]]],
+        kappa: float = 2.0,
+        max_candidates: Optional[int] = None
+    ) -> PrescreenResult:
+        """Rank and prune candidates against target property ranges.
+
+        A candidate is pruned when, for any target, even its optimistic
+        interval (mean +/- kappa * std) lies outside the target range. The
+        remaining candidates are ranked by the probability (under a normal
+        predictive distribution) of meeting all target ranges.
+
+        Args:
+            candidates: Parameter sets to screen (ParameterSet instances or
+                        plain mappings, which are wrapped in ParameterSets
+                        numbered by input position)
+            target_ranges: {target: (min, max)}; use None for an open bound,
+                           e.g. {'zener_ratio': (0.9, 1.1)}
+            kappa: Width of the optimistic interval in standard deviations
+            max_candidates: Keep at most this many of the best candidates
+
+        Returns:
+            PrescreenResult with selected (best first) and pruned candidates
+        """
+        unknown = set(target_ranges) - set(self.target_names)
+        if unknown:
+            raise KeyError(f"Surrogate does not model targets: {sorted(unknown)}")
+
+        prediction = self.predict(candidates)
+        n = len(candidates)
+        scores = np.ones(n)
+        feasible = np.ones(n, dtype=bool)
+
+        for target, (low, high) in target_ranges.items():
+            mean, std = prediction.get(target)
+            std = np.maximum(std, 1e-12)
+            low = -math.inf if low is None else low
+            high = math.inf if high is None else high
+
+            scores *= _normal_cdf((high - mean) / std) - _normal_cdf((low - mean) / std)
+            feasible &= (mean + kappa * std >= low) & (mean - kappa * std <= high)
+
+        order = [i for i in np.argsort(-scores, kind='stable') if feasible[i]]
+        if max_candidates is not None:
+            order = order[:max_candidates]
+        selected_idx = set(order)
+
+        parameter_sets = [_as_parameter_set(c, i) for i, c in enumerate(candidates)]
+        selected = [parameter_sets[i] for i in order]
+        pruned = [parameter_sets[i] for i in range(n) if i not in selected_idx]
+
+        summary = {
+            'num_candidates': n,
+            'num_selected': len(selected),
+            'num_pruned': len(pruned),
+        }
+        _logger.info(
+            f"Surrogate prescreening selected {len(selected)}/{n} candidates "
+            f"({len(pruned)} pruned)"
+        )
+
+        return PrescreenResult(
+            selected=selected,
+            pruned=pruned,
+            scores=scores,
+            prediction=prediction,
+            summary=summary
+        )
+
+
+def _normal_cdf(z: np.ndarray) -> np.ndarray:
+    """Standard normal CDF (vectorized)."""
+    from scipy.special import ndtr
+    return ndtr(z)
+
+
+def load_training_frame(
+    run_dirs: Union[Path, str, Sequence[Union[Path, str]]],
+    results: 'pd.DataFrame',
+    on: str = 'job_id',
+    mesh_size: Optional[int] = None
+) -> 'pd.DataFrame':
+    """Join applied parameters of completed jobs with their results.
+
+    Applied parameters are read from the run metadata (run-level table or
+    job sidecars) and exposed under their parameter names, e.g.
+    'sphere.radius', next to the result columns.
+
+    Args:
+        run_dirs: One or more run directories
+        results: DataFrame of analyzed results with a job identifier column
+                 and property columns (e.g. 'C11', 'zener_ratio')
+        on: Job identifier column shared by metadata and results
+        mesh_size: Only use jobs generated at this mesh size, so results
+                   of different fidelities are not mixed
+
+    Returns:
+        DataFrame with parameter and result columns (plus 'mesh_size'),
+        one row per job
+    """
+    import pandas as pd
+    from src.data.metadata_io import load_run_metadata
+
+    if isinstance(run_dirs, (str, Path)):
+        run_dirs = [run_dirs]
+
+    frames = []
+    for run_dir in run_dirs:
+        df = load_run_metadata(run_dir)
+        if df.empty:
+            continue
+        param_cols = {
+            col: col[len(_APPLIED_PARAMETER_PREFIX):]
+            for col in df.columns if col.startswith(_APPLIED_PARAMETER_PREFIX)
+        }
+        if 'mesh.size' in df.columns:
+            param_cols['mesh.size'] = 'mesh_size'
+            if mesh_size is not None:
+                df = df[df['mesh.size'] == mesh_size]
+        df = df[[on] + list(param_cols)].rename(columns=param_cols)
+        if 'run_id' in results.columns:
+            df['run_id'] = Path(run_dir).name
+        frames.append(df)
+
+    if not frames:
+        return pd.DataFrame()
+
+    params = pd.concat(frames, ignore_index=True)
+    keys = [on, 'run_id'] if 'run_id' in results.columns else [on]
+    return params.merge(results, on=keys, how='inner')
+
+
+__all__ = [
+    "MODEL_TYPES",
+    "SurrogateModel",
+    "SurrogatePrediction",
+    "PrescreenResult",
+    "load_training_frame",
+]
@@ -9,7 +9,7 @@ import yaml
 from pathlib import Path
 from typing import Union
 from pydantic import ValidationError
-from ..data.models.custom_lattice import CustomLatticeJob
+from ..data.models.custom_lattice import CustomLatticeJob, ParametricSweepGroup
 from ..validators import GeometryValidator, ValidationResult
 
 
@@ -201,9 +201,26 @@ def get_job_summary(job: CustomLatticeJob) -> str:
     ]
 
     for idx, sweep in enumerate(job.job.parametric.sweeps, 1):
+        if isinstance(sweep, ParametricSweepGroup):
+            lines.append(f"    Sweep {idx}: linked ({sweep.num_values} values)")
+            for member in sweep.zip:
+                lines.append(f"      {member.parameter}: {member.values}")
+            continue
         lines.append(
             f"    Sweep {idx}: {sweep.parameter} "
             f"({len(sweep.values)} values: {sweep.values})"
         )
 
+    sampling = job.job.parametric.sampling
+    if sampling is not None:
+        lines.append(
+            f"  Sampling: {sampling.method} ({sampling.num_samples} samples, seed={sampling.seed})"
+        )
+        for r in sampling.ranges:
+            scale = ", log" if r.log else ""
+            lines.append(f"    {r.parameter}: [{r.min}, {r.max}{scale}]")
+
+    for constraint in job.job.parametric.constraints:
+        lines.append(f"  Constraint: {constraint}")
+
     return "\n".join(lines)
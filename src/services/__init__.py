@@ -2,10 +2,29 @@
 
 This module provides services for generating, executing, and analyzing
 COMSOL simulation jobs.
+
+Exports are loaded lazily (PEP 562), so importing a single service such as
+src.services.batch_executor does not import Jinja2, the job models or the
+job generator.
 """
 
-from src.services.job_generator import JobGenerator, validate_parameters
-from src.services.batch_executor import BatchExecutor, BatchExecutionError, execute_job
+from typing import TYPE_CHECKING
+
+from src.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from src.services.batch_executor import BatchExecutionError, BatchExecutor, execute_job
+    from src.services.job_generator import JobGenerator, validate_parameters
+
+_EXPORTS = {
+    "JobGenerator": "src.services.job_generator",
+    "validate_parameters": "src.services.job_generator",
+    "BatchExecutor": "src.services.batch_executor",
+    "BatchExecutionError": "src.services.batch_executor",
+    "execute_job": "src.services.batch_executor",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "JobGenerator",
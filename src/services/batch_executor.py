@@ -11,8 +11,11 @@ from pathlib import Path
 from typing import Optional
 import time
 
-from src.config.loader import get_logger
+from src.config.loader import get_config_path_for_env, get_logger, load_config
+from src.services.event_log import EVENTS_FILENAME, EventLog
+from src.services.metrics import JobMetrics, get_job_metrics
 from src.utils.path_utils import detect_wsl, wsl_to_windows_path
+from src.utils.profiling import PROFILE_DIRNAME, profiled
 
 _logger = get_logger("services.batch_executor")
 
@@ -25,13 +28,35 @@ class BatchExecutionError(Exception):
 class BatchExecutor:
     """Execute Windows batch files from WSL/Linux."""
 
-    def __init__(self, timeout: int = 3600):
+    def __init__(
+        self,
+        timeout: int = 3600,
+        record_events: Optional[bool] = None,
+        profile: Optional[bool] = None,
+        metrics: Optional[JobMetrics] = None
+    ):
         """Initialize batch executor.
 
         Args:
             timeout: Default timeout in seconds (default: 1 hour)
+            record_events: Append per-stage execution timings to
+                           events.jsonl in the run directory (the parent
+                           of the job directory). Default: events.enabled
+                           from the job generator config
+            profile: Profile each execution and write the artifacts to
+                     <run_dir>/profile/execution_<job>.*.
+                     Default: ESP_PROFILE environment variable
+            metrics: Job metrics to update (running jobs, runtime and
+                     outcome). Default: the process-wide registry
+                     (see src.services.metrics)
         """
         self.default_timeout = timeout
+        if record_events is None:
+            config = load_config(get_config_path_for_env('job_generator'))
+            record_events = (config.get('events') or {}).get('enabled', False)
+        self.record_events = bool(record_events)
+        self.profile = profile
+        self.metrics = metrics if metrics is not None else get_job_metrics()
         self.is_wsl = detect_wsl()
         _logger.info(f"BatchExecutor initialized with timeout={timeout}s")
         _logger.info(f"WSL environment detected: {self.is_wsl}")
@@ -55,6 +80,23 @@ class BatchExecutor:
         except RuntimeError as e:
             raise BatchExecutionError(str(e)) from e
 
+    def job_event_log(self, batch_file: Path | str) -> EventLog:
+        """Event log for a job's batch file (disabled if not recorded).
+
+        Args:
+            batch_file: Path to the job's .bat file
+
+        Returns:
+            EventLog writing to events.jsonl in the run directory, with the
+            run and job IDs taken from the directory names (disabled if the
+            job directory is not a local directory, e.g. a Windows path)
+        """
+        job_dir = Path(batch_file).parent
+        run_dir = job_dir.parent
+        recorded = self.record_events and job_dir.is_dir()
+        path = run_dir / EVENTS_FILENAME if recorded else None
+        return EventLog(path, run_id=run_dir.name, job_id=job_dir.name)
+
     def execute_batch(
         self,
         batch_file: Path | str,
@@ -76,12 +118,34 @@ class BatchExecutor:
             subprocess.TimeoutExpired: If execution times out
         """
         timeout = timeout or self.default_timeout
+        events = self.job_event_log(batch_file)
+
+        # Profile artifacts go next to events.jsonl (local job directories only)
+        job_dir = Path(batch_file).parent
+        profile = self.profile if job_dir.is_dir() else False
+
+        with self.metrics.execution() as job, \
+                profiled(job_dir.parent / PROFILE_DIRNAME, f"execution_{job_dir.name}", profile), \
+                events, events.stage('execution'):
+            result = self._execute_batch(batch_file, timeout, convert_path, events)
+            if result.returncode != 0:
+                job['status'] = 'failed'
+            return result
 
+    def _execute_batch(
+        self,
+        batch_file: Path | str,
+        timeout: int,
+        convert_path: bool,
+        events: EventLog
+    ) -> subprocess.CompletedProcess:
+        """Execute a batch file, recording per-stage timings."""
         # Convert path if needed
-        if convert_path:
-            batch_file_str = self.convert_wsl_to_windows_path(batch_file)
-        else:
-            batch_file_str = str(batch_file)
+        with events.stage('convert_path', converted=convert_path):
+            if convert_path:
+                batch_file_str = self.convert_wsl_to_windows_path(batch_file)
+            else:
+                batch_file_str = str(batch_file)
 
         _logger.info(f"Executing batch file: {batch_file_str}")
         _logger.info(f"Timeout: {timeout}s")
@@ -111,28 +175,38 @@ class BatchExecutor:
 
             # Execute command with cwd set to batch file directory
             # Note: Windows cmd.exe output may be in cp932 (Shift-JIS)
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=False,  # Get bytes instead of text
-                timeout=timeout,
-                check=False,  # Don't raise on non-zero exit
-                cwd=cwd  # Set working directory (WSL path)
-            )
+            with events.stage('subprocess', timeout=timeout) as info:
+                result = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    text=False,  # Get bytes instead of text
+                    timeout=timeout,
+                    check=False,  # Don't raise on non-zero exit
+                    cwd=cwd  # Set working directory (WSL path)
+                )
+                info.update(
+                    returncode=result.returncode,
+                    stdout_bytes=len(result.stdout),
+                    stderr_bytes=len(result.stderr)
+                )
 
             # Decode output with fallback for Japanese Windows
-            try:
-                stdout = result.stdout.decode('utf-8')
-                stderr = result.stderr.decode('utf-8')
-            except UnicodeDecodeError:
-                # Try cp932 (Shift-JIS) for Japanese Windows
+            with events.stage('decode_output') as info:
                 try:
-                    stdout = result.stdout.decode('cp932')
-                    stderr = result.stderr.decode('cp932')
+                    stdout = result.stdout.decode('utf-8')
+                    stderr = result.stderr.decode('utf-8')
+                    info['encoding'] = 'utf-8'
                 except UnicodeDecodeError:
-                    # Fallback to latin-1 (never fails)
-                    stdout = result.stdout.decode('latin-1')
-                    stderr = result.stderr.decode('latin-1')
+                    # Try cp932 (Shift-JIS) for Japanese Windows
+                    try:
+                        stdout = result.stdout.decode('cp932')
+                        stderr = result.stderr.decode('cp932')
+                        info['encoding'] = 'cp932'
+                    except UnicodeDecodeError:
+                        # Fallback to latin-1 (never fails)
+                        stdout = result.stdout.decode('latin-1')
+                        stderr = result.stderr.decode('latin-1')
+                        info['encoding'] = 'latin-1'
 
             # Create a new CompletedProcess with decoded text
             result = subprocess.CompletedProcess(
@@ -0,0 +1,274 @@
+"""Structured JSONL event log with per-stage timings.
+
+JobGenerator and BatchExecutor append one JSON line per event to
+events.jsonl in the run directory: stage timings (geometry build,
+validation, render, file writes, batch execution, ...) with run and job
+IDs, durations and sizes. summarize_stages aggregates a run into per-stage
+p50/p95 latencies, which is where to look when deciding what to optimize
+next (see scripts/analyze_events.py).
+
+Example record:
+    {"ts": "2024-12-11T15:30:12.048213", "event": "stage", "stage": "render",
+     "run_id": "run_...", "job_id": "job_001", "duration_ms": 0.21,
+     "status": "ok", "bytes": 48213}
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from src.config.loader import get_logger
+from src.data.metadata_io import dump_metadata, parse_metadata
+
+_logger = get_logger("services.event_log")
+
+EVENTS_FILENAME = "events.jsonl"
+
+# Event types
+EVENT_STAGE = 'stage'
+
+
+class _EventFile:
+    """Append handle shared by an EventLog and the logs bound from it."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.file = None
+        self.failed = False
+
+    def write(self, line: bytes) -> bool:
+        """Append one line; False if the file cannot be written."""
+        with self.lock:
+            if self.failed:
+                return False
+            try:
+                if self.file is None:
+                    self.file = open(self.path, 'ab')
+                self.file.write(line)
+                self.file.flush()
+                return True
+            except OSError as e:
+                _logger.warning(f"Disabling event log {self.path}: {e}")
+                self.failed = True
+                self._close()
+                return False
+
+    def close(self) -> None:
+        with self.lock:
+            self._close()
+
+    def _close(self) -> None:
+        if self.file is not None:
+            try:
+                self.file.close()
+            except OSError:
+                pass
+            self.file = None
+
+
+class EventLog:
+    """Append-only JSONL event writer.
+
+    The file is opened on the first event and kept open until close(),
+    like RunManifest; each event is one write in append mode, flushed
+    immediately, so events from several threads or processes writing to
+    the same file do not interleave. Fields given to the constructor or
+    bind() (e.g. run_id, job_id) are added to every event. An EventLog
+    without a path is disabled and writes nothing.
+
+    Example:
+        >>> with EventLog(run_dir / EVENTS_FILENAME, run_id='run_001') as events:
+        ...     with events.bind(job_id='job_001').stage('render') as info:
+        ...         java = template.render(context)
+        ...         info['bytes'] = len(java)
+    """
+
+    def __init__(self, path: Optional[Path | str] = None, **fields: Any):
+        """Create an event log.
+
+        Args:
+            path: Path to the events file (created on first event), or None
+                  to disable the log
+            **fields: Fields added to every event
+        """
+        self._file = _EventFile(Path(path)) if path is not None else None
+        self.fields = fields
+
+    @property
+    def path(self) -> Optional[Path]:
+        """Events file, or None if the log is disabled."""
+        return self._file.path if self.enabled else None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether events are written."""
+        return self._file is not None and not self._file.failed
+
+    def bind(self, **fields: Any) -> 'EventLog':
+        """Event log writing to the same file with additional fields.
+
+        Args:
+            **fields: Fields added to every event of the returned log
+
+        Returns:
+            New EventLog sharing this log's open file
+        """
+        child = EventLog(None, **{**self.fields, **fields})
+        child._file = self._file
+        return child
+
+    def emit(self, event: str, **fields: Any) -> None:
+        """Append a single event as one JSON line.
+
+        Write errors are logged and disable the log instead of failing the
+        job that emitted the event.
+
+        Args:
+            event: Event type (e.g. 'stage')
+            **fields: Event fields
+        """
+        if not self.enabled:
+            return
+        record = {'ts': datetime.now().isoformat(), 'event': event, **self.fields, **fields}
+        self._file.write(dump_metadata(record, fmt='json') + b'\n')
+
+    def close(self) -> None:
+        """Close the events file (shared with bound logs; reopened on the next event)."""
+        if self._file is not None:
+            self._file.close()
+
+    def __enter__(self) -> 'EventLog':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    @contextmanager
+    def stage(self, name: str, **fields: Any) -> Iterator[Dict[str, Any]]:
+        """Time a stage and emit a 'stage' event when it ends.
+
+        The yielded dictionary can be updated with sizes or counts known
+        only at the end of the stage. A stage ending with an exception is
+        recorded with status 'error' and the exception type.
+
+        Args:
+            name: Stage name (e.g. 'render')
+            **fields: Additional event fields
+
+        Yields:
+            Dictionary of extra fields for the event
+        """
+        info: Dict[str, Any] = dict(fields)
+        status = 'ok'
+        start = time.perf_counter()
+        try:
+            yield info
+        except BaseException as e:
+            status = 'error'
+            info.setdefault('error', type(e).__name__)
+            raise
+        finally:
+            if self.enabled:
+                duration_ms = (time.perf_counter() - start) * 1000.0
+                self.emit(
+                    EVENT_STAGE,
+                    stage=name,
+                    duration_ms=round(duration_ms, 3),
+                    status=status,
+                    **info
+                )
+
+
+def read_events(
+    path: Path | str,
+    event: Optional[str] = None
+) -> Iterator[Dict[str, Any]]:
+    """Stream events from an events file.
+
+    Incomplete trailing lines (e.g. from an interrupted run) are skipped.
+
+    Args:
+        path: Events file, or run directory containing events.jsonl
+        event: Only yield events of this type (default: all)
+
+    Yields:
+        Events as dictionaries
+    """
+    path = Path(path)
+    if path.is_dir():
+        path = path / EVENTS_FILENAME
+
+    with open(path, 'rb') as f:
+        for line_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = parse_metadata(line, 'json')
+            except ValueError:
+                _logger.warning(f"Skipping unreadable event line {line_number} in {path}")
+                continue
+            if event is None or record.get('event') == event:
+                yield record
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    """Percentile with linear interpolation (numpy's default method)."""
+    position = (len(sorted_values) - 1) * q / 100.0
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    weight = position - lower
+    return sorted_values[lower] * (1.0 - weight) + sorted_values[upper] * weight
+
+
+def summarize_stages(
+    events: Path | str | Iterable[Dict[str, Any]]
+) -> Dict[str, Dict[str, Any]]:
+    """Aggregate stage durations per stage name.
+
+    Args:
+        events: Events file, run directory, or iterable of event records
+
+    Returns:
+        Dictionary mapping stage name (in order of first appearance) to
+        'count', 'errors', 'p50_ms', 'p95_ms', 'max_ms' and 'total_ms'
+    """
+    if isinstance(events, (str, Path)):
+        events = read_events(events, EVENT_STAGE)
+
+    durations: Dict[str, List[float]] = {}
+    errors: Dict[str, int] = {}
+    for record in events:
+        if record.get('event') != EVENT_STAGE:
+            continue
+        name = record['stage']
+        durations.setdefault(name, []).append(float(record['duration_ms']))
+        errors[name] = errors.get(name, 0) + (record.get('status') != 'ok')
+
+    summary = {}
+    for name, values in durations.items():
+        values.sort()
+        summary[name] = {
+            'count': len(values),
+            'errors': errors[name],
+            'p50_ms': _percentile(values, 50),
+            'p95_ms': _percentile(values, 95),
+            'max_ms': values[-1],
+            'total_ms': sum(values),
+        }
+    return summary
+
+
+__all__ = [
+    "EVENTS_FILENAME",
+    "EVENT_STAGE",
+    "EventLog",
+    "read_events",
+    "summarize_stages",
+]
@@ -10,6 +10,8 @@ from typing import List, Tuple, Dict
 from dataclasses import dataclass
 import copy
 
+import numpy as np
+
 from ..data.models.custom_lattice import (
     CustomLatticeJob,
     Geometry,
@@ -68,6 +70,38 @@ class GeometryData:
     lattice_constant: float
     unit_cell_size: List[float]
 
+    @property
+    def sphere_positions(self) -> np.ndarray:
+        """Sphere positions as an (n, 3) array."""
+        return np.array([s.position for s in self.spheres], dtype=float).reshape(-1, 3)
+
+    @property
+    def sphere_radii(self) -> np.ndarray:
+        """Sphere radii as an (n,) array."""
+        return np.array([s.radius for s in self.spheres], dtype=float)
+
+    @property
+    def sphere_labels(self) -> List[str]:
+        """Comment label per sphere (sphere_001, ...)."""
+        return [f"sphere_{s.id:03d}" for s in self.spheres]
+
+    @property
+    def beam_endpoints(self) -> np.ndarray:
+        """Beam endpoint indices into the sphere array as an (m, 2) array."""
+        return np.array(
+            [(b.endpoint1_index, b.endpoint2_index) for b in self.beams], dtype=int
+        ).reshape(-1, 2)
+
+    @property
+    def beam_thicknesses(self) -> np.ndarray:
+        """Beam thicknesses (diameters) as an (m,) array."""
+        return np.array([b.thickness for b in self.beams], dtype=float)
+
+    @property
+    def beam_labels(self) -> List[str]:
+        """Comment label per beam (beam_001, ...)."""
+        return [f"beam_{b.id:03d}" for b in self.beams]
+
 
 class GeometryBuilder:
     """Builds geometry data from job definition and parameters.
@@ -7,20 +7,50 @@ file and parametric study configurations.
 from __future__ import annotations
 
 import shutil
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 
-from jinja2 import Environment, FileSystemLoader, Template
+from jinja2 import Template
 
 from src.config.loader import get_logger, load_config, get_config_path_for_env
+from src.data.metadata_io import (
+    RUN_TABLE_FILENAME,
+    check_metadata_format,
+    write_metadata,
+    write_metadata_table,
+)
+from src.services.event_log import EVENTS_FILENAME, EventLog
+from src.services.metrics import JobMetrics, get_job_metrics
+from src.services.run_manifest import MANIFEST_FILENAME, RunManifest, read_manifest
+from src.services.template_cache import get_template_environment, resolve_cache_dir
+from src.services.template_certifier import (
+    TemplateCertifier,
+    representative_contexts,
+    template_fingerprint,
+)
+from src.services.template_splicer import SplicedTemplate
+from src.utils.ids import generate_id
 from src.utils.path_utils import detect_wsl, wsl_to_windows_path
-from src.validators.template_validator import validate_generated_java
+from src.utils.profiling import PROFILE_DIRNAME, profiled
+from src.validators.template_validator import (
+    ValidationChecks,
+    load_validation_checks,
+    quick_validate_java,
+    validate_generated_java,
+)
 
 _logger = get_logger("services.job_generator")
 
-# Load job generator configuration
-_config = load_config(get_config_path_for_env('job_generator'))
+
+def _get_config() -> Dict[str, Any]:
+    """Job generator configuration for the current environment.
+
+    Loaded on first use rather than at import time; load_config caches the
+    parsed file, so repeated calls are cheap and pick up edits.
+    """
+    return load_config(get_config_path_for_env('job_generator'))
 
 
 class JobGenerator:
@@ -31,7 +61,14 @@ class JobGenerator:
         template_dir: Path | str,
         output_base_dir: Path | str,
         num_cores: int = 4, # Default to 4 cores
-        save_mph: bool = True # Default to save mph files
+        save_mph: bool = True, # Default to save mph files
+        metadata_format: Optional[str] = None,
+        metadata_run_table: Optional[bool] = None,
+        template_cache_dir: Optional[Path | str] = None,
+        certify_templates: Optional[bool] = None,
+        record_events: Optional[bool] = None,
+        profile: Optional[bool] = None,
+        metrics: Optional[JobMetrics] = None
     ):
         """Initialize job generator.
 
@@ -41,41 +78,184 @@ class JobGenerator:
             output_base_dir: Base directory for job outputs
             num_cores: Number of CPU cores to use for COMSOL batch jobs
             save_mph: Whether to save .mph files after execution
+            metadata_format: Metadata file format ('yaml', 'json' or
+                             'msgpack'). Default: metadata.format from config
+            metadata_run_table: Whether to also write a run-level Parquet
+                                table of all job metadata.
+                                Default: metadata.run_table from config
+            template_cache_dir: Directory for compiled template bytecode.
+                                Default: template_cache section of config
+            certify_templates: Validate each template once against
+                               representative data instead of fully
+                               validating every job.
+                               Default: validation.certification from config
+            record_events: Write per-stage timings to events.jsonl in each
+                           run directory. Default: events.enabled from config
+            profile: Profile parametric study generation and write the
+                     artifacts to <run_dir>/profile/generation.*.
+                     Default: ESP_PROFILE environment variable
+            metrics: Job metrics to update (generated jobs and generation
+                     time). Default: the process-wide registry
+                     (see src.services.metrics)
         """
         self.template_dir = Path(template_dir)
         self.output_base_dir = Path(output_base_dir)
         self.num_cores = num_cores
         self.save_mph = save_mph
-
-        # Setup Jinja2 environment with custom delimiters from config
+        config = _get_config()
+
+        # Metadata output settings (explicit arguments override config)
+        metadata_config = config.get('metadata', {}) or {}
+        if metadata_format is None:
+            metadata_format = metadata_config.get('format', 'yaml')
+        if metadata_run_table is None:
+            metadata_run_table = metadata_config.get('run_table', False)
+        self.metadata_format = check_metadata_format(metadata_format)
+        self.metadata_run_table = bool(metadata_run_table)
+
+        # Shared Jinja2 environment with custom delimiters from config
         # This avoids conflicts with Java/C++ code syntax ({{, }})
-        jinja_config = _config['jinja2']
-        self.jinja_env = Environment(
-            loader=FileSystemLoader(str(self.template_dir)),
-            block_start_string=jinja_config['block_start_string'],
-            block_end_string=jinja_config['block_end_string'],
-            variable_start_string=jinja_config['variable_start_string'],
-            variable_end_string=jinja_config['variable_end_string'],
-            comment_start_string=jinja_config['comment_start_string'],
-            comment_end_string=jinja_config['comment_end_string'],
-            trim_blocks=jinja_config['trim_blocks'],
-            lstrip_blocks=jinja_config['lstrip_blocks'],
-            keep_trailing_newline=jinja_config['keep_trailing_newline']
+        # Compiled templates are cached on disk and shared across generators
+        if template_cache_dir is None:
+            template_cache_dir = resolve_cache_dir(config.get('template_cache'))
+        self.jinja_env = get_template_environment(
+            self.template_dir,
+            config['jinja2'],
+            cache_dir=template_cache_dir,
+            literal_config=config.get('java_literals')
         )
+        self._templates: Dict[str, Template] = {}
+        self._spliced_templates: Dict[str, SplicedTemplate] = {}
+
+        # Template certification (full validation once, cheap check per job)
+        certification_config = dict(config['validation'].get('certification') or {})
+        if certify_templates is not None:
+            certification_config['enabled'] = certify_templates
+        self.template_certifier: Optional[TemplateCertifier] = None
+        if certification_config.get('enabled', False):
+            self.template_certifier = TemplateCertifier(
+                resolve_cache_dir(certification_config)
+            )
+        # Template name -> (fingerprint, validation checks), resolved once per run
+        self._template_certificates: Dict[str, Tuple[str, ValidationChecks]] = {}
+
+        # Structured per-stage timings (see src.services.event_log)
+        if record_events is None:
+            record_events = (config.get('events') or {}).get('enabled', False)
+        self.record_events = bool(record_events)
+        self.profile = profile
+        self.metrics = metrics if metrics is not None else get_job_metrics()
 
         # Ensure output directory exists
         self.output_base_dir.mkdir(parents=True, exist_ok=True)
 
         _logger.info(f"JobGenerator initialized with template_dir={self.template_dir}")
 
+    def get_template(self, name: str) -> Template:
+        """Get a template, resolving it only once per generator.
+
+        Args:
+            name: Template file name relative to template_dir
+
+        Returns:
+            Compiled Jinja2 template
+        """
+        template = self._templates.get(name)
+        if template is None:
+            template = self.jinja_env.get_template(name)
+            self._templates[name] = template
+        return template
+
+    def get_spliced_template(self, name: str) -> SplicedTemplate:
+        """Get a template whose static skeleton is rendered once per generator.
+
+        Only the template's blocks are rendered per job; see
+        src.services.template_splicer.
+
+        Args:
+            name: Template file name relative to template_dir
+
+        Returns:
+            SplicedTemplate shared by all jobs of this generator
+        """
+        spliced = self._spliced_templates.get(name)
+        if spliced is None:
+            spliced = SplicedTemplate(self.get_template(name))
+            self._spliced_templates[name] = spliced
+        return spliced
+
+    def _is_template_certified(self, name: str, context: Dict[str, Any]) -> bool:
+        """Certify a template on first use; return whether it is certified.
+
+        Args:
+            name: Template file name relative to template_dir
+            context: Template variables of the current job (used to build
+                     representative data on first use)
+
+        Returns:
+            True if jobs rendered from this template only need a cheap check
+        """
+        if self.template_certifier is None:
+            return False
+        fingerprint, _ = self._template_certificate(name)
+        if self.template_certifier.is_certified(fingerprint):
+            return True
+        template = self.get_template(name)
+        return self.template_certifier.certify(
+            fingerprint,
+            lambda ctx: template.render(**ctx),
+            representative_contexts(context),
+            name=name
+        )
+
+    def _template_certificate(self, name: str) -> Tuple[str, ValidationChecks]:
+        """Fingerprint and validation checks of a template, from one config read.
+
+        Resolved on first use and kept until the next parametric run, so
+        the per-job quick check does not reload the config.
+
+        Args:
+            name: Template file name relative to template_dir
+
+        Returns:
+            (fingerprint, checks) for the current validation settings
+        """
+        certificate = self._template_certificates.get(name)
+        if certificate is None:
+            config = _get_config()
+            fingerprint = template_fingerprint(self.get_template(name), {
+                'jinja2': config['jinja2'],
+                'java_literals': config.get('java_literals'),
+                'validation': config['validation'],
+            })
+            certificate = (fingerprint, load_validation_checks(config))
+            self._template_certificates[name] = certificate
+        return certificate
+
+    def run_event_log(self, run_dir: Path, run_id: str) -> EventLog:
+        """Event log of a run (disabled if events are not recorded).
+
+        Args:
+            run_dir: Run directory
+            run_id: Run identifier added to every event
+
+        Returns:
+            EventLog writing to events.jsonl in the run directory
+        """
+        if not self.record_events:
+            return EventLog(None, run_id=run_id)
+        return EventLog(run_dir / EVENTS_FILENAME, run_id=run_id)
+
     def generate_job_id(self) -> str:
         """Generate unique job ID with timestamp.
 
+        IDs are unique across processes and hosts and sort chronologically
+        (see src.utils.ids).
+
         Returns:
-            Job ID in format: job_YYYYMMDD_HHMMSS
+            Job ID in format: job_YYYYMMDD_HHMMSS_<microseconds>_<node>
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        return f"job_{timestamp}"
+        return generate_id("job")
 
     def create_job_directory(self, job_id: str) -> Path:
         """Create job working directory.
@@ -85,9 +265,13 @@ class JobGenerator:
 
         Returns:
             Path to created job directory
+
+        Raises:
+            FileExistsError: If a job directory with this ID already exists
         """
         job_dir = self.output_base_dir / job_id
-        job_dir.mkdir(parents=True, exist_ok=True)
+        # Never reuse an existing job directory (would overwrite its files)
+        job_dir.mkdir(parents=True, exist_ok=False)
 
         # Create results subdirectory
         results_dir = job_dir / "results"
@@ -116,7 +300,7 @@ class JobGenerator:
         _logger.info(f"Generating Java file from template for job: {job_dir.name}")
 
         # Load template
-        template = self.jinja_env.get_template('simulation.java.j2')
+        template = self.get_template('simulation.java.j2')
 
         # Extract parameters with defaults
         lattice_constant = params.get('lattice_constant', params.get('lconst', 1.0))
@@ -197,7 +381,7 @@ class JobGenerator:
             save_mph = self.save_mph
 
         # Load template
-        template = self.jinja_env.get_template('run.bat.j2')
+        template = self.get_template('run.bat.j2')
 
         # Convert job_dir to Windows path if in WSL
         if detect_wsl():
@@ -316,7 +500,9 @@ class JobGenerator:
         job_id: Optional[str] = None,
         run_id: Optional[str] = None,
         param_set: Optional['ParameterSet'] = None,
-        save_mph: Optional[bool] = None
+        save_mph: Optional[bool] = None,
+        mesh_size: Optional[int] = None,
+        events: Optional[EventLog] = None
     ) -> Dict[str, Any]:
         """Generate job for custom lattice structure.
 
@@ -326,6 +512,11 @@ class JobGenerator:
             run_id: Optional run ID for grouping multiple jobs
             param_set: Optional parameter set to apply (for parametric sweeps)
             save_mph: Whether to save .mph files (default: use instance setting)
+            mesh_size: Override of mesh.size (COMSOL autoMeshSize, 1=finest,
+                       9=coarsest), used as the fidelity of multi-fidelity
+                       studies (default: use custom_job.mesh.size)
+            events: Event log of the run (default: events.jsonl in the
+                    run directory if events are recorded)
 
         Returns:
             Dictionary with paths to generated files and metadata
@@ -334,13 +525,17 @@ class JobGenerator:
 
         # Generate run ID if not provided (for grouping parametric sweep jobs)
         if run_id is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            run_id = f"run_{timestamp}"
+            run_id = generate_id("run")
 
         # Generate job ID if not provided
         if job_id is None:
             job_id = "job_001"
 
+        if mesh_size is None:
+            mesh_size = custom_job.mesh.size
+        elif not 1 <= mesh_size <= 9:
+            raise ValueError(f"Mesh size must be 1-9, got {mesh_size}")
+
         _logger.info(f"Generating custom lattice job: {run_id}/{job_id}")
 
         # Create run directory
@@ -351,31 +546,46 @@ class JobGenerator:
         job_dir = run_dir / job_id
         job_dir.mkdir(parents=True, exist_ok=True)
 
-        # Generate Java file from custom lattice template
-        java_file, geometry_data = self._generate_custom_lattice_java(
-            job_dir,
-            custom_job,
-            job_id,
-            param_set
-        )
+        owns_events = events is None
+        if owns_events:
+            events = self.run_event_log(run_dir, run_id)
+        events = events.bind(job_id=job_id)
 
-        # Generate batch file
-        batch_file = self.generate_batch_file(
-            job_dir,
-            java_file,
-            java_class_name=java_file.stem,
-            num_cores=self.num_cores,
-            save_mph=save_mph
-        )
+        try:
+            with self.metrics.generation(), events.stage('job'):
+                # Generate Java file from custom lattice template
+                java_file, geometry_data = self._generate_custom_lattice_java(
+                    job_dir,
+                    custom_job,
+                    job_id,
+                    param_set,
+                    mesh_size=mesh_size,
+                    events=events
+                )
 
-        # Generate metadata file for this job
-        metadata_file = self._generate_job_metadata(
-            job_dir,
-            custom_job,
-            job_id,
-            param_set,
-            geometry_data
-        )
+                # Generate batch file
+                with events.stage('batch_file'):
+                    batch_file = self.generate_batch_file(
+                        job_dir,
+                        java_file,
+                        java_class_name=java_file.stem,
+                        num_cores=self.num_cores,
+                        save_mph=save_mph
+                    )
+
+                # Generate metadata file for this job
+                with events.stage('metadata', format=self.metadata_format):
+                    metadata = self._build_job_metadata(
+                        custom_job,
+                        job_id,
+                        param_set,
+                        geometry_data,
+                        mesh_size=mesh_size
+                    )
+                    metadata_file = self._generate_job_metadata(job_dir, metadata)
+        finally:
+            if owns_events:
+                events.close()
 
         result = {
             'run_id': run_id,
@@ -384,7 +594,8 @@ class JobGenerator:
             'job_dir': job_dir,
             'java_file': java_file,
             'batch_file': batch_file,
-            'metadata_file': metadata_file
+            'metadata_file': metadata_file,
+            'metadata': metadata
         }
 
         _logger.info(f"Custom lattice job generation completed: {run_id}/{job_id}")
@@ -395,7 +606,9 @@ class JobGenerator:
         job_dir: Path,
         custom_job: 'CustomLatticeJob',
         job_id: str,
-        param_set: Optional['ParameterSet'] = None
+        param_set: Optional['ParameterSet'] = None,
+        mesh_size: Optional[int] = None,
+        events: Optional[EventLog] = None
     ) -> 'Tuple[Path, GeometryData]':
         """Generate Java file for custom lattice from template.
 
@@ -404,14 +617,19 @@ class JobGenerator:
             custom_job: CustomLatticeJob definition
             job_id: Job identifier
             param_set: Optional parameter set to apply (for parametric sweeps)
+            mesh_size: Optional mesh size override (default: custom_job.mesh.size)
+            events: Event log for per-stage timings (default: disabled)
 
         Returns:
             Tuple of (Path to generated Java file, GeometryData with calculated dimensions)
         """
         from ..services.geometry_builder import GeometryBuilder, ParameterSet
 
-        # Load custom lattice template
-        template = self.jinja_env.get_template('custom_lattice.java.j2')
+        if events is None:
+            events = EventLog(None)
+
+        # Load custom lattice template (static skeleton is rendered once)
+        template = self.get_spliced_template('custom_lattice.java.j2')
 
         # Prepare template variables
         class_name = job_id.replace('-', '_').replace('.', '_')
@@ -433,7 +651,9 @@ class JobGenerator:
             )
 
         # Apply parameters to geometry
-        geometry_data = builder.build_geometry_data(custom_job, param_set)
+        with events.stage('geometry_build') as info:
+            geometry_data = builder.build_geometry_data(custom_job, param_set)
+            info.update(spheres=len(geometry_data.spheres), beams=len(geometry_data.beams))
 
         # Validate geometry with applied parameters
         from ..validators.geometry_validator import GeometryValidator
@@ -463,8 +683,10 @@ class JobGenerator:
             ]
         )
 
-        validator = GeometryValidator()
-        validation_result = validator.validate(temp_geometry)
+        with events.stage('geometry_validation') as info:
+            validator = GeometryValidator()
+            validation_result = validator.validate(temp_geometry)
+            info['valid'] = validation_result.is_valid
 
         if not validation_result.is_valid:
             error_msg = validation_result.get_error_summary()
@@ -496,7 +718,7 @@ class JobGenerator:
             'poissons_ratio': first_material.poissons_ratio,
             'density': first_material.density,
             # Mesh
-            'mesh_size': custom_job.mesh.size,
+            'mesh_size': mesh_size if mesh_size is not None else custom_job.mesh.size,
             'mesh_type': custom_job.mesh.type,
             # Strain study
             'strain_delta': custom_job.study.strain.delta,
@@ -508,11 +730,24 @@ class JobGenerator:
             'geometry': geometry_data,
         }
 
-        # Render template
-        java_content = template.render(**template_vars)
-
-        # Validate rendered Java code
-        validation_result = validate_generated_java(java_content)
+        # Render per-job blocks into the static skeleton
+        with events.stage('render') as info:
+            java_content = template.render(template_vars)
+            info['bytes'] = len(java_content)
+
+        # Validate rendered Java code; a certified template only needs a
+        # cheap size/leftover check per job
+        certified = self._is_template_certified('custom_lattice.java.j2', template_vars)
+        with events.stage('java_validation', mode='quick' if certified else 'full') as info:
+            if certified:
+                validation_result = quick_validate_java(
+                    java_content,
+                    min_size=template.static_size(template_vars),
+                    checks=self._template_certificate('custom_lattice.java.j2')[1]
+                )
+            else:
+                validation_result = validate_generated_java(java_content)
+            info['valid'] = validation_result.is_valid
 
         if not validation_result.is_valid:
             _logger.error(f"Template validation failed:")
@@ -525,34 +760,33 @@ class JobGenerator:
 
         # Write Java file
         java_file_path = job_dir / f"{class_name}.java"
-        with open(java_file_path, 'w', encoding='utf-8') as f:
-            f.write(java_content)
+        with events.stage('write_java', bytes=len(java_content)):
+            with open(java_file_path, 'w', encoding='utf-8') as f:
+                f.write(java_content)
 
         _logger.info(f"Generated custom lattice Java file: {java_file_path}")
         return java_file_path, geometry_data
 
-    def _generate_job_metadata(
+    def _build_job_metadata(
         self,
-        job_dir: Path,
         custom_job: 'CustomLatticeJob',
         job_id: str,
         param_set: Optional['ParameterSet'] = None,
-        geometry_data: Optional['GeometryData'] = None
-    ) -> Path:
-        """Generate metadata YAML file for the job.
+        geometry_data: Optional['GeometryData'] = None,
+        mesh_size: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Build the metadata dictionary for a job.
 
         Args:
-            job_dir: Job directory
             custom_job: CustomLatticeJob definition
             job_id: Job identifier
             param_set: Optional parameter set that was applied
             geometry_data: Optional geometry data with calculated dimensions
+            mesh_size: Mesh size the job was generated with (its fidelity)
 
         Returns:
-            Path to metadata file
+            Metadata dictionary
         """
-        import yaml
-
         metadata = {
             'job_id': job_id,
             'job_name': custom_job.job.name,
@@ -564,6 +798,10 @@ class JobGenerator:
                 'lattice_constant': custom_job.geometry.lattice_constant,
             },
             'unit_cell_size': custom_job.job.unit_cell_size,
+            'mesh': {
+                'size': mesh_size if mesh_size is not None else custom_job.mesh.size,
+                'type': custom_job.mesh.type,
+            },
             'parametric': {
                 'defaults': custom_job.job.parametric.default,
             }
@@ -599,9 +837,23 @@ class JobGenerator:
                 }
             }
 
-        metadata_path = job_dir / "metadata.yml"
-        with open(metadata_path, 'w', encoding='utf-8') as f:
-            yaml.dump(metadata, f, default_flow_style=False, allow_unicode=True)
+        return metadata
+
+    def _generate_job_metadata(
+        self,
+        job_dir: Path,
+        metadata: Dict[str, Any]
+    ) -> Path:
+        """Write the metadata file for the job in the configured format.
+
+        Args:
+            job_dir: Job directory
+            metadata: Metadata dictionary from _build_job_metadata
+
+        Returns:
+            Path to metadata file
+        """
+        metadata_path = write_metadata(job_dir, metadata, fmt=self.metadata_format)
 
         _logger.info(f"Generated metadata file: {metadata_path}")
         return metadata_path
@@ -610,14 +862,29 @@ class JobGenerator:
         self,
         custom_job: 'CustomLatticeJob',
         run_id: Optional[str] = None,
-        save_mph: Optional[bool] = None
+        save_mph: Optional[bool] = None,
+        keep_job_results: bool = True,
+        param_sets: Optional[List['ParameterSet']] = None,
+        mesh_size: Optional[int] = None
     ) -> Dict[str, Any]:
         """Generate all jobs for a parametric study.
 
+        Every generated or skipped job is appended to the run manifest
+        (manifest.jsonl) as soon as it is produced, and the run metadata file
+        is written once at the end with summary counts only.
+
         Args:
             custom_job: CustomLatticeJob definition
             run_id: Optional run ID (auto-generated if None)
             save_mph: Whether to save .mph files (default: use instance setting)
+            keep_job_results: Whether to return every job's result dict in
+                              'jobs'. Disable for very large sweeps to keep
+                              memory flat; the manifest holds the same records.
+            param_sets: Parameter sets to generate instead of the full sweep,
+                        e.g. candidates selected by surrogate prescreening
+                        (see src.optimizers.surrogate)
+            mesh_size: Mesh size override applied to every job
+                       (default: custom_job.mesh.size)
 
         Returns:
             Dictionary with run information and list of generated jobs
@@ -626,8 +893,7 @@ class JobGenerator:
 
         # Generate run ID
         if run_id is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            run_id = f"run_{timestamp}"
+            run_id = generate_id("run")
 
         _logger.info(f"Generating parametric study: {run_id}")
 
@@ -635,79 +901,125 @@ class JobGenerator:
         run_dir = self.output_base_dir / run_id
         run_dir.mkdir(parents=True, exist_ok=True)
 
-        # Generate parameter sets
-        generator = ParametricGenerator(custom_job)
-        param_sets = generator.generate_parameter_sets()
-        sweep_info = generator.get_sweep_info()
-
-        _logger.info(f"Parametric study will generate {len(param_sets)} jobs")
-
-        # Generate run-level metadata
-        run_metadata = {
-            'run_id': run_id,
-            'job_name': custom_job.job.name,
-            'description': custom_job.job.description,
-            'generated_at': datetime.now().isoformat(),
-            'parametric_study': sweep_info,
-            'total_jobs': len(param_sets)
-        }
+        # Validation settings are resolved once per run
+        self._template_certificates.clear()
+
+        # Profile the whole generation, including parameter expansion
+        # (constraint evaluation, sampling) and the job loop
+        with profiled(run_dir / PROFILE_DIRNAME, 'generation', self.profile):
+            run_started = time.perf_counter()
+
+            # Generate parameter sets
+            generator = ParametricGenerator(custom_job)
+            sweep_info = generator.get_sweep_info()
+            if param_sets is None:
+                # Expanded lazily so memory does not grow with the sweep size
+                param_sets = generator.iter_parameter_sets()
+                total_param_sets = sweep_info['total_jobs']
+            else:
+                sweep_info['selected_parameter_sets'] = len(param_sets)
+                total_param_sets = len(param_sets)
+
+            _logger.info(f"Parametric study will generate {total_param_sets} jobs")
+            events = self.run_event_log(run_dir, run_id)
+
+            # Generate run-level metadata
+            run_metadata = {
+                'run_id': run_id,
+                'job_name': custom_job.job.name,
+                'description': custom_job.job.description,
+                'generated_at': datetime.now().isoformat(),
+                'parametric_study': sweep_info,
+                'total_jobs': total_param_sets,
+                'mesh_size': mesh_size if mesh_size is not None else custom_job.mesh.size,
+                'manifest': MANIFEST_FILENAME
+            }
 
-        run_metadata_path = run_dir / "metadata.yml"
-        import yaml
-        with open(run_metadata_path, 'w', encoding='utf-8') as f:
-            yaml.dump(run_metadata, f, default_flow_style=False, allow_unicode=True)
-
-        # Generate each job
-        # Use a counter for successful jobs only
-        jobs = []
-        skipped_jobs = []
-        successful_job_counter = 1
-
-        for i, param_set in enumerate(param_sets, 1):
-            try:
-                # Generate job with renumbered job_id based on successful jobs only
-                actual_job_id = f"job_{successful_job_counter:03d}"
-                result = self.generate_custom_lattice_job(
-                    custom_job,
-                    job_id=actual_job_id,
-                    run_id=run_id,
-                    param_set=param_set,
-                    save_mph=save_mph
+            # Generate each job, streaming records to the manifest
+            # Use a counter for successful jobs only
+            jobs = []
+            successful_job_counter = 1
+            manifest_path = run_dir / MANIFEST_FILENAME
+
+            with RunManifest(manifest_path) as manifest, events:
+                manifest.write_header(**run_metadata)
+
+                for i, param_set in enumerate(param_sets, 1):
+                    try:
+                        # Generate job with renumbered job_id based on successful jobs only
+                        actual_job_id = f"job_{successful_job_counter:03d}"
+                        result = self.generate_custom_lattice_job(
+                            custom_job,
+                            job_id=actual_job_id,
+                            run_id=run_id,
+                            param_set=param_set,
+                            save_mph=save_mph,
+                            mesh_size=mesh_size,
+                            events=events
+                        )
+                        result['parameter_set_index'] = i
+                        manifest.write_job({
+                            'job_id': actual_job_id,
+                            'parameter_set_index': i,
+                            'job_dir': result['job_dir'].name,
+                            'java_file': result['java_file'].name,
+                            'metadata_file': result['metadata_file'].name,
+                            'metadata': result['metadata']
+                        })
+                        if keep_job_results:
+                            jobs.append(result)
+                        _logger.info(f"Generated job {successful_job_counter}/{total_param_sets}: {actual_job_id}")
+                        successful_job_counter += 1  # Only increment on success
+                    except ValueError as e:
+                        # Skip jobs with validation errors - do not increment counter
+                        _logger.warning(f"Skipping parameter set {i} due to validation error: {e}")
+                        manifest.write_skipped({
+                            'parameter_set_index': i,
+                            'original_job_id': param_set.job_id,
+                            'error': str(e),
+                            'parameters': param_set.parameters
+                        })
+
+                jobs_generated = manifest.num_jobs
+                jobs_skipped = manifest.num_skipped
+                events.emit(
+                    'run_generated',
+                    duration_ms=round((time.perf_counter() - run_started) * 1000.0, 3),
+                    jobs_generated=jobs_generated,
+                    jobs_skipped=jobs_skipped
+                )
+                manifest.write_summary(
+                    jobs_generated=jobs_generated,
+                    jobs_skipped=jobs_skipped
                 )
-                jobs.append(result)
-                _logger.info(f"Generated job {successful_job_counter}/{len(param_sets)}: {actual_job_id}")
-                successful_job_counter += 1  # Only increment on success
-            except ValueError as e:
-                # Skip jobs with validation errors - do not increment counter
-                _logger.warning(f"Skipping parameter set {i} due to validation error: {e}")
-                skipped_jobs.append({
-                    'parameter_set_index': i,
-                    'original_job_id': param_set.job_id,
-                    'error': str(e),
-                    'parameters': param_set.parameters
-                })
 
         _logger.info(
             f"Parametric study generation completed: {run_id} "
-            f"({len(jobs)} jobs generated, {len(skipped_jobs)} jobs skipped)"
+            f"({jobs_generated} jobs generated, {jobs_skipped} jobs skipped)"
         )
 
         # Update run metadata with actual generated jobs
-        run_metadata['jobs_generated'] = len(jobs)
-        run_metadata['jobs_skipped'] = len(skipped_jobs)
-        if skipped_jobs:
-            run_metadata['skipped_jobs'] = skipped_jobs
+        # (skipped parameter sets and their errors are in the manifest)
+        run_metadata['jobs_generated'] = jobs_generated
+        run_metadata['jobs_skipped'] = jobs_skipped
+
+        # Write all job metadata as one table for bulk loading
+        if self.metadata_run_table and jobs_generated:
+            run_metadata['metadata_table'] = RUN_TABLE_FILENAME
+            write_metadata_table(
+                run_dir / RUN_TABLE_FILENAME,
+                (record['metadata'] for record in read_manifest(manifest_path, 'job'))
+            )
 
-        # Re-write metadata with updated counts
-        with open(run_metadata_path, 'w', encoding='utf-8') as f:
-            yaml.dump(run_metadata, f, default_flow_style=False, allow_unicode=True)
+        run_metadata_path = write_metadata(run_dir, run_metadata, fmt=self.metadata_format)
 
         return {
             'run_id': run_id,
             'run_dir': run_dir,
             'run_metadata': run_metadata_path,
-            'total_jobs': len(jobs),
-            'skipped_jobs': len(skipped_jobs),
+            'manifest': manifest_path,
+            'total_jobs': jobs_generated,
+            'skipped_jobs': jobs_skipped,
             'jobs': jobs
         }
 
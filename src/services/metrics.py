@@ -0,0 +1,565 @@
+"""In-process metrics with Prometheus text exposition.
+
+A small metrics registry (counters, gauges, histograms) updated by
+JobGenerator and BatchExecutor, so throughput and queue health of a long
+sweep can be watched without tailing log files. No external service or
+client library is required: the registry renders the Prometheus text
+format, which is served from a local HTTP endpoint or written to a
+textfile (e.g. for node_exporter's textfile collector)::
+
+    python scripts/execute_comsol_job.py -j jobs/comsol/run_... --metrics-port 9464
+    curl -s localhost:9464/metrics
+
+Job pipeline metrics (see JobMetrics):
+
+    esp_jobs_generated_total{status}      generated jobs ('ok' / 'error')
+    esp_job_generation_seconds{status}    generation time per job ('ok' / 'error')
+    esp_jobs_queued                       jobs waiting to be executed (set by
+                                          scripts/execute_comsol_job.py while
+                                          it runs a run directory)
+    esp_jobs_running                      jobs currently executing
+    esp_jobs_finished_total{status}       'succeeded', 'failed', 'timeout', 'error'
+    esp_job_runtime_seconds               execution time per job
+    esp_last_job_finished_timestamp_seconds
+    esp_cpu_count, esp_cpu_load_per_core  host cores and 1-minute load per core
+
+Generation rate and average runtime follow from the counters and
+histograms, e.g. ``rate(esp_jobs_generated_total[5m])`` and
+``esp_job_runtime_seconds_sum / esp_job_runtime_seconds_count``.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from src.config.loader import get_logger
+
+_logger = get_logger("services.metrics")
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Job runtimes range from seconds (small models) to many hours
+RUNTIME_BUCKETS = (1, 5, 15, 30, 60, 120, 300, 600, 1800, 3600, 7200, 14400, 28800, 86400)
+GENERATION_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class _Metric:
+    """Base class of a metric family with optional labels."""
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"Metric {self.name} expects labels {list(self.labelnames)}, "
+                f"got {sorted(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        """(sample name, formatted labels, value) for every series."""
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        """Exposition lines of this metric family."""
+        lines = [
+            f"# HELP {self.name} {_escape(self.help)}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        for sample_name, labels, value in self.samples():
+            lines.append(f"{sample_name}{labels} {_format_value(value)}")
+        return lines
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help_text, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        if not self.labelnames:
+            self._values[()] = 0.0
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase the counter.
+
+        Args:
+            amount: Non-negative increment
+            **labels: Label values
+        """
+        if amount < 0:
+            raise ValueError(f"Counter {self.name} cannot decrease")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Current value of one series."""
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [(self.name, _format_labels(self.labelnames, key), value) for key, value in items]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down, optionally computed on collection."""
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help_text, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._function: Optional[Callable[[], Optional[float]]] = None
+        if not self.labelnames:
+            self._values[()] = 0.0
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set the gauge to a value."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase the gauge."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        """Decrease the gauge."""
+        self.inc(-amount, **labels)
+
+    def set_function(self, function: Callable[[], Optional[float]]) -> None:
+        """Compute the (unlabelled) value when the registry is collected.
+
+        Args:
+            function: Callable returning the value, or None to omit the sample
+        """
+        self._function = function
+
+    def value(self, **labels: str) -> float:
+        """Current value of one series."""
+        if self._function is not None:
+            value = self._function()
+            return math.nan if value is None else float(value)
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        if self._function is not None:
+            try:
+                value = self._function()
+            except Exception as e:  # a broken callback must not break the exporter
+                _logger.debug(f"Gauge {self.name} callback failed: {e}")
+                value = None
+            return [] if value is None else [(self.name, "", float(value))]
+        with self._lock:
+            items = sorted(self._values.items())
+        return [(self.name, _format_labels(self.labelnames, key), value) for key, value in items]
+
+
+class Histogram(_Metric):
+    """Distribution of observations in cumulative buckets."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = GENERATION_BUCKETS
+    ):
+        super().__init__(name, help_text, labelnames)
+        if "le" in self.labelnames:
+            raise ValueError("'le' is reserved for histogram buckets")
+        self.buckets = tuple(sorted(float(b) for b in buckets if not math.isinf(b))) + (math.inf,)
+        # label values -> (bucket counts, sum)
+        self._series: Dict[LabelValues, Tuple[List[int], float]] = {}
+        if not self.labelnames:
+            self._series[()] = ([0] * len(self.buckets), 0.0)
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record an observation."""
+        key = self._key(labels)
+        with self._lock:
+            counts, total = self._series.get(key) or ([0] * len(self.buckets), 0.0)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            self._series[key] = (counts, total + value)
+
+    def count(self, **labels: str) -> int:
+        """Number of observations of one series."""
+        counts, _ = self._series.get(self._key(labels), ([], 0.0))
+        return sum(counts)
+
+    def sum(self, **labels: str) -> float:
+        """Sum of observations of one series."""
+        return self._series.get(self._key(labels), ([], 0.0))[1]
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        with self._lock:
+            items = sorted((key, (list(counts), total)) for key, (counts, total) in self._series.items())
+        samples = []
+        for key, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                labels = _format_labels(self.labelnames + ("le",), key + (_format_value(bound),))
+                samples.append((f"{self.name}_bucket", labels, cumulative))
+            labels = _format_labels(self.labelnames, key)
+            samples.append((f"{self.name}_sum", labels, total))
+            samples.append((f"{self.name}_count", labels, cumulative))
+        return samples
+
+
+class MetricsRegistry:
+    """Collection of metric families rendered together.
+
+    Metrics are created through counter(), gauge() and histogram(), which
+    return the existing metric when the name is already registered, so
+    several JobGenerator/BatchExecutor instances share the same series.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name: str, *args, **kwargs) -> _Metric:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args, **kwargs)
+            elif type(metric) is not cls:
+                raise ValueError(f"Metric {name} is already registered as a {metric.type_name}")
+            return metric
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Get or create a counter."""
+        return self._get_or_create(Counter, name, help_text, labelnames)
+
+    def gauge(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Get or create a gauge."""
+        return self._get_or_create(Gauge, name, help_text, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = GENERATION_BUCKETS
+    ) -> Histogram:
+        """Get or create a histogram."""
+        return self._get_or_create(Histogram, name, help_text, labelnames, buckets=buckets)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        """Registered metric by name."""
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: Path | str) -> Path:
+        """Atomically write the metrics to a .prom file.
+
+        The file is written next to the target and renamed over it, so
+        a collector never reads a partially written file.
+
+        Args:
+            path: Output file (e.g. node_exporter textfile directory/esp.prom)
+
+        Returns:
+            Path of the written file
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(self.render(), encoding="utf-8")
+        os.replace(tmp_path, path)
+        return path
+
+
+class MetricsExporter:
+    """Expose a registry over HTTP and/or as a periodically written textfile.
+
+    Example:
+        >>> with MetricsExporter(port=9464, textfile='metrics/esp.prom'):
+        ...     run_jobs()
+    """
+
+    def __init__(
+        self,
+        registry: Optional[MetricsRegistry] = None,
+        port: Optional[int] = None,
+        textfile: Optional[Path | str] = None,
+        host: str = "127.0.0.1",
+        interval: float = 15.0
+    ):
+        """Initialize the exporter.
+
+        Args:
+            registry: Registry to expose (default: the process-wide registry)
+            port: Serve /metrics on this port (0 picks a free port,
+                  None disables the HTTP endpoint)
+            textfile: Rewrite this file every interval and on stop
+                      (None disables the textfile)
+            host: Interface to bind; local only by default
+            interval: Seconds between textfile writes
+        """
+        self.registry = registry if registry is not None else REGISTRY
+        self.port = port
+        self.textfile = Path(textfile) if textfile is not None else None
+        self.host = host
+        self.interval = interval
+        self._server = None
+        self._threads: List[threading.Thread] = []
+        self._stop = threading.Event()
+
+    @property
+    def url(self) -> Optional[str]:
+        """URL of the metrics endpoint while serving."""
+        if self._server is None:
+            return None
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/metrics"
+
+    def start(self) -> 'MetricsExporter':
+        """Start the HTTP server and textfile writer threads."""
+        self._stop.clear()
+        if self.port is not None:
+            self._server = _make_server(self.registry, self.host, self.port)
+            thread = threading.Thread(target=self._server.serve_forever, name="metrics-http", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+            _logger.info(f"Serving metrics at {self.url}")
+        if self.textfile is not None:
+            thread = threading.Thread(target=self._write_loop, name="metrics-textfile", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+            _logger.info(f"Writing metrics to {self.textfile} every {self.interval:g}s")
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and write the textfile one last time."""
+        self._stop.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        if self.textfile is not None:
+            self._write_textfile()
+
+    def _write_textfile(self) -> None:
+        try:
+            self.registry.write_textfile(self.textfile)
+        except OSError as e:
+            _logger.warning(f"Could not write metrics to {self.textfile}: {e}")
+
+    def _write_loop(self) -> None:
+        while True:
+            self._write_textfile()
+            if self._stop.wait(self.interval):
+                return
+
+    def __enter__(self) -> 'MetricsExporter':
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+
+def _make_server(registry: MetricsRegistry, host: str, port: int):
+    """Threaded HTTP server answering GET /metrics."""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            body = registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            _logger.debug(f"metrics request: {format % args}")
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    return server
+
+
+def _load_per_core() -> Optional[float]:
+    try:
+        return os.getloadavg()[0] / (os.cpu_count() or 1)
+    except (AttributeError, OSError):  # not available on Windows
+        return None
+
+
+class JobMetrics:
+    """Job pipeline metrics registered on a registry.
+
+    Example:
+        >>> metrics = JobMetrics()
+        >>> with metrics.generation():
+        ...     generate_job()
+        >>> with metrics.execution() as job:
+        ...     result = run_batch()
+        ...     job['status'] = 'succeeded' if result.returncode == 0 else 'failed'
+    """
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None):
+        """Register the job metrics.
+
+        Args:
+            registry: Registry to use (default: the process-wide registry)
+        """
+        self.registry = registry if registry is not None else REGISTRY
+        r = self.registry
+        self.jobs_generated = r.counter(
+            "esp_jobs_generated_total", "Jobs generated", ["status"])
+        self.generation_seconds = r.histogram(
+            "esp_job_generation_seconds", "Time to generate one job", ["status"],
+            buckets=GENERATION_BUCKETS)
+        # Set by the caller that owns the queue (scripts/execute_comsol_job.py);
+        # BatchExecutor runs one job at a time and does not see the queue
+        self.jobs_queued = r.gauge(
+            "esp_jobs_queued", "Jobs waiting to be executed")
+        self.jobs_running = r.gauge(
+            "esp_jobs_running", "Jobs currently executing")
+        self.jobs_finished = r.counter(
+            "esp_jobs_finished_total", "Executed jobs by outcome", ["status"])
+        self.runtime_seconds = r.histogram(
+            "esp_job_runtime_seconds", "Wall-clock execution time of one job",
+            buckets=RUNTIME_BUCKETS)
+        self.last_finished = r.gauge(
+            "esp_last_job_finished_timestamp_seconds", "Unix time the last job finished")
+        r.gauge("esp_cpu_count", "Logical CPU cores of the host").set_function(os.cpu_count)
+        r.gauge(
+            "esp_cpu_load_per_core", "1-minute load average divided by the number of cores"
+        ).set_function(_load_per_core)
+
+    @contextmanager
+    def generation(self) -> Iterator[None]:
+        """Count and time the generation of one job.
+
+        Jobs that raise (e.g. skipped for invalid geometry) are recorded
+        with status 'error', including the time spent on them.
+        """
+        status = "ok"
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            status = "error"
+            raise
+        finally:
+            self.generation_seconds.observe(time.perf_counter() - start, status=status)
+            self.jobs_generated.inc(status=status)
+
+    @contextmanager
+    def execution(self) -> Iterator[Dict[str, str]]:
+        """Track one running job and record its runtime and outcome.
+
+        The yielded dictionary's 'status' ('succeeded' by default) is set by
+        the caller; a TimeoutExpired is recorded as 'timeout' and any other
+        exception as 'error'.
+
+        Yields:
+            Dictionary holding the job's 'status'
+        """
+        job = {"status": "succeeded"}
+        self.jobs_running.inc()
+        start = time.perf_counter()
+        try:
+            yield job
+        except BaseException as e:
+            job["status"] = "timeout" if type(e).__name__ == "TimeoutExpired" else "error"
+            raise
+        finally:
+            self.jobs_running.dec()
+            self.runtime_seconds.observe(time.perf_counter() - start)
+            self.jobs_finished.inc(status=job["status"])
+            self.last_finished.set(time.time())
+
+
+# Process-wide registry shared by the services and exporters
+REGISTRY = MetricsRegistry()
+
+_job_metrics: Optional[JobMetrics] = None
+_job_metrics_lock = threading.Lock()
+
+
+def get_job_metrics() -> JobMetrics:
+    """Job metrics on the process-wide registry."""
+    global _job_metrics
+    if _job_metrics is None:
+        with _job_metrics_lock:
+            if _job_metrics is None:
+                _job_metrics = JobMetrics(REGISTRY)
+    return _job_metrics
+
+
+__all__ = [
+    "CONTENT_TYPE",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "JobMetrics",
+    "MetricsExporter",
+    "MetricsRegistry",
+    "REGISTRY",
+    "get_job_metrics",
+]
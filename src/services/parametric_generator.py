@@ -1,13 +1,25 @@
 """Parametric sweep generator for custom lattice jobs.
 
 This module generates all combinations of parametric sweep values
-and creates individual parameter sets for each job.
+(and space-filling samples over parameter ranges) and creates
+individual parameter sets for each job.
 """
 
-from typing import List, Dict, Tuple
+import math
+import warnings
+from typing import Dict, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
 from itertools import product
-from ..data.models.custom_lattice import CustomLatticeJob, ParametricSweep
+
+import numpy as np
+
+from ..data.models.custom_lattice import (
+    CustomLatticeJob,
+    ParametricSampling,
+    ParametricSweep,
+    ParametricSweepGroup,
+)
+from ..utils.expressions import compile_expression
 
 
 @dataclass
@@ -29,6 +41,10 @@ class ParametricGenerator:
 
     This class takes a CustomLatticeJob definition and expands
     the parametric sweeps into individual parameter sets for each job.
+
+    Each sweep, each linked sweep group, and the optional space-filling
+    sampling design forms one axis: a list of parameter names and a list
+    of value rows. Parameter sets are the Cartesian product of all axes.
     """
 
     def __init__(self, job: CustomLatticeJob):
@@ -40,6 +56,82 @@ class ParametricGenerator:
         self.job = job
         self.default_params = job.job.parametric.default
         self.sweeps = job.job.parametric.sweeps or []
+        self.sampling = job.job.parametric.sampling
+        self.constraints = [
+            compile_expression(c) for c in job.job.parametric.constraints
+        ]
+        # Drawn once, so sweep info and parameter sets describe the same
+        # design even without a seed
+        self._sample_points: Optional[List[List[float]]] = None
+
+    def _get_axes(self) -> List[Tuple[List[str], List[List[float]]]]:
+        """Get all axes of the parametric study.
+
+        Returns:
+            List of (parameter names, value rows) tuples, sweeps first
+        """
+        axes = []
+        for sweep in self.sweeps:
+            if isinstance(sweep, ParametricSweepGroup):
+                rows = [list(row) for row in zip(*(member.values for member in sweep.zip))]
+                axes.append((sweep.parameters, rows))
+            else:
+                axes.append(([sweep.parameter], [[value] for value in sweep.values]))
+        if self.sampling is not None:
+            names = [r.parameter for r in self.sampling.ranges]
+            if self._sample_points is None:
+                self._sample_points = generate_sample_points(self.sampling)
+            axes.append((names, self._sample_points))
+        return axes
+
+    def _get_feasible_mask(
+        self,
+        axes: List[Tuple[List[str], List[List[float]]]]
+    ) -> np.ndarray:
+        """Evaluate the constraints over the whole grid.
+
+        Every parameter becomes an array laid along its own axis and NumPy
+        broadcasts the expressions, so infeasible combinations are never
+        enumerated.
+
+        Args:
+            axes: Axes from _get_axes
+
+        Returns:
+            Boolean array with one dimension per axis, True where all
+            constraints hold
+        """
+        shape = tuple(len(rows) for _, rows in axes)
+        values = dict(self.default_params)
+        for axis, (names, rows) in enumerate(axes):
+            axis_shape = [1] * len(shape)
+            axis_shape[axis] = len(rows)
+            for j, name in enumerate(names):
+                values[name] = np.asarray([row[j] for row in rows], dtype=float).reshape(axis_shape)
+
+        mask = np.ones(shape, dtype=bool)
+        for constraint in self.constraints:
+            mask &= np.broadcast_to(np.asarray(constraint.evaluate(values), dtype=bool), shape)
+        return mask
+
+    def _get_feasible_indices(
+        self,
+        axes: List[Tuple[List[str], List[List[float]]]]
+    ) -> Iterator[Tuple[int, ...]]:
+        """Yield row indices of all combinations that satisfy the constraints.
+
+        Args:
+            axes: Axes from _get_axes
+
+        Yields:
+            Index tuples (one index per axis) in Cartesian product order
+        """
+        if not self.constraints:
+            yield from product(*[range(len(rows)) for _, rows in axes])
+            return
+
+        for idx in np.argwhere(self._get_feasible_mask(axes)):
+            yield tuple(int(i) for i in idx)
 
     def generate_parameter_sets(self) -> List[ParameterSet]:
         """Generate all parameter set combinations.
@@ -51,50 +143,55 @@ class ParametricGenerator:
             If sweep1 has 3 values and sweep2 has 2 values,
             this will return 6 ParameterSet objects (3 × 2)
         """
-        if not self.sweeps:
-            # No sweeps defined - return single parameter set with defaults
-            return [ParameterSet(
+        return list(self.iter_parameter_sets())
+
+    def iter_parameter_sets(self) -> Iterator[ParameterSet]:
+        """Yield parameter set combinations one at a time.
+
+        Same sets and order as generate_parameter_sets, without holding
+        the whole sweep in memory.
+
+        Yields:
+            ParameterSet objects, one for each job to be created
+        """
+        axes = self._get_axes()
+
+        if not axes:
+            # No sweeps defined - single parameter set with defaults
+            yield ParameterSet(
                 job_id="job_001",
                 parameters=self.default_params.copy(),
                 sweep_indices=()
-            )]
-
-        # Get all sweep values
-        sweep_values = [sweep.values for sweep in self.sweeps]
-        sweep_params = [sweep.parameter for sweep in self.sweeps]
+            )
+            return
 
-        # Generate all combinations using Cartesian product
-        parameter_sets = []
+        # Generate all feasible combinations in Cartesian product order
         job_counter = 1
 
-        for indices_tuple in product(*[range(len(vals)) for vals in sweep_values]):
+        for indices_tuple in self._get_feasible_indices(axes):
             # Start with default parameters
             params = self.default_params.copy()
 
-            # Override with sweep values
-            for sweep_idx, value_idx in enumerate(indices_tuple):
-                param_name = sweep_params[sweep_idx]
-                param_value = sweep_values[sweep_idx][value_idx]
-                params[param_name] = param_value
+            # Override with sweep (or sampled) values
+            for (names, rows), row_idx in zip(axes, indices_tuple):
+                params.update(zip(names, rows[row_idx]))
 
             # Create parameter set
             job_id = f"job_{job_counter:03d}"
-            parameter_sets.append(ParameterSet(
+            yield ParameterSet(
                 job_id=job_id,
                 parameters=params,
                 sweep_indices=indices_tuple
-            ))
+            )
             job_counter += 1
 
-        return parameter_sets
-
     def get_sweep_info(self) -> Dict[str, any]:
         """Get information about the parametric sweeps.
 
         Returns:
             Dictionary with sweep statistics and information
         """
-        if not self.sweeps:
+        if not self.sweeps and self.sampling is None:
             return {
                 'num_sweeps': 0,
                 'total_jobs': 1,
@@ -105,20 +202,48 @@ class ParametricGenerator:
         total_jobs = 1
 
         for sweep in self.sweeps:
-            num_values = len(sweep.values)
+            if isinstance(sweep, ParametricSweepGroup):
+                num_values = sweep.num_values
+                sweep_dimensions.append({
+                    'parameter': ', '.join(sweep.parameters),
+                    'parameters': sweep.parameters,
+                    'linked': True,
+                    'num_values': num_values,
+                    'values': {member.parameter: member.values for member in sweep.zip}
+                })
+            else:
+                num_values = len(sweep.values)
+                sweep_dimensions.append({
+                    'parameter': sweep.parameter,
+                    'num_values': num_values,
+                    'values': sweep.values
+                })
             total_jobs *= num_values
-            sweep_dimensions.append({
-                'parameter': sweep.parameter,
-                'num_values': num_values,
-                'values': sweep.values
-            })
 
-        return {
+        info = {
             'num_sweeps': len(self.sweeps),
             'total_jobs': total_jobs,
             'sweep_dimensions': sweep_dimensions
         }
 
+        if self.sampling is not None:
+            info['total_jobs'] = total_jobs * self.sampling.num_samples
+            info['sampling'] = {
+                'method': self.sampling.method,
+                'num_samples': self.sampling.num_samples,
+                'seed': self.sampling.seed,
+                'ranges': [r.model_dump() for r in self.sampling.ranges]
+            }
+
+        if self.constraints:
+            feasible = int(np.count_nonzero(self._get_feasible_mask(self._get_axes())))
+            info['constraints'] = [c.source for c in self.constraints]
+            info['total_combinations'] = info['total_jobs']
+            info['pruned_by_constraints'] = info['total_jobs'] - feasible
+            info['total_jobs'] = feasible
+
+        return info
+
     def apply_parameters_to_geometry(
         self,
         param_set: ParameterSet
@@ -199,6 +324,49 @@ class ParametricGenerator:
         return new_job
 
 
+def generate_sample_points(sampling: ParametricSampling) -> List[List[float]]:
+    """Generate a space-filling design over parameter ranges.
+
+    Args:
+        sampling: Sampling definition (method, sample count, seed, ranges)
+
+    Returns:
+        List of value rows, one per sample, ordered like sampling.ranges
+    """
+    try:
+        from scipy.stats import qmc
+    except ImportError as e:
+        raise ImportError(
+            "scipy is required for space-filling sampling. Install scipy."
+        ) from e
+
+    dim = len(sampling.ranges)
+    rng = np.random.default_rng(sampling.seed)
+
+    if sampling.method == 'lhs':
+        sampler = qmc.LatinHypercube(dim, seed=rng)
+    elif sampling.method == 'sobol':
+        sampler = qmc.Sobol(dim, scramble=sampling.scramble, seed=rng)
+    else:
+        sampler = qmc.Halton(dim, scramble=sampling.scramble, seed=rng)
+
+    with warnings.catch_warnings():
+        # Sobol warns when num_samples is not a power of 2
+        warnings.simplefilter('ignore', UserWarning)
+        unit = sampler.random(sampling.num_samples)
+
+    points = np.empty_like(unit)
+    for j, r in enumerate(sampling.ranges):
+        if r.log:
+            low, high = math.log(r.min), math.log(r.max)
+            points[:, j] = np.exp(low + unit[:, j] * (high - low))
+        else:
+            points[:, j] = r.min + unit[:, j] * (r.max - r.min)
+
+    # Round to keep job metadata readable; far below geometric tolerances
+    return np.round(points, 6).tolist()
+
+
 def generate_all_jobs(job: CustomLatticeJob) -> List[Tuple[str, CustomLatticeJob]]:
     """Generate all job variations from parametric sweeps.
 
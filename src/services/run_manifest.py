@@ -0,0 +1,171 @@
+"""Line-oriented (JSONL) manifest for parametric study runs.
+
+Each generated or skipped job is appended to the run manifest as soon as it
+is produced, so memory stays flat regardless of sweep size and an
+interrupted run still leaves a readable record of everything generated so
+far. The manifest starts with a 'run' header record and ends with a small
+'summary' footer record once generation completes.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from src.config.loader import get_logger
+from src.data.metadata_io import dump_metadata, parse_metadata
+
+_logger = get_logger("services.run_manifest")
+
+MANIFEST_FILENAME = "manifest.jsonl"
+
+# Record types written to the manifest
+RECORD_RUN = 'run'
+RECORD_JOB = 'job'
+RECORD_SKIPPED = 'skipped'
+RECORD_SUMMARY = 'summary'
+
+
+class RunManifest:
+    """Append-only JSONL manifest writer for one run.
+
+    Records are flushed after each write so that readers (and partial runs)
+    always see complete lines.
+
+    Example:
+        >>> with RunManifest(run_dir / MANIFEST_FILENAME) as manifest:
+        ...     manifest.write_header(run_id='run_001', total_jobs=6)
+        ...     manifest.write_job({'job_id': 'job_001'})
+        ...     manifest.write_summary(jobs_generated=1, jobs_skipped=0)
+    """
+
+    def __init__(self, path: Path | str):
+        """Open the manifest for appending.
+
+        Args:
+            path: Path to the manifest file (created if missing)
+        """
+        self.path = Path(path)
+        self._file = open(self.path, 'ab')
+        self.num_jobs = 0
+        self.num_skipped = 0
+
+    def write_record(self, record_type: str, record: Dict[str, Any]) -> None:
+        """Append a single record as one JSON line.
+
+        Args:
+            record_type: Record type ('run', 'job', 'skipped', 'summary')
+            record: Record fields
+        """
+        line = dump_metadata({'type': record_type, **record}, fmt='json')
+        self._file.write(line + b'\n')
+        self._file.flush()
+
+    def write_header(self, **fields: Any) -> None:
+        """Start the manifest with the run header record.
+
+        A header begins a new run, so any records from a previous
+        generation into the same run directory (e.g. a re-run with the
+        same run_id) are discarded.
+        """
+        self._file.truncate(0)
+        self.num_jobs = 0
+        self.num_skipped = 0
+        self.write_record(RECORD_RUN, fields)
+
+    def write_job(self, record: Dict[str, Any]) -> None:
+        """Append a generated job record."""
+        self.write_record(RECORD_JOB, record)
+        self.num_jobs += 1
+
+    def write_skipped(self, record: Dict[str, Any]) -> None:
+        """Append a skipped parameter set record."""
+        self.write_record(RECORD_SKIPPED, record)
+        self.num_skipped += 1
+
+    def write_summary(self, **fields: Any) -> None:
+        """Append the summary footer record."""
+        fields.setdefault('completed_at', datetime.now().isoformat())
+        self.write_record(RECORD_SUMMARY, fields)
+
+    def close(self) -> None:
+        """Close the manifest file."""
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self) -> 'RunManifest':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def read_manifest(
+    path: Path | str,
+    record_type: Optional[str] = None
+) -> Iterator[Dict[str, Any]]:
+    """Stream records from a run manifest.
+
+    Incomplete trailing lines (e.g. from an interrupted run) are skipped.
+
+    Args:
+        path: Manifest file, or run directory containing manifest.jsonl
+        record_type: Only yield records of this type (default: all)
+
+    Yields:
+        Manifest records as dictionaries
+    """
+    path = Path(path)
+    if path.is_dir():
+        path = path / MANIFEST_FILENAME
+
+    with open(path, 'rb') as f:
+        for line_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = parse_metadata(line, 'json')
+            except ValueError:
+                _logger.warning(f"Skipping unreadable manifest line {line_number} in {path}")
+                continue
+            if record_type is None or record.get('type') == record_type:
+                yield record
+
+
+def summarize_manifest(path: Path | str) -> Dict[str, Any]:
+    """Summarize a manifest, including runs that did not finish.
+
+    Args:
+        path: Manifest file, or run directory containing manifest.jsonl
+
+    Returns:
+        Dictionary with 'jobs_generated', 'jobs_skipped', 'completed' and,
+        if present, the header ('run') and footer ('summary') records
+    """
+    summary: Dict[str, Any] = {
+        'jobs_generated': 0,
+        'jobs_skipped': 0,
+        'completed': False,
+    }
+    for record in read_manifest(path):
+        record_type = record.get('type')
+        if record_type == RECORD_JOB:
+            summary['jobs_generated'] += 1
+        elif record_type == RECORD_SKIPPED:
+            summary['jobs_skipped'] += 1
+        elif record_type == RECORD_RUN:
+            summary['run'] = record
+        elif record_type == RECORD_SUMMARY:
+            summary['summary'] = record
+            summary['completed'] = True
+    return summary
+
+
+__all__ = [
+    "MANIFEST_FILENAME",
+    "RunManifest",
+    "read_manifest",
+    "summarize_manifest",
+]
@@ -0,0 +1,140 @@
+"""Shared Jinja2 environments with a persistent compiled-template cache.
+
+Compiling custom_lattice.java.j2 (~1,600 lines) from source dominates the
+start-up cost of job generation. Environments are therefore shared per
+(template directory, Jinja2 settings) within a process, and compiled
+template bytecode is stored on disk with Jinja2's FileSystemBytecodeCache
+so that new processes (CLI invocations, worker processes) skip compilation.
+
+Cache entries are keyed by template name and source checksum, so an edited
+template is recompiled automatically; FileSystemLoader additionally checks
+the template mtime before reusing an in-memory compiled template.
+"""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+from src.config.loader import get_logger
+from src.utils.java_literals import java_literal_filters
+
+_logger = get_logger("services.template_cache")
+
+# Project root (src/services/template_cache.py -> project root)
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+# Jinja2 Environment options read from the 'jinja2' config section
+_ENVIRONMENT_OPTIONS = (
+    'block_start_string',
+    'block_end_string',
+    'variable_start_string',
+    'variable_end_string',
+    'comment_start_string',
+    'comment_end_string',
+    'trim_blocks',
+    'lstrip_blocks',
+    'keep_trailing_newline',
+)
+
+_environments: Dict[Tuple, Environment] = {}
+_lock = threading.Lock()
+
+
+def resolve_cache_dir(cache_config: Optional[Mapping[str, Any]]) -> Optional[Path]:
+    """Resolve the bytecode cache directory from the 'template_cache' config.
+
+    Args:
+        cache_config: Config section with 'enabled' and 'dir' keys. Relative
+                      directories are resolved against the project root.
+
+    Returns:
+        Cache directory, or None if caching is disabled
+    """
+    cache_config = cache_config or {}
+    if not cache_config.get('enabled', False):
+        return None
+    cache_dir = Path(cache_config.get('dir', '.cache/jinja2'))
+    if not cache_dir.is_absolute():
+        cache_dir = _PROJECT_ROOT / cache_dir
+    return cache_dir
+
+
+def get_template_environment(
+    template_dir: Path | str,
+    jinja_config: Mapping[str, Any],
+    cache_dir: Optional[Path | str] = None,
+    literal_config: Optional[Mapping[str, Any]] = None
+) -> Environment:
+    """Get the shared Jinja2 Environment for a template directory.
+
+    The environment provides the Java array literal filters of
+    src.utils.java_literals (java_doubles, java_rows).
+
+    Args:
+        template_dir: Directory containing Jinja2 templates
+        jinja_config: The 'jinja2' config section (custom delimiters etc.)
+        cache_dir: Directory for compiled template bytecode (None: no disk cache)
+        literal_config: The 'java_literals' config section
+                        (precision, max_line_length)
+
+    Returns:
+        Environment shared by all callers with the same arguments
+    """
+    template_dir = Path(template_dir).resolve()
+    cache_dir = Path(cache_dir).resolve() if cache_dir is not None else None
+    options = {key: jinja_config[key] for key in _ENVIRONMENT_OPTIONS}
+    literal_options = dict(literal_config or {})
+    key = (
+        str(template_dir),
+        tuple(sorted(options.items())),
+        str(cache_dir),
+        tuple(sorted(literal_options.items()))
+    )
+
+    with _lock:
+        env = _environments.get(key)
+        if env is None:
+            bytecode_cache = None
+            if cache_dir is not None:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                bytecode_cache = FileSystemBytecodeCache(str(cache_dir))
+            env = Environment(
+                loader=FileSystemLoader(str(template_dir)),
+                bytecode_cache=bytecode_cache,
+                **options
+            )
+            env.filters.update(java_literal_filters(**literal_options))
+            _environments[key] = env
+            _logger.debug(
+                f"Created Jinja2 environment for {template_dir} (bytecode cache: {cache_dir})"
+            )
+    return env
+
+
+def clear_template_environments() -> None:
+    """Drop all shared environments (compiled templates are reloaded on next use)."""
+    with _lock:
+        _environments.clear()
+
+
+def clear_bytecode_cache(cache_dir: Path | str) -> None:
+    """Delete all compiled templates in a bytecode cache directory.
+
+    Args:
+        cache_dir: Bytecode cache directory
+    """
+    cache_dir = Path(cache_dir)
+    if cache_dir.is_dir():
+        FileSystemBytecodeCache(str(cache_dir)).clear()
+
+
+__all__ = [
+    "get_template_environment",
+    "resolve_cache_dir",
+    "clear_template_environments",
+    "clear_bytecode_cache",
+]
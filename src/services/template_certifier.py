@@ -0,0 +1,196 @@
+"""Certify a template once per run instead of validating every job.
+
+Rendering problems such as unrendered variables, unbalanced braces from
+template blocks and overlong lines depend on the template and on the shape
+of the data (element counts, width of numbers), not on individual
+parameter values. A template is therefore rendered against representative
+data (the run's first job, a minimal geometry, a large geometry with the
+widest numbers) and fully validated once. A passing template is recorded
+as certified under a hash of its source and rendering settings, in memory
+and as a marker file, so later jobs and later runs only need a cheap
+size/leftover check (quick_validate_java).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional
+
+from jinja2 import Template
+
+from src.config.loader import get_logger
+from src.services.geometry_builder import BeamData, GeometryData, SphereData
+from src.validators.template_validator import (
+    TemplateValidationResult,
+    validate_generated_java,
+)
+
+_logger = get_logger("services.template_certifier")
+
+# Widest float repr (17 significant digits, 3-digit exponent, sign)
+_WIDE_FLOAT = -1.2345678901234567e-300
+# Widest fixed-point geometry value at the default literal precision
+_WIDE_COORDINATE = -99999.999999
+# Number of spheres/beams in the large representative geometry
+_LARGE_COUNT = 1000
+
+
+def template_fingerprint(template: Template, settings: Optional[Mapping[str, Any]] = None) -> str:
+    """Hash of a template's source and the settings that affect its output.
+
+    Args:
+        template: Compiled template (loaded from a loader with source access)
+        settings: Rendering/validation settings to include (e.g. Jinja2 and
+                  java_literals config)
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    env = template.environment
+    source = env.loader.get_source(env, template.name)[0]
+    digest = hashlib.sha256(source.encode('utf-8'))
+    digest.update(json.dumps(settings or {}, sort_keys=True, default=str).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def representative_contexts(context: Mapping[str, Any]) -> List[Dict[str, Any]]:
+    """Contexts covering the shapes of data a run can produce.
+
+    Args:
+        context: Template variables of a real job in the run
+
+    Returns:
+        The job's own context, a minimal geometry (one sphere and beam),
+        and a large geometry where every float has the widest repr
+    """
+    contexts = [dict(context)]
+    geometry = context.get('geometry')
+    if not isinstance(geometry, GeometryData):
+        return contexts
+
+    minimal = dict(context)
+    minimal['geometry'] = GeometryData(
+        spheres=geometry.spheres[:1] or [SphereData(1, [0.0, 0.0, 0.0], 1.0, 1.0)],
+        beams=[BeamData(1, 0, 0, 1.0, 1.0)],
+        lattice_constant=geometry.lattice_constant,
+        unit_cell_size=geometry.unit_cell_size
+    )
+    contexts.append(minimal)
+
+    wide = {
+        key: _WIDE_FLOAT if isinstance(value, float) else value
+        for key, value in context.items()
+    }
+    count = max(_LARGE_COUNT, len(geometry.spheres), len(geometry.beams))
+    wide['geometry'] = GeometryData(
+        spheres=[
+            SphereData(i + 1, [_WIDE_COORDINATE] * 3, _WIDE_COORDINATE, 1.0)
+            for i in range(count)
+        ],
+        beams=[
+            BeamData(i + 1, i, count - 1 - i, _WIDE_COORDINATE, 1.0)
+            for i in range(count)
+        ],
+        lattice_constant=_WIDE_FLOAT,
+        unit_cell_size=[_WIDE_FLOAT] * 3
+    )
+    contexts.append(wide)
+    return contexts
+
+
+class TemplateCertifier:
+    """Certify templates once and remember the result by template hash."""
+
+    def __init__(self, marker_dir: Optional[Path | str] = None):
+        """Initialize the certifier.
+
+        Args:
+            marker_dir: Directory for certified markers shared across runs
+                        (None: remember certifications in memory only)
+        """
+        self.marker_dir = Path(marker_dir) if marker_dir is not None else None
+        self._certified: Dict[str, bool] = {}
+        self._lock = threading.Lock()
+
+    def _marker_path(self, fingerprint: str) -> Optional[Path]:
+        if self.marker_dir is None:
+            return None
+        return self.marker_dir / f"{fingerprint}.json"
+
+    def is_certified(self, fingerprint: str) -> bool:
+        """Whether a template fingerprint has passed certification."""
+        if fingerprint in self._certified:
+            return self._certified[fingerprint]
+        marker = self._marker_path(fingerprint)
+        if marker is not None and marker.is_file():
+            self._certified[fingerprint] = True
+            return True
+        return False
+
+    def certify(
+        self,
+        fingerprint: str,
+        render,
+        contexts: List[Mapping[str, Any]],
+        name: str = ''
+    ) -> bool:
+        """Render and fully validate representative contexts once.
+
+        Args:
+            fingerprint: Template fingerprint (see template_fingerprint)
+            render: Callable rendering a context to text
+            contexts: Representative contexts (see representative_contexts)
+            name: Template name for log messages and the marker
+
+        Returns:
+            True if every context rendered to valid Java. A failed
+            certification is remembered for this process only, so callers
+            fall back to full per-job validation.
+        """
+        with self._lock:
+            if self.is_certified(fingerprint):
+                return True
+            if fingerprint in self._certified:
+                return False
+
+            results: List[TemplateValidationResult] = [
+                validate_generated_java(render(context)) for context in contexts
+            ]
+            certified = all(result.is_valid for result in results)
+            self._certified[fingerprint] = certified
+
+            if not certified:
+                failed = next(result for result in results if not result.is_valid)
+                _logger.warning(
+                    f"Template '{name}' failed certification; validating every job.\n"
+                    f"{failed.get_error_summary()}"
+                )
+                return False
+
+            warnings = sum(len(result.warnings) for result in results)
+            _logger.info(
+                f"Certified template '{name}' ({fingerprint[:12]}) against "
+                f"{len(contexts)} representative contexts ({warnings} warnings)"
+            )
+            marker = self._marker_path(fingerprint)
+            if marker is not None:
+                marker.parent.mkdir(parents=True, exist_ok=True)
+                marker.write_text(json.dumps({
+                    'template': name,
+                    'fingerprint': fingerprint,
+                    'certified_at': datetime.now().isoformat(),
+                    'contexts': len(contexts),
+                    'warnings': warnings,
+                }, indent=2), encoding='utf-8')
+            return True
+
+
+__all__ = [
+    "template_fingerprint",
+    "representative_contexts",
+    "TemplateCertifier",
+]
@@ -0,0 +1,183 @@
+"""Render only the per-job parts of a large template.
+
+Most of custom_lattice.java.j2 is static Java; only a few sections (class
+name, scalar parameters, geometry arrays, mesh size) change per job. Those
+sections are marked with Jinja2 blocks in the template::
+
+    <% block geometry_data %>
+    ...
+    <% endblock %>
+
+A SplicedTemplate renders the template once per run with every block
+replaced by a sentinel, splits the result into static chunks, and for each
+job renders only the blocks and joins them with the static chunks. The
+output is identical to a full render, but per-job cost scales with the
+size of the dynamic sections instead of the whole template.
+
+Variables used outside the blocks are part of the skeleton; a new skeleton
+is rendered whenever one of them changes, so correctness never depends on
+which variables a template author put inside a block.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Sequence, Tuple
+
+from jinja2 import Template, meta, nodes
+
+from src.config.loader import get_logger
+
+_logger = get_logger("services.template_splicer")
+
+_SENTINEL = "\x00__splice_block_{}__\x00"
+
+
+class SplicedTemplate:
+    """Template rendered as static chunks plus per-job blocks."""
+
+    def __init__(self, template: Template, blocks: Optional[Sequence[str]] = None):
+        """Wrap a template.
+
+        Args:
+            template: Compiled Jinja2 template containing blocks
+            blocks: Blocks to render per job (default: all blocks)
+
+        Raises:
+            ValueError: If the template has no blocks or an unknown block is given
+        """
+        self.template = template
+        self.blocks = list(blocks) if blocks is not None else list(template.blocks)
+        if not self.blocks:
+            raise ValueError(f"Template '{template.name}' defines no blocks to splice")
+        unknown = [name for name in self.blocks if name not in template.blocks]
+        if unknown:
+            raise ValueError(f"Template '{template.name}' has no blocks named {unknown}")
+
+        self.static_variables = self._find_static_variables()
+        # Skeletons keyed by the values of static_variables
+        self._skeletons: Dict[Tuple, Tuple[List[str], List[str]]] = {}
+
+    def _find_static_variables(self) -> FrozenSet[str]:
+        """Variables referenced outside the spliced blocks."""
+        env = self.template.environment
+        if env.loader is None or self.template.name is None:
+            # Source unavailable: treat every render as a new skeleton
+            return frozenset()
+        source = env.loader.get_source(env, self.template.name)[0]
+        tree = env.parse(source)
+        for block in tree.find_all(nodes.Block):
+            if block.name in self.blocks:
+                block.body = []
+        return frozenset(meta.find_undeclared_variables(tree))
+
+    def _static_key(self, context: Mapping[str, Any]) -> Tuple:
+        """Key identifying the skeleton for a context."""
+        return tuple(
+            (name, repr(context.get(name))) for name in sorted(self.static_variables)
+        )
+
+    @property
+    def num_skeletons(self) -> int:
+        """Number of distinct static skeletons rendered so far."""
+        return len(self._skeletons)
+
+    def prepare(self, context: Mapping[str, Any]) -> Tuple[List[str], List[str]]:
+        """Render the static skeleton for a context.
+
+        Args:
+            context: Template variables (blocks are not rendered here)
+
+        Returns:
+            Tuple of (static chunks, block names between the chunks)
+        """
+        key = self._static_key(context)
+        cached = self._skeletons.get(key)
+        if cached is not None:
+            return cached
+
+        ctx = self.template.new_context(dict(context))
+
+        def sentinel(name: str):
+            def render(_ctx):
+                yield _SENTINEL.format(name)
+            return render
+
+        for name in self.blocks:
+            ctx.blocks[name] = [sentinel(name)]
+
+        skeleton = ''.join(self.template.root_render_func(ctx))
+
+        chunks = []
+        order = []
+        rest = skeleton
+        while True:
+            positions = [
+                (rest.find(_SENTINEL.format(name)), name)
+                for name in self.blocks if _SENTINEL.format(name) in rest
+            ]
+            if not positions:
+                chunks.append(rest)
+                break
+            pos, name = min(positions)
+            chunks.append(rest[:pos])
+            order.append(name)
+            rest = rest[pos + len(_SENTINEL.format(name)):]
+
+        self._skeletons[key] = (chunks, order)
+        _logger.debug(
+            f"Prepared spliced template '{self.template.name}': "
+            f"{sum(len(c) for c in chunks)} static chars, blocks {order}"
+        )
+        return chunks, order
+
+    def static_size(self, context: Mapping[str, Any]) -> int:
+        """Size of the static skeleton, a lower bound on any rendered output.
+
+        Args:
+            context: Template variables (selects the skeleton)
+
+        Returns:
+            Number of static characters
+        """
+        chunks, _ = self.prepare(context)
+        return sum(len(chunk) for chunk in chunks)
+
+    def render_blocks(self, context: Mapping[str, Any]) -> Dict[str, str]:
+        """Render only the per-job blocks.
+
+        Args:
+            context: Template variables for one job
+
+        Returns:
+            Mapping of block name to rendered text
+        """
+        ctx = self.template.new_context(dict(context))
+        return {
+            name: ''.join(self.template.blocks[name](ctx))
+            for name in self.blocks
+        }
+
+    def render(self, context: Mapping[str, Any]) -> str:
+        """Render the template for one job.
+
+        The static skeleton is rendered on first use and reused for every
+        context with the same static variable values.
+
+        Args:
+            context: Template variables for one job
+
+        Returns:
+            Rendered text, identical to template.render(**context)
+        """
+        chunks, order = self.prepare(context)
+        rendered = self.render_blocks(context)
+        parts = [chunks[0]]
+        for name, chunk in zip(order, chunks[1:]):
+            parts.append(rendered[name])
+            parts.append(chunk)
+        return ''.join(parts)
+
+
+__all__ = [
+    "SplicedTemplate",
+]
@@ -1,5 +1,6 @@
 """Utility functions for the ESP project."""
 
+from src.utils.ids import generate_id, id_timestamp
 from src.utils.path_utils import (
     detect_wsl,
     wsl_to_windows_path,
@@ -8,6 +9,8 @@ from src.utils.path_utils import (
 )
 
 __all__ = [
+    'generate_id',
+    'id_timestamp',
     'detect_wsl',
     'wsl_to_windows_path',
     'windows_to_wsl_path',
@@ -0,0 +1,212 @@
+"""Safe, vectorized boolean expressions over parameter names.
+
+Constraint expressions in parametric studies refer to parameters by their
+dotted names, e.g.::
+
+    beam.thickness * 0.795 / 2 < sphere.radius - 0.01
+    beam.0.ratio <= 2 * beam.1.ratio and sphere.radius > 0.5
+
+Expressions are parsed once with the `ast` module and evaluated by a small
+interpreter that only knows arithmetic, comparisons, boolean operators and
+a few whitelisted functions. Nothing is passed to eval(), and values may be
+NumPy arrays so a constraint is evaluated over a whole grid at once.
+"""
+
+import ast
+import re
+from functools import reduce
+from typing import Any, Dict, List, Mapping
+
+import numpy as np
+
+# Dotted parameter names such as sphere.radius or beam.0.ratio
+_PARAMETER_PATTERN = re.compile(r'\b[A-Za-z]\w*(?:\.(?:\d+|[A-Za-z]\w*))+')
+
+_BINARY_OPS = {
+    ast.Add: np.add,
+    ast.Sub: np.subtract,
+    ast.Mult: np.multiply,
+    ast.Div: np.true_divide,
+    ast.Pow: np.power,
+    ast.Mod: np.mod,
+}
+
+_UNARY_OPS = {
+    ast.USub: np.negative,
+    ast.UAdd: np.positive,
+    ast.Not: np.logical_not,
+}
+
+_COMPARE_OPS = {
+    ast.Lt: np.less,
+    ast.LtE: np.less_equal,
+    ast.Gt: np.greater,
+    ast.GtE: np.greater_equal,
+    ast.Eq: np.equal,
+    ast.NotEq: np.not_equal,
+}
+
+# Function name -> (implementation, minimum arguments, maximum arguments or None)
+# min/max reduce over all arguments (np.minimum's third argument would be `out`)
+_FUNCTIONS = {
+    'abs': (np.abs, 1, 1),
+    'sqrt': (np.sqrt, 1, 1),
+    'min': (lambda *args: reduce(np.minimum, args), 1, None),
+    'max': (lambda *args: reduce(np.maximum, args), 1, None),
+}
+
+
+class Expression:
+    """Compiled boolean/arithmetic expression over parameter names.
+
+    Attributes:
+        source: Original expression text
+        parameters: Parameter names referenced by the expression
+    """
+
+    def __init__(self, source: str):
+        """Parse and check an expression.
+
+        Args:
+            source: Expression text
+
+        Raises:
+            ValueError: If the expression is not valid or uses anything
+                        other than arithmetic, comparisons, and/or/not and
+                        the functions abs, sqrt, min, max
+        """
+        self.source = source
+        self._names: Dict[str, str] = {}
+
+        def substitute(match: re.Match) -> str:
+            name = match.group(0)
+            if name not in self._names:
+                self._names[name] = f"_p{len(self._names)}"
+            return self._names[name]
+
+        rewritten = _PARAMETER_PATTERN.sub(substitute, source)
+        try:
+            self._tree = ast.parse(rewritten.strip(), mode='eval')
+        except SyntaxError as e:
+            raise ValueError(f"Invalid expression '{source}': {e.msg}") from e
+
+        self._placeholders = {v: k for k, v in self._names.items()}
+        self._check(self._tree.body)
+
+    @property
+    def parameters(self) -> List[str]:
+        """Parameter names referenced by the expression."""
+        return list(self._names)
+
+    def _check(self, node: ast.AST) -> None:
+        """Reject any syntax outside the whitelist."""
+        if isinstance(node, ast.BoolOp):
+            for value in node.values:
+                self._check(value)
+        elif isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPS:
+            self._check(node.left)
+            self._check(node.right)
+        elif isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPS:
+            self._check(node.operand)
+        elif isinstance(node, ast.Compare) and all(type(op) in _COMPARE_OPS for op in node.ops):
+            self._check(node.left)
+            for comparator in node.comparators:
+                self._check(comparator)
+        elif isinstance(node, ast.Call):
+            if not (isinstance(node.func, ast.Name) and node.func.id in _FUNCTIONS) or node.keywords:
+                raise ValueError(
+                    f"Invalid expression '{self.source}': only {sorted(_FUNCTIONS)} may be called"
+                )
+            _, min_args, max_args = _FUNCTIONS[node.func.id]
+            if len(node.args) < min_args or (max_args is not None and len(node.args) > max_args) \
+                    or any(isinstance(arg, ast.Starred) for arg in node.args):
+                expected = min_args if min_args == max_args else f"at least {min_args}"
+                raise ValueError(
+                    f"Invalid expression '{self.source}': {node.func.id}() takes "
+                    f"{expected} argument(s), got {len(node.args)}"
+                )
+            for arg in node.args:
+                self._check(arg)
+        elif isinstance(node, ast.Name):
+            if node.id not in self._placeholders:
+                raise ValueError(
+                    f"Invalid expression '{self.source}': unknown name '{node.id}' "
+                    f"(parameters must be dotted names such as sphere.radius)"
+                )
+        elif isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) \
+                and not isinstance(node.value, bool):
+            pass
+        else:
+            raise ValueError(
+                f"Invalid expression '{self.source}': unsupported syntax "
+                f"'{type(node).__name__}'"
+            )
+
+    def _eval(self, node: ast.AST, values: Mapping[str, Any]) -> Any:
+        """Evaluate a checked node."""
+        if isinstance(node, ast.BoolOp):
+            combine = np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+            result = self._eval(node.values[0], values)
+            for value in node.values[1:]:
+                result = combine(result, self._eval(value, values))
+            return result
+        if isinstance(node, ast.BinOp):
+            return _BINARY_OPS[type(node.op)](
+                self._eval(node.left, values), self._eval(node.right, values)
+            )
+        if isinstance(node, ast.UnaryOp):
+            return _UNARY_OPS[type(node.op)](self._eval(node.operand, values))
+        if isinstance(node, ast.Compare):
+            result = True
+            left = self._eval(node.left, values)
+            for op, comparator in zip(node.ops, node.comparators):
+                right = self._eval(comparator, values)
+                result = np.logical_and(result, _COMPARE_OPS[type(op)](left, right))
+                left = right
+            return result
+        if isinstance(node, ast.Call):
+            function = _FUNCTIONS[node.func.id][0]
+            return function(*(self._eval(a, values) for a in node.args))
+        if isinstance(node, ast.Name):
+            return values[self._placeholders[node.id]]
+        return node.value
+
+    def evaluate(self, values: Mapping[str, Any]) -> Any:
+        """Evaluate the expression.
+
+        Args:
+            values: Parameter name -> scalar or NumPy array (arrays are
+                    broadcast against each other)
+
+        Returns:
+            Result of the expression (boolean array for constraints)
+
+        Raises:
+            KeyError: If a referenced parameter has no value
+        """
+        missing = [name for name in self._names if name not in values]
+        if missing:
+            raise KeyError(f"Expression '{self.source}' references undefined parameters: {missing}")
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return self._eval(self._tree.body, values)
+
+    def __repr__(self) -> str:
+        return f"Expression({self.source!r})"
+
+
+def compile_expression(source: str) -> Expression:
+    """Compile an expression over dotted parameter names.
+
+    Args:
+        source: Expression text, e.g. 'beam.thickness / 2 < sphere.radius'
+
+    Returns:
+        Compiled Expression
+    """
+    return Expression(source)
+
+
+__all__ = [
+    "Expression",
+    "compile_expression",
+]
@@ -0,0 +1,91 @@
+"""Collision-free, chronologically sortable run and job IDs.
+
+IDs keep the readable timestamp of the original scheme and add
+microseconds plus a node suffix:
+
+    run_20241211_153012_048213_3fa9c1
+    <prefix>_<YYYYMMDD_HHMMSS>_<microseconds>_<node>
+
+Within a process the microsecond part is strictly increasing (calls in the
+same microsecond are bumped by one), and the node suffix is a hash of host
+name and process ID, so generators running concurrently on different
+processes or machines never produce the same ID. All fields have fixed
+width and the timestamp is in UTC (unaffected by DST changes or the
+host's time zone), so sorting IDs (or directory listings) sorts them
+chronologically.
+"""
+
+import hashlib
+import os
+import re
+import socket
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+_ID_PATTERN = re.compile(r'^(?P<prefix>.+)_(?P<stamp>\d{8}_\d{6})_(?P<micro>\d{6})_(?P<node>[0-9a-f]{6})$')
+
+_lock = threading.Lock()
+_last_us = 0
+_node_pid: Optional[int] = None
+_node = ''
+
+
+def _node_id() -> str:
+    """Short hash of host name and process ID (recomputed after fork)."""
+    global _node_pid, _node
+    pid = os.getpid()
+    if pid != _node_pid:
+        digest = hashlib.blake2s(f"{socket.gethostname()}:{pid}".encode('utf-8'), digest_size=3)
+        _node = digest.hexdigest()
+        _node_pid = pid
+    return _node
+
+
+def _next_microseconds() -> int:
+    """Current time in microseconds, strictly increasing within the process."""
+    global _last_us
+    with _lock:
+        now = time.time_ns() // 1000
+        if now <= _last_us:
+            now = _last_us + 1
+        _last_us = now
+        return now
+
+
+def generate_id(prefix: str) -> str:
+    """Generate a unique, sortable ID.
+
+    Args:
+        prefix: ID prefix, e.g. 'run' or 'job'
+
+    Returns:
+        ID in format <prefix>_YYYYMMDD_HHMMSS_<microseconds>_<node> (UTC)
+    """
+    seconds, micro = divmod(_next_microseconds(), 1_000_000)
+    stamp = datetime.fromtimestamp(seconds, tz=timezone.utc).strftime("%Y%m%d_%H%M%S")
+    return f"{prefix}_{stamp}_{micro:06d}_{_node_id()}"
+
+
+def id_timestamp(id_: str) -> Optional[datetime]:
+    """Creation time encoded in an ID from generate_id.
+
+    Args:
+        id_: ID string
+
+    Returns:
+        Creation time (timezone-aware, UTC), or None if the ID is not in
+        generate_id format
+    """
+    match = _ID_PATTERN.match(id_)
+    if match is None:
+        return None
+    stamp = datetime.strptime(match.group('stamp'), "%Y%m%d_%H%M%S")
+    return stamp.replace(microsecond=int(match.group('micro')), tzinfo=timezone.utc)
+
+
+__all__ = [
+    "generate_id",
+    "id_timestamp",
+]
@@ -0,0 +1,178 @@
+"""Vectorized formatting of NumPy arrays as Java array initializers.
+
+Geometry arrays of large supercells hold thousands of values. Emitting them
+with Jinja2 loops costs a template iteration per element and prints Python
+float reprs of arbitrary length (e.g. 1.7500000000000002). The functions in
+this module format a whole array with one printf-style operation at a fixed
+precision, trim redundant trailing zeros and wrap the result into lines.
+
+They are registered as Jinja2 filters (see java_literal_filters)::
+
+    sphereRadii = new double[]{
+    << geometry.sphere_radii|java_doubles >>
+    };
+
+    points = new double[][]{
+    << geometry.sphere_positions|java_rows(labels=geometry.sphere_labels) >>
+    };
+"""
+
+import re
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+DEFAULT_PRECISION = 6
+DEFAULT_MAX_LINE_LENGTH = 120
+DEFAULT_INDENT = 16
+
+# Trailing zeros after the first decimal digit: 1.500000 -> 1.5, 2.000000 -> 2.0
+_TRAILING_ZEROS = re.compile(r'(\.\d+?)0+\b')
+
+
+def format_values(values: Any, precision: int = DEFAULT_PRECISION) -> List[str]:
+    """Format numbers as Java literals in one vectorized operation.
+
+    Floating point values are rounded to `precision` decimals and trailing
+    zeros are removed (at least one decimal is kept, so 2 becomes 2.0).
+    Integer arrays are formatted as integers.
+
+    Args:
+        values: Array-like of numbers (flattened)
+        precision: Digits after the decimal point for floating point values
+
+    Returns:
+        Formatted values in C order
+
+    Raises:
+        ValueError: If the array contains NaN or infinite values
+    """
+    array = np.asarray(values).ravel()
+    if array.size == 0:
+        return []
+
+    if np.issubdtype(array.dtype, np.integer):
+        return ('%d\x00' * array.size % tuple(array.tolist()))[:-1].split('\x00')
+
+    array = array.astype(float)
+    if not np.all(np.isfinite(array)):
+        raise ValueError("Java literals cannot represent NaN or infinite values")
+    # Adding 0.0 turns -0.0 (also from rounding tiny negatives) into 0.0
+    array = np.round(array, precision) + 0.0
+    text = (f'%.{precision}f\x00' * array.size) % tuple(array.tolist())
+    if precision > 0:
+        text = _TRAILING_ZEROS.sub(r'\1', text)
+    else:
+        text = text.replace('\x00', '.0\x00')
+    return text[:-1].split('\x00')
+
+
+def java_doubles(
+    values: Any,
+    indent: int = DEFAULT_INDENT,
+    precision: int = DEFAULT_PRECISION,
+    max_line_length: int = DEFAULT_MAX_LINE_LENGTH
+) -> str:
+    """Format a 1D array as the body of a Java array initializer.
+
+    Values are separated by ', ' and wrapped so that no line, including the
+    indentation, exceeds `max_line_length` (at least one value per line).
+
+    Args:
+        values: 1D array-like of numbers
+        indent: Number of spaces before each line
+        precision: Digits after the decimal point
+        max_line_length: Maximum line length
+
+    Returns:
+        Indented lines without a trailing newline
+    """
+    items = format_values(values, precision)
+    if not items:
+        return ''
+    width = max(len(item) for item in items) + 2
+    per_line = max(1, (max_line_length - indent + 1) // width)
+    prefix = ' ' * indent
+    return ',\n'.join(
+        prefix + ', '.join(items[start:start + per_line])
+        for start in range(0, len(items), per_line)
+    )
+
+
+def java_rows(
+    values: Any,
+    indent: int = DEFAULT_INDENT,
+    labels: Optional[Sequence[str]] = None,
+    item: Optional[str] = None,
+    precision: int = DEFAULT_PRECISION
+) -> str:
+    """Format a 2D array as rows of a nested Java array initializer.
+
+    Each row becomes one line '{a, b, c}', optionally followed by a
+    '// label' comment.
+
+    Args:
+        values: 2D array-like of numbers (one initializer per row)
+        indent: Number of spaces before each line
+        labels: Optional comment per row (e.g. 'sphere_001')
+        item: Optional pattern applied to every value, with '{}' as the
+              placeholder (e.g. 'points[{}]' for index arrays)
+        precision: Digits after the decimal point
+
+    Returns:
+        Indented lines without a trailing newline
+
+    Raises:
+        ValueError: If values is not 2D or labels do not match the rows
+    """
+    array = np.asarray(values)
+    if array.size == 0:
+        return ''
+    if array.ndim != 2:
+        raise ValueError(f"java_rows expects a 2D array, got shape {array.shape}")
+    rows, cols = array.shape
+    if labels is not None and len(labels) != rows:
+        raise ValueError(f"Got {len(labels)} labels for {rows} rows")
+
+    cell = item.replace('%', '%%').replace('{}', '%s') if item is not None else '%s'
+    row_format = ' ' * indent + '{' + ', '.join([cell] * cols) + '}%s'
+
+    trailers = [','] * (rows - 1) + ['']
+    if labels is not None:
+        trailers = [f"{sep}  // {label}" for sep, label in zip(trailers, labels)]
+
+    # One formatting pass over all rows: cells followed by the row trailer
+    args = np.empty((rows, cols + 1), dtype=object)
+    args[:, :cols] = np.array(format_values(array, precision), dtype=object).reshape(rows, cols)
+    args[:, cols] = trailers
+    return '\n'.join([row_format] * rows) % tuple(args.ravel().tolist())
+
+
+def java_literal_filters(
+    precision: int = DEFAULT_PRECISION,
+    max_line_length: int = DEFAULT_MAX_LINE_LENGTH
+) -> Dict[str, Callable]:
+    """Jinja2 filters for Java array literals.
+
+    Args:
+        precision: Digits after the decimal point
+        max_line_length: Maximum line length for wrapped 1D arrays
+
+    Returns:
+        Mapping of filter name to filter function
+    """
+    return {
+        'java_doubles': partial(
+            java_doubles, precision=precision, max_line_length=max_line_length
+        ),
+        'java_rows': partial(java_rows, precision=precision),
+    }
+
+
+__all__ = [
+    "format_values",
+    "java_doubles",
+    "java_rows",
+    "java_literal_filters",
+]
@@ -0,0 +1,53 @@
+"""Lazy package exports (PEP 562).
+
+Package __init__ modules re-export their public names without importing
+the submodules that define them. A submodule (and its heavy dependencies
+such as pymatgen, matplotlib, SQLAlchemy or Jinja2) is imported on first
+attribute access, so importing one lightweight module, e.g.
+src.services.batch_executor, does not pull in the whole package::
+
+    _EXPORTS = {
+        "JobGenerator": "src.services.job_generator",
+        "BatchExecutor": "src.services.batch_executor",
+    }
+    __getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, List, Mapping, Tuple
+
+
+def lazy_exports(
+    package: str,
+    exports: Mapping[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Create module-level __getattr__ and __dir__ for lazy exports.
+
+    Args:
+        package: Name of the package (__name__ of the __init__ module)
+        exports: Exported name -> absolute name of the defining module
+
+    Returns:
+        Tuple of (__getattr__, __dir__) to assign in the package
+    """
+    exports = dict(exports)
+
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name), name)
+        # Cache on the package so later lookups skip __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
+
+
+__all__ = [
+    "lazy_exports",
+]
@@ -0,0 +1,196 @@
+"""Opt-in profiling of generation and execution pipelines.
+
+Profiling is enabled with ``--profile`` on the CLI scripts, the ``profile``
+argument of JobGenerator/BatchExecutor, or the ESP_PROFILE environment
+variable (``ESP_PROFILE=1``). A profiled section writes three artifacts to
+the profile/ subdirectory of the run directory:
+
+    <name>.pstats      cProfile statistics (python -m pstats, snakeviz, ...)
+    <name>.collapsed   sampled call stacks in collapsed format
+                       (flamegraph.pl, speedscope, inferno)
+    <name>.txt         top functions by cumulative time
+
+cProfile only records caller/callee pairs, so the collapsed stacks come
+from a sampling thread that walks the profiled thread's frames at a fixed
+interval. The samples include cProfile's own overhead.
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+PROFILE_ENV_VAR = "ESP_PROFILE"
+
+# Artifacts are written to this subdirectory of the run directory
+PROFILE_DIRNAME = "profile"
+
+_FALSE_VALUES = {"", "0", "false", "no", "off"}
+
+
+def profiling_enabled(enabled: Optional[bool] = None) -> bool:
+    """Whether profiling is enabled.
+
+    Args:
+        enabled: Explicit setting; None defers to the ESP_PROFILE variable
+
+    Returns:
+        True if profiling is enabled
+    """
+    if enabled is not None:
+        return enabled
+    return os.environ.get(PROFILE_ENV_VAR, "").strip().lower() not in _FALSE_VALUES
+
+
+class StackSampler:
+    """Sample the call stack of one thread into collapsed-stack counts."""
+
+    def __init__(self, interval: float = 0.005, thread_id: Optional[int] = None):
+        """Initialize the sampler.
+
+        Args:
+            interval: Seconds between samples
+            thread_id: Thread to sample (default: the calling thread)
+        """
+        self.interval = interval
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.counts: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start sampling in a daemon thread."""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                name = getattr(code, 'co_qualname', code.co_name)
+                stack.append(f"{Path(code.co_filename).name}:{name}".replace(' ', '_').replace(';', ','))
+                frame = frame.f_back
+            if stack:
+                self.counts[';'.join(reversed(stack))] += 1
+
+    def write_collapsed(self, path: Path) -> None:
+        """Write samples as 'frame;frame;frame count' lines.
+
+        Args:
+            path: Output file
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in self.counts.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+class Profiler:
+    """cProfile plus stack sampling of the calling thread.
+
+    Example:
+        >>> profiler = Profiler()
+        >>> with profiler:
+        ...     generator.generate_parametric_study_jobs(custom_job)
+        >>> profiler.save(run_dir / 'profile', 'generation')
+    """
+
+    def __init__(self, sample_interval: float = 0.005):
+        """Initialize the profiler.
+
+        Args:
+            sample_interval: Seconds between stack samples
+        """
+        self._profile = cProfile.Profile()
+        self._sampler = StackSampler(sample_interval)
+
+    def __enter__(self) -> 'Profiler':
+        self._sampler.thread_id = threading.get_ident()
+        self._sampler.start()
+        self._profile.enable()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._profile.disable()
+        self._sampler.stop()
+
+    def save(self, directory: Path, name: str, top: int = 40) -> Dict[str, Path]:
+        """Write the profile artifacts.
+
+        Args:
+            directory: Output directory (created if missing)
+            name: Artifact base name, e.g. 'generation'
+            top: Number of functions in the text summary
+
+        Returns:
+            Dictionary with 'pstats', 'collapsed' and 'summary' paths
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        paths = {
+            'pstats': directory / f"{name}.pstats",
+            'collapsed': directory / f"{name}.collapsed",
+            'summary': directory / f"{name}.txt",
+        }
+
+        self._profile.dump_stats(str(paths['pstats']))
+        self._sampler.write_collapsed(paths['collapsed'])
+
+        summary = io.StringIO()
+        stats = pstats.Stats(self._profile, stream=summary)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+        paths['summary'].write_text(summary.getvalue(), encoding='utf-8')
+        return paths
+
+
+@contextmanager
+def profiled(
+    directory: Path,
+    name: str,
+    enabled: Optional[bool] = None
+) -> Iterator[Optional[Profiler]]:
+    """Profile a block and save artifacts if profiling is enabled.
+
+    Args:
+        directory: Output directory for the artifacts
+        name: Artifact base name
+        enabled: Explicit setting; None defers to ESP_PROFILE
+
+    Yields:
+        The running Profiler, or None if profiling is disabled
+    """
+    if not profiling_enabled(enabled):
+        yield None
+        return
+
+    profiler = Profiler()
+    try:
+        with profiler:
+            yield profiler
+    finally:
+        profiler.save(directory, name)
+
+
+__all__ = [
+    "PROFILE_DIRNAME",
+    "PROFILE_ENV_VAR",
+    "Profiler",
+    "StackSampler",
+    "profiled",
+    "profiling_enabled",
+]
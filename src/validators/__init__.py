@@ -1,13 +1,42 @@
-"""Validators for custom lattice geometries and template rendering."""
+"""Validators for custom lattice geometries and template rendering.
 
-from .geometry_validator import GeometryValidator, ValidationError, ValidationResult
-from .template_validator import (
-    JavaCodeValidator,
-    TemplateValidationError,
-    TemplateValidationResult,
-    validate_generated_java,
-    validate_java_file,
-)
+Exports are loaded lazily (PEP 562): the geometry validator imports the
+pydantic job models, the template validator reads the job generator config
+on first use.
+"""
+
+from typing import TYPE_CHECKING
+
+from src.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .geometry_validator import GeometryValidator, ValidationError, ValidationResult
+    from .template_validator import (
+        JavaCodeValidator,
+        TemplateValidationError,
+        TemplateValidationResult,
+        ValidationChecks,
+        load_validation_checks,
+        quick_validate_java,
+        validate_generated_java,
+        validate_java_file,
+    )
+
+_EXPORTS = {
+    "GeometryValidator": "src.validators.geometry_validator",
+    "ValidationError": "src.validators.geometry_validator",
+    "ValidationResult": "src.validators.geometry_validator",
+    "JavaCodeValidator": "src.validators.template_validator",
+    "TemplateValidationError": "src.validators.template_validator",
+    "TemplateValidationResult": "src.validators.template_validator",
+    "ValidationChecks": "src.validators.template_validator",
+    "load_validation_checks": "src.validators.template_validator",
+    "validate_generated_java": "src.validators.template_validator",
+    "quick_validate_java": "src.validators.template_validator",
+    "validate_java_file": "src.validators.template_validator",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "GeometryValidator",
@@ -16,6 +45,9 @@ __all__ = [
     "JavaCodeValidator",
     "TemplateValidationError",
     "TemplateValidationResult",
+    "ValidationChecks",
+    "load_validation_checks",
     "validate_generated_java",
+    "quick_validate_java",
     "validate_java_file",
 ]
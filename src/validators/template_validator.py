@@ -5,6 +5,7 @@ render correctly and produce valid Java code that can be compiled by COMSOL.
 """
 
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
@@ -13,9 +14,6 @@ from ..config.loader import get_logger, load_config, get_config_path_for_env
 
 logger = get_logger(__name__)
 
-# Load job generator configuration for validation settings
-_config = load_config(get_config_path_for_env('job_generator'))
-
 
 @dataclass
 class TemplateValidationError:
@@ -68,32 +66,188 @@ class TemplateValidationResult:
         return "\n".join(lines)
 
 
+# Bracket pairs: closing -> opening, and error type per bracket kind
+_BRACKET_PAIRS = {'}': '{', ']': '[', ')': '('}
+_BRACKET_KINDS = {
+    '{': ('brace_mismatch', 'braces'),
+    '[': ('bracket_mismatch', 'brackets'),
+    '(': ('paren_mismatch', 'parentheses'),
+}
+
+# Java comments and string/char literals; brackets inside them are not code.
+# Unterminated literals end at the end of the line.
+_COMMENTS_AND_LITERALS = re.compile(
+    r'//[^\n]*|/\*[\s\S]*?(?:\*/|\Z)'
+    r'|"(?:[^"\\\n]|\\.)*"?|\'(?:[^\'\\\n]|\\.)*\'?'
+)
+
+# Bracket-only view of code, and adjacent matched pairs
+_BRACKETS_ONLY = {i: None for i in range(128) if chr(i) not in '{}[]()'}
+_MATCHED_PAIRS = re.compile(r'\(\)|\[\]|\{\}')
+
+# Tokens for locating bracket errors
+_BRACKET_TOKENS = re.compile(
+    _COMMENTS_AND_LITERALS.pattern + r'|(?P<open>[{\[(])|(?P<close>[}\])])|(?P<newline>\n)'
+)
+
+
+@dataclass(frozen=True)
+class ValidationChecks:
+    """Validation settings and patterns compiled from config.
+
+    Attributes:
+        max_line_length: Maximum line length for Java code
+        check_excessive_whitespace: Whether to warn about whitespace runs
+        jinja_patterns: Group name -> (pattern, description) for patterns
+                        that indicate rendering issues (error level)
+        jinja_regex: All jinja_patterns combined into one alternation
+        jinja_delimiters: Rendered code without these cannot contain
+                          unrendered Jinja2
+    """
+    max_line_length: int
+    check_excessive_whitespace: bool
+    jinja_patterns: Dict[str, Tuple[str, str]]
+    jinja_regex: 're.Pattern'
+    jinja_delimiters: Tuple[str, ...]
+
+
+def load_validation_checks(config: Optional[Dict] = None) -> ValidationChecks:
+    """Validation settings from the job generator config.
+
+    Without a config, reads through load_config on every call, so edited
+    configs and clear_config_cache() take effect; patterns are only
+    recompiled when the settings change. Callers validating many jobs
+    (e.g. quick_validate_java per job) should resolve the checks once and
+    pass them in.
+
+    Args:
+        config: Job generator config (default: loaded for the environment)
+
+    Returns:
+        Compiled ValidationChecks
+    """
+    if config is None:
+        config = load_config(get_config_path_for_env('job_generator'))
+    validation_config = config['validation']
+    return _compile_checks(
+        validation_config.get('max_line_length', 120),
+        validation_config.get('check_excessive_whitespace', True),
+        validation_config.get('jinja2_variable_pattern', r'<<\s*[\w\.\[\]"\'\(\)]+\s*>>'),
+        validation_config.get('jinja2_block_pattern', r'<%\s*(for|if|endif|endfor|else|elif)\s+.*?%>'),
+        tuple(config['jinja2'][key] for key in ('variable_start_string', 'block_start_string')),
+    )
+
+
+@lru_cache(maxsize=8)
+def _compile_checks(
+    max_line_length: int,
+    check_excessive_whitespace: bool,
+    variable_pattern: str,
+    block_pattern: str,
+    jinja_delimiters: Tuple[str, ...]
+) -> ValidationChecks:
+    """Compile validation settings (cached per distinct settings)."""
+    jinja_patterns = {
+        'variable': (variable_pattern, 'Unrendered Jinja2 variable'),
+        'block': (block_pattern, 'Unrendered Jinja2 block'),
+    }
+    return ValidationChecks(
+        max_line_length=max_line_length,
+        check_excessive_whitespace=check_excessive_whitespace,
+        jinja_patterns=jinja_patterns,
+        jinja_regex=re.compile('|'.join(
+            f'(?P<{name}>{pattern})' for name, (pattern, _) in jinja_patterns.items()
+        )),
+        jinja_delimiters=jinja_delimiters,
+    )
+
+
+# Patterns for code quality issues (warning level)
+_WHITESPACE_DESCRIPTION = 'Excessive whitespace (20+ spaces)'
+_WHITESPACE_RUN = ' ' * 20
+_WHITESPACE_REGEX = re.compile(r'[^\S\n]{20,}')
+
+
+def _brackets_balanced(code: str) -> bool:
+    """Whether brackets outside comments and literals nest correctly."""
+    brackets = _COMMENTS_AND_LITERALS.sub(' ', code).translate(_BRACKETS_ONLY)
+    while True:
+        reduced = _MATCHED_PAIRS.sub('', brackets)
+        if len(reduced) == len(brackets):
+            return not reduced
+        brackets = reduced
+
+
+def _locate_bracket_errors(code: str) -> Dict[str, Tuple[int, str]]:
+    """Find the first bracket problem per bracket kind.
+
+    A bracket-balance state machine over the code's tokens; brackets
+    inside comments and string/char literals are skipped.
+
+    Returns:
+        Opening character -> (line number, description)
+    """
+    issues: Dict[str, Tuple[int, str]] = {}
+    stack: List[Tuple[str, int]] = []
+    line_num = 1
+    for match in _BRACKET_TOKENS.finditer(code):
+        kind = match.lastgroup
+        if kind == 'newline':
+            line_num += 1
+        elif kind == 'open':
+            stack.append((match.group(), line_num))
+        elif kind == 'close':
+            char = match.group()
+            opening = _BRACKET_PAIRS[char]
+            if stack and stack[-1][0] == opening:
+                stack.pop()
+            elif any(open_char == opening for open_char, _ in stack):
+                # Recover at the matching opener; everything above it is unclosed
+                while stack[-1][0] != opening:
+                    open_char, open_line = stack.pop()
+                    issues.setdefault(
+                        open_char, (open_line, f"'{open_char}' opened at line {open_line} is never closed")
+                    )
+                stack.pop()
+            else:
+                issues.setdefault(opening, (line_num, f"unexpected '{char}' at line {line_num}"))
+        else:
+            # Comment or literal (may span lines)
+            line_num += match.group().count('\n')
+    for opening, open_line in stack:
+        issues.setdefault(opening, (open_line, f"'{opening}' opened at line {open_line} is never closed"))
+    return issues
+
+
+def _shorten(line: str) -> str:
+    """Shorten a line for messages."""
+    return line[:80] + '...' if len(line) > 80 else line
+
+
 class JavaCodeValidator:
-    """Validator for generated Java code."""
+    """Validator for generated Java code.
+
+    Patterns are compiled once per configuration. Each check runs over the whole
+    document at C speed (substring search, one regex pass, str.translate)
+    rather than per line; the per-token bracket state machine only runs to
+    locate errors once the fast check has found an imbalance. Brackets in
+    comments and string/char literals are ignored; Jinja2 leftovers are
+    reported wherever they occur.
+    """
 
     def __init__(self):
         """Initialize validator with config settings."""
-        validation_config = _config['validation']
+        self._checks = load_validation_checks()
 
         # Maximum line length for Java code
-        self.MAX_LINE_LENGTH = validation_config.get('max_line_length', 120)
+        self.MAX_LINE_LENGTH = self._checks.max_line_length
 
         # Check for excessive whitespace
-        self.check_excessive_whitespace = validation_config.get('check_excessive_whitespace', True)
-
-        # Patterns that might indicate rendering issues (error level)
-        # Use custom delimiters from config
-        var_pattern = validation_config.get('jinja2_variable_pattern', r'<<\s*[\w\.\[\]"\'\(\)]+\s*>>')
-        block_pattern = validation_config.get('jinja2_block_pattern', r'<%\s*(for|if|endif|endfor|else|elif)\s+.*?%>')
-
-        self.ERROR_PATTERNS = [
-            (var_pattern, 'Unrendered Jinja2 variable'),
-            (block_pattern, 'Unrendered Jinja2 block'),
-        ]
+        self.check_excessive_whitespace = self._checks.check_excessive_whitespace
 
-        # Patterns for code quality issues (warning level)
+        self.ERROR_PATTERNS = list(self._checks.jinja_patterns.values())
         self.WARNING_PATTERNS = [
-            (r'\s{20,}', 'Excessive whitespace (20+ spaces)'),
+            (_WHITESPACE_REGEX.pattern, _WHITESPACE_DESCRIPTION),
         ]
 
     def validate_rendered_java(self, java_code: str) -> TemplateValidationResult:
@@ -105,103 +259,111 @@ class JavaCodeValidator:
         Returns:
             TemplateValidationResult with any errors or warnings found
         """
-        errors = []
-        warnings = []
+        errors: List[TemplateValidationError] = []
+        warnings: List[TemplateValidationError] = []
 
         lines = java_code.split('\n')
 
-        # Check each line
-        for line_num, line in enumerate(lines, start=1):
-            # Check line length
-            if len(line) > self.MAX_LINE_LENGTH:
+        # Check line length
+        for index, length in enumerate(map(len, lines)):
+            if length > self.MAX_LINE_LENGTH:
                 warnings.append(TemplateValidationError(
                     error_type='long_line',
-                    message=f'Line exceeds {self.MAX_LINE_LENGTH} characters ({len(line)} chars)',
-                    line_number=line_num,
-                    line_content=line[:80] + '...' if len(line) > 80 else line,
+                    message=f'Line exceeds {self.MAX_LINE_LENGTH} characters ({length} chars)',
+                    line_number=index + 1,
+                    line_content=_shorten(lines[index]),
                     severity='warning'
                 ))
 
-            # Check for error patterns
-            for pattern, description in self.ERROR_PATTERNS:
-                if re.search(pattern, line):
-                    # Skip if this looks like a Java array initializer (e.g., {{1,2,3}})
-                    # which is valid Java syntax
-                    if pattern == r'\{\s*\{' and re.search(r'\{\s*\{[\d\.,\s]+\}', line):
-                        continue
-
-                    errors.append(TemplateValidationError(
-                        error_type='rendering_error',
-                        message=f'{description}',
-                        line_number=line_num,
-                        line_content=line[:80] + '...' if len(line) > 80 else line,
-                        severity='error'
-                    ))
-
-            # Check for warning patterns
-            for pattern, description in self.WARNING_PATTERNS:
-                if re.search(pattern, line):
-                    warnings.append(TemplateValidationError(
-                        error_type='code_quality',
-                        message=f'{description}',
-                        line_number=line_num,
-                        line_content=line[:80] + '...' if len(line) > 80 else line,
-                        severity='warning'
-                    ))
+        # Check for unrendered Jinja2 (at most one error per pattern per line)
+        checks = self._checks
+        if any(delimiter in java_code for delimiter in checks.jinja_delimiters):
+            reported = set()
+            for match in checks.jinja_regex.finditer(java_code):
+                line_num = java_code.count('\n', 0, match.start()) + 1
+                if (match.lastgroup, line_num) in reported:
+                    continue
+                reported.add((match.lastgroup, line_num))
+                errors.append(TemplateValidationError(
+                    error_type='rendering_error',
+                    message=checks.jinja_patterns[match.lastgroup][1],
+                    line_number=line_num,
+                    line_content=_shorten(lines[line_num - 1]),
+                    severity='error'
+                ))
+
+        # Check for excessive whitespace
+        if self.check_excessive_whitespace:
+            for line_num in self._excessive_whitespace_lines(java_code):
+                warnings.append(TemplateValidationError(
+                    error_type='code_quality',
+                    message=_WHITESPACE_DESCRIPTION,
+                    line_number=line_num,
+                    line_content=_shorten(lines[line_num - 1]),
+                    severity='warning'
+                ))
 
         # Check for basic Java syntax issues
         syntax_errors = self._check_basic_syntax(java_code)
         errors.extend(syntax_errors)
 
-        is_valid = len(errors) == 0
+        warnings.sort(key=lambda w: w.line_number)
 
         return TemplateValidationResult(
-            is_valid=is_valid,
+            is_valid=len(errors) == 0,
             errors=errors,
             warnings=warnings
         )
 
+    @staticmethod
+    def _excessive_whitespace_lines(java_code: str) -> List[int]:
+        """Line numbers containing a run of 20+ whitespace characters."""
+        if any(c in java_code for c in '\t\r\f\v'):
+            matches = (m.start() for m in _WHITESPACE_REGEX.finditer(java_code))
+        else:
+            # Spaces only: plain substring search
+            def space_runs():
+                pos = java_code.find(_WHITESPACE_RUN)
+                while pos != -1:
+                    yield pos
+                    pos = java_code.find(_WHITESPACE_RUN, pos + 1)
+            matches = space_runs()
+
+        line_nums = []
+        counted, line_num = 0, 1
+        for pos in matches:
+            line_num += java_code.count('\n', counted, pos)
+            counted = pos
+            if not line_nums or line_nums[-1] != line_num:
+                line_nums.append(line_num)
+        return line_nums
+
     def _check_basic_syntax(self, java_code: str) -> List[TemplateValidationError]:
-        """Check for basic Java syntax issues.
+        """Check that braces, brackets and parentheses nest correctly.
 
         Args:
             java_code: The Java code to check
 
         Returns:
-            List of validation errors found
+            List of validation errors found (at most one per bracket kind)
         """
-        errors = []
-
-        # Check brace balance
-        open_braces = java_code.count('{')
-        close_braces = java_code.count('}')
-        if open_braces != close_braces:
-            errors.append(TemplateValidationError(
-                error_type='brace_mismatch',
-                message=f'Mismatched braces: {open_braces} opening, {close_braces} closing',
-                severity='error'
-            ))
-
-        # Check bracket balance
-        open_brackets = java_code.count('[')
-        close_brackets = java_code.count(']')
-        if open_brackets != close_brackets:
-            errors.append(TemplateValidationError(
-                error_type='bracket_mismatch',
-                message=f'Mismatched brackets: {open_brackets} opening, {close_brackets} closing',
-                severity='error'
-            ))
-
-        # Check parenthesis balance
-        open_parens = java_code.count('(')
-        close_parens = java_code.count(')')
-        if open_parens != close_parens:
-            errors.append(TemplateValidationError(
-                error_type='paren_mismatch',
-                message=f'Mismatched parentheses: {open_parens} opening, {close_parens} closing',
-                severity='error'
-            ))
+        if _brackets_balanced(java_code):
+            return []
 
+        errors = []
+        lines = java_code.split('\n')
+        issues = _locate_bracket_errors(java_code)
+        for opening in ('{', '[', '('):
+            if opening in issues:
+                line_num, detail = issues[opening]
+                error_type, name = _BRACKET_KINDS[opening]
+                errors.append(TemplateValidationError(
+                    error_type=error_type,
+                    message=f'Mismatched {name}: {detail}',
+                    line_number=line_num,
+                    line_content=_shorten(lines[line_num - 1]),
+                    severity='error'
+                ))
         return errors
 
     def validate_java_file(self, file_path: Path) -> TemplateValidationResult:
@@ -232,7 +394,8 @@ class JavaCodeValidator:
 def validate_generated_java(java_code: str) -> TemplateValidationResult:
     """Validate generated Java code.
 
-    Convenience function for validating Java code.
+    Convenience function for validating Java code. Settings are read from
+    config on every call, so config edits take effect.
 
     Args:
         java_code: The rendered Java code as a string
@@ -240,8 +403,48 @@ def validate_generated_java(java_code: str) -> TemplateValidationResult:
     Returns:
         TemplateValidationResult with any errors or warnings found
     """
-    validator = JavaCodeValidator()
-    return validator.validate_rendered_java(java_code)
+    return JavaCodeValidator().validate_rendered_java(java_code)
+
+
+def quick_validate_java(
+    java_code: str,
+    min_size: int = 0,
+    checks: Optional[ValidationChecks] = None
+) -> TemplateValidationResult:
+    """Cheap sanity check for Java rendered from a certified template.
+
+    Only checks what can still vary per job once the template has been
+    certified: the output is at least as large as the template's static
+    part and contains no unrendered Jinja2.
+
+    Args:
+        java_code: The rendered Java code as a string
+        min_size: Minimum expected size in characters
+        checks: Checks resolved once per run (see load_validation_checks);
+                default: loaded from config on every call
+
+    Returns:
+        TemplateValidationResult with any errors found (no warnings)
+    """
+    errors = []
+    if len(java_code) < min_size:
+        errors.append(TemplateValidationError(
+            error_type='size_mismatch',
+            message=f'Rendered code is smaller than expected ({len(java_code)} < {min_size} chars)',
+            severity='error'
+        ))
+    if checks is None:
+        checks = load_validation_checks()
+    if any(delimiter in java_code for delimiter in checks.jinja_delimiters):
+        match = checks.jinja_regex.search(java_code)
+        if match:
+            errors.append(TemplateValidationError(
+                error_type='rendering_error',
+                message=checks.jinja_patterns[match.lastgroup][1],
+                line_number=java_code.count('\n', 0, match.start()) + 1,
+                severity='error'
+            ))
+    return TemplateValidationResult(is_valid=len(errors) == 0, errors=errors, warnings=[])
 
 
 def validate_java_file(file_path: Path) -> TemplateValidationResult:
@@ -255,5 +458,4 @@ def validate_java_file(file_path: Path) -> TemplateValidationResult:
     Returns:
         TemplateValidationResult with any errors or warnings found
     """
-    validator = JavaCodeValidator()
-    return validator.validate_java_file(file_path)
+    return JavaCodeValidator().validate_java_file(file_path)
@@ -1,9 +1,25 @@
-"""Visualization utilities for lattice structure analysis."""
+"""Visualization utilities for lattice structure analysis.
 
-from .parametric_study_visualizer import (
-    ParametricStudyVisualizer,
-    create_visualizer_from_config,
-)
+Exports are loaded lazily (PEP 562) so that matplotlib and seaborn are
+only imported when a visualizer is used.
+"""
+
+from typing import TYPE_CHECKING
+
+from src.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .parametric_study_visualizer import (
+        ParametricStudyVisualizer,
+        create_visualizer_from_config,
+    )
+
+_EXPORTS = {
+    'ParametricStudyVisualizer': 'src.visualization.parametric_study_visualizer',
+    'create_visualizer_from_config': 'src.visualization.parametric_study_visualizer',
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     'ParametricStudyVisualizer',
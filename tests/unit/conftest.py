@@ -0,0 +1,55 @@
+"""Shared fixtures for the unit tests."""
+
+from pathlib import Path
+
+import pytest
+
+from src.parsers import load_custom_lattice_yaml
+from src.services.job_generator import JobGenerator
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+TEMPLATES_DIR = PROJECT_ROOT / "templates"
+SIMPLE_CUBIC_YAML = TEMPLATES_DIR / "lattice_setting" / "simple_cubic.yml"
+
+
+@pytest.fixture
+def project_root():
+    """Repository root."""
+    return PROJECT_ROOT
+
+
+@pytest.fixture
+def templates_dir():
+    """Directory with the Jinja2 templates and lattice settings."""
+    return TEMPLATES_DIR
+
+
+@pytest.fixture
+def simple_cubic_yaml():
+    """Path of the simple cubic lattice definition."""
+    return SIMPLE_CUBIC_YAML
+
+
+@pytest.fixture
+def custom_job():
+    """Load the simple cubic lattice definition (a fresh copy per test)."""
+    return load_custom_lattice_yaml(SIMPLE_CUBIC_YAML, strict=False)
+
+
+@pytest.fixture
+def generator(tmp_path):
+    """JobGenerator writing into a temporary directory."""
+    return JobGenerator(
+        template_dir=TEMPLATES_DIR,
+        output_base_dir=tmp_path,
+        metadata_run_table=False
+    )
+
+
+@pytest.fixture
+def fake_executor():
+    """Stand-in for execute_job that does not run COMSOL."""
+    def execute(job_dir):
+        assert (Path(job_dir) / "run.bat").exists()
+    return execute
@@ -0,0 +1,127 @@
+"""Unit tests for adaptive grid refinement."""
+
+import math
+
+import pytest
+
+from src.optimizers.adaptive_grid import AdaptiveGridRefiner, GridCell
+
+
+def step_response(param_set):
+    """Synthetic property with a sharp step at sphere.radius = 1.3."""
+    radius = param_set.parameters['sphere.radius']
+    return math.tanh((radius - 1.3) * 20.0)
+
+
+def evaluate(batch):
+    """Evaluate a batch with the synthetic response."""
+    return [step_response(ps) for ps in batch]
+
+
+class TestGridCell:
+    """Tests for cell geometry."""
+
+    def test_split(self):
+        """Test that splitting a 2D cell yields 4 quadrants."""
+        cell = GridCell((0.0, 0.0), (1.0, 2.0))
+
+        children = cell.split()
+
+        assert len(children) == 4
+        assert children[0].lower == (0.0, 0.0) and children[0].upper == (0.5, 1.0)
+        assert all(child.level == 1 for child in children)
+
+
+class TestAdaptiveGridRefiner:
+    """Tests for the refinement loop."""
+
+    AXES = {'sphere.radius': [0.5, 1.0, 1.5, 2.0], 'beam.thickness': [0.5, 1.5]}
+
+    def test_refines_only_around_step(self):
+        """Test that new points concentrate around the sharp change."""
+        refiner = AdaptiveGridRefiner(self.AXES, tolerance=0.2, max_level=3)
+
+        results = refiner.run(evaluate)
+
+        refined = [p for p in results if p[0] not in (0.5, 1.0, 1.5, 2.0)]
+        assert refined
+        assert all(1.0 < p[0] < 1.5 for p in refined)
+        # Far fewer points than a uniform grid at the finest spacing (25 x 9)
+        assert len(results) < 60
+
+    def test_threshold_crossing(self):
+        """Test that cells straddling a threshold are refined."""
+        refiner = AdaptiveGridRefiner(self.AXES, thresholds=[0.0], max_level=2)
+
+        refiner.run(evaluate)
+
+        finest = [c for c in refiner.cells if c.level == 2]
+        assert finest
+        assert all(c.lower[0] >= 1.0 and c.upper[0] <= 1.5 for c in finest)
+
+    def test_budget(self):
+        """Test that the number of evaluated points never exceeds the budget."""
+        refiner = AdaptiveGridRefiner(self.AXES, tolerance=0.01, max_level=5, budget=20)
+
+        results = refiner.run(evaluate)
+
+        assert 8 <= len(results) <= 20
+
+    def test_reuses_existing_results(self):
+        """Test that points with results are not requested again."""
+        refiner = AdaptiveGridRefiner(self.AXES, tolerance=0.2)
+        coarse = refiner.initial_parameter_sets()
+        for ps in coarse:
+            refiner.add_result(ps, step_response(ps))
+
+        assert refiner.initial_parameter_sets() == []
+
+        first = refiner.refine()
+        second_refiner_points = {
+            tuple(ps.parameters[n] for n in refiner.parameter_names) for ps in first
+        }
+        assert not second_refiner_points & set(refiner.results)
+
+    def test_failed_points_are_not_refined(self):
+        """Test that cells with failed corners are left alone."""
+        refiner = AdaptiveGridRefiner(self.AXES, tolerance=0.2)
+
+        refiner.run(lambda batch: [None] * len(batch))
+
+        assert refiner.num_evaluated == 8
+        assert all(c.level == 0 for c in refiner.cells)
+
+    def test_constraints_skip_infeasible_points(self):
+        """Test that infeasible points are neither requested nor refined."""
+        constraint = "sphere.radius < 1.4 or beam.thickness < 1.0"
+        refiner = AdaptiveGridRefiner(self.AXES, tolerance=0.2, max_level=3, constraints=[constraint])
+
+        requested = []
+
+        def record(batch):
+            requested.extend(batch)
+            return evaluate(batch)
+
+        refiner.run(record)
+
+        assert requested
+        assert all(
+            ps.parameters['sphere.radius'] < 1.4 or ps.parameters['beam.thickness'] < 1.0
+            for ps in requested
+        )
+        assert not refiner.is_feasible((1.5, 1.5))
+
+    def test_from_job(self, custom_job):
+        """Test building the coarse grid from the job's sweeps."""
+
+        refiner = AdaptiveGridRefiner.from_job(custom_job, tolerance=0.1)
+        param_sets = refiner.initial_parameter_sets()
+
+        assert len(param_sets) == 6
+        assert len(refiner.cells) == 2
+        assert param_sets[0].job_id == "job_001"
+
+    def test_requires_criterion(self):
+        """Test that a tolerance or threshold is required."""
+        with pytest.raises(ValueError):
+            AdaptiveGridRefiner(self.AXES)
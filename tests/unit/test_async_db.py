@@ -0,0 +1,107 @@
+"""Unit tests for the asyncio database manager."""
+
+import asyncio
+from importlib.util import find_spec
+
+import pytest
+from sqlalchemy import select, text
+
+from src.data.db import DatabaseConfig
+from src.data.models import ComsolJob, ComsolRun, parameter_hash
+
+requires_async_sqlite = pytest.mark.skipif(
+    find_spec("greenlet") is None or find_spec("aiosqlite") is None,
+    reason="requires sqlalchemy[asyncio] (greenlet) and aiosqlite"
+)
+
+
+class TestAsyncConfig:
+    """Tests for the async engine configuration."""
+
+    @pytest.mark.parametrize("url, expected", [
+        ("sqlite:///esp.db", "sqlite+aiosqlite:///esp.db"),
+        ("postgresql://esp:pw@db/esp", "postgresql+asyncpg://esp:pw@db/esp"),
+        ("postgresql+psycopg2://esp:pw@db/esp", "postgresql+asyncpg://esp:pw@db/esp"),
+        ("postgresql+asyncpg://esp:pw@db/esp", "postgresql+asyncpg://esp:pw@db/esp"),
+        ("postgresql+psycopg://esp:pw@db/esp", "postgresql+psycopg://esp:pw@db/esp"),
+    ])
+    def test_async_database_url(self, url, expected):
+        """Test that sync URLs are switched to the asyncio driver."""
+        assert DatabaseConfig(url).async_database_url == expected
+
+    def test_async_engine_config(self):
+        """Test pool settings carried over from DatabaseConfig."""
+        config = DatabaseConfig("postgresql://esp@db/esp", pool_size=3, max_overflow=2)
+        engine_config = config.create_async_engine_config()
+        assert engine_config['pool_size'] == 3 and engine_config['max_overflow'] == 2
+        assert engine_config['pool_pre_ping'] is True
+        assert 'poolclass' not in engine_config
+
+
+@requires_async_sqlite
+class TestAsyncDatabaseManager:
+    """Tests for AsyncDatabaseManager on SQLite."""
+
+    def test_session_scope_commit_and_rollback(self, tmp_path):
+        """Test commits, rollback on error and the SQLite pragmas."""
+        from src.data.async_db import init_async_db
+
+        async def main():
+            db_manager = await init_async_db(f"sqlite:///{tmp_path / 'esp.db'}")
+            try:
+                async with db_manager.session_scope() as session:
+                    session.add(ComsolRun(run_id='run_001', job_name='simple_cubic'))
+
+                with pytest.raises(RuntimeError):
+                    async with db_manager.session_scope() as session:
+                        session.add(ComsolRun(run_id='run_002', job_name='simple_cubic'))
+                        await session.flush()
+                        raise RuntimeError("supervisor failed")
+
+                async with db_manager.session_scope() as session:
+                    run_ids = (await session.scalars(select(ComsolRun.run_id))).all()
+                    journal_mode = (await session.execute(text("PRAGMA journal_mode"))).scalar()
+                    foreign_keys = (await session.execute(text("PRAGMA foreign_keys"))).scalar()
+                return run_ids, journal_mode, foreign_keys
+            finally:
+                await db_manager.close()
+
+        run_ids, journal_mode, foreign_keys = asyncio.run(main())
+        assert run_ids == ['run_001']
+        assert journal_mode == 'wal'
+        assert foreign_keys == 1
+
+    def test_concurrent_state_transitions(self, tmp_path):
+        """Test that supervisor tasks record transitions concurrently."""
+        from src.data.async_db import init_async_db
+
+        async def main():
+            db_manager = await init_async_db(f"sqlite:///{tmp_path / 'esp.db'}")
+            try:
+                async with db_manager.session_scope() as session:
+                    run = ComsolRun(run_id='run_001', job_name='simple_cubic')
+                    for i in range(1, 6):
+                        parameters = {'sphere.radius': float(i)}
+                        run.jobs.append(ComsolJob(
+                            job_id=f"job_{i:03d}", parameters=parameters,
+                            parameter_hash=parameter_hash(parameters)
+                        ))
+                    session.add(run)
+
+                async def supervise(job_id):
+                    for status in ('running', 'succeeded'):
+                        async with db_manager.session_scope() as session:
+                            job = (await session.scalars(
+                                select(ComsolJob).where(ComsolJob.job_id == job_id)
+                            )).one()
+                            job.status = status
+                        await asyncio.sleep(0)
+
+                await asyncio.gather(*(supervise(f"job_{i:03d}") for i in range(1, 6)))
+
+                async with db_manager.session_scope() as session:
+                    return (await session.scalars(select(ComsolJob.status))).all()
+            finally:
+                await db_manager.close()
+
+        assert asyncio.run(main()) == ['succeeded'] * 5
@@ -0,0 +1,144 @@
+"""Unit tests for the COMSOL run/job/result models."""
+
+import pytest
+from sqlalchemy import select
+
+from src.data.db import DatabaseConfig, DatabaseManager, copy_csv_payload
+from src.data.models import ComsolExecution, ComsolJob, ComsolRun, StiffnessMatrix, parameter_hash
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    """File-backed SQLite database with all tables."""
+    manager = DatabaseManager(DatabaseConfig(f"sqlite:///{tmp_path / 'esp.db'}"))
+    manager.initialize()
+    manager.create_tables()
+    yield manager
+    manager.close()
+
+
+def _add_run(session, run_id, radii, status='succeeded'):
+    run = ComsolRun(run_id=run_id, job_name='simple_cubic')
+    for i, radius in enumerate(radii, 1):
+        parameters = {'sphere.radius': radius, 'beam.thickness': 1.0}
+        run.jobs.append(ComsolJob(
+            job_id=f"job_{i:03d}",
+            status=status,
+            parameters=parameters,
+            parameter_hash=parameter_hash(parameters)
+        ))
+    session.add(run)
+    return run
+
+
+def _query_plan(session, statement):
+    compiled = statement.compile(session.bind, compile_kwargs={'literal_binds': True})
+    rows = session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}").fetchall()
+    return ' '.join(str(row[-1]) for row in rows)
+
+
+class TestParameterHash:
+    """Tests for parameter_hash."""
+
+    def test_canonical_hash(self):
+        """Test that key order, int/float and float noise do not change the hash."""
+        reference = parameter_hash({'sphere.radius': 1.75, 'beam.thickness': 1})
+        assert parameter_hash({'beam.thickness': 1.0, 'sphere.radius': 1.7500000000000002}) == reference
+        assert parameter_hash({'sphere.radius': 1.76, 'beam.thickness': 1.0}) != reference
+        assert len(reference) == 64
+
+
+class TestComsolModels:
+    """Tests for the COMSOL tables and their indexes."""
+
+    def test_run_job_execution_stiffness(self, db_manager):
+        """Test relationships from a run down to a stiffness matrix."""
+        with db_manager.session_scope() as session:
+            run = _add_run(session, 'run_001', [1.5])
+            job = run.jobs[0]
+            execution = ComsolExecution(job=job, attempt=1, status='succeeded', returncode=0)
+            job.stiffness_matrices.append(StiffnessMatrix(execution=execution, c11=10.0, c12=4.0, c44=3.0))
+
+        with db_manager.session_scope() as session:
+            run = session.scalars(select(ComsolRun)).one()
+            job, = run.jobs
+            assert job.executions[0].status == 'succeeded'
+            assert job.stiffness_matrices[0].c11 == 10.0
+            assert job.stiffness_matrices[0].unit == 'GPa'
+            assert job.stiffness_matrices[0].execution is job.executions[0]
+
+    def test_lookup_across_runs(self, db_manager):
+        """Test the historical parameter-set lookup and its index."""
+        with db_manager.session_scope() as session:
+            _add_run(session, 'run_001', [1.5, 1.75], status='succeeded')
+            _add_run(session, 'run_002', [1.75, 2.0], status='failed')
+
+        with db_manager.session_scope() as session:
+            statement = ComsolJob.select_by_parameters({'sphere.radius': 1.75, 'beam.thickness': 1.0})
+            assert len(session.scalars(statement).all()) == 2
+
+            succeeded = ComsolJob.select_by_parameters(
+                {'beam.thickness': 1, 'sphere.radius': 2.0}, status='succeeded'
+            )
+            assert session.scalars(succeeded).first() is None
+            assert 'ix_comsol_jobs_parameter_hash_status' in _query_plan(session, succeeded)
+
+    def test_parameter_range_filter_uses_index(self, db_manager):
+        """Test range filters on indexed sweep parameters."""
+        with db_manager.session_scope() as session:
+            _add_run(session, 'run_001', [1.5, 1.75, 2.0])
+
+        with db_manager.session_scope() as session:
+            statement = select(ComsolJob).where(ComsolJob.parameter('sphere.radius') > 1.6)
+            assert sorted(job.job_id for job in session.scalars(statement)) == ['job_002', 'job_003']
+            assert 'ix_comsol_jobs_param_sphere_radius' in _query_plan(session, statement)
+
+    def test_upsert_jobs_by_run_and_job_id(self, db_manager):
+        """Test idempotent job ingestion with the (comsol_run_id, job_id) constraint."""
+        with db_manager.session_scope() as session:
+            _add_run(session, 'run_001', [])
+        with db_manager.session_scope() as session:
+            run_pk = session.scalars(select(ComsolRun.id)).one()
+
+        rows = [
+            {'comsol_run_id': run_pk, 'job_id': f"job_{i:03d}", 'status': 'generated',
+             'parameters': {'sphere.radius': 1.5 + i}}
+            for i in range(3)
+        ]
+        db_manager.upsert(ComsolJob, rows, conflict_columns=['comsol_run_id', 'job_id'])
+        db_manager.upsert(
+            ComsolJob, [{**row, 'status': 'succeeded', 'parameters': {'sphere.radius': 2.5}} for row in rows],
+            conflict_columns=['comsol_run_id', 'job_id']
+        )
+
+        with db_manager.session_scope() as session:
+            jobs = session.scalars(select(ComsolJob)).all()
+            assert [job.status for job in jobs] == ['succeeded'] * 3
+            assert {job.parameter_hash for job in jobs} == {parameter_hash({'sphere.radius': 2.5})}
+
+    def test_parameter_hash_derived_from_parameters(self, db_manager):
+        """Test that writers do not have to compute parameter_hash."""
+        parameters = {'sphere.radius': 1.75, 'beam.thickness': 1.0}
+        with db_manager.session_scope() as session:
+            run = ComsolRun(run_id='run_001', job_name='simple_cubic')
+            run.jobs.append(ComsolJob(job_id='job_001', parameters=parameters))
+            session.add(run)
+        with db_manager.session_scope() as session:
+            run_pk = session.scalars(select(ComsolRun.id)).one()
+        db_manager.bulk_insert(ComsolJob, [
+            {'comsol_run_id': run_pk, 'job_id': 'job_002', 'parameters': parameters}
+        ])
+
+        with db_manager.session_scope() as session:
+            jobs = session.scalars(ComsolJob.select_by_parameters(parameters)).all()
+            assert sorted(job.job_id for job in jobs) == ['job_001', 'job_002']
+
+            job = jobs[0]
+            job.parameters = {'sphere.radius': 2.0}
+            assert job.parameter_hash == parameter_hash({'sphere.radius': 2.0})
+
+        columns, payload = copy_csv_payload(ComsolJob.__table__, [
+            {'comsol_run_id': run_pk, 'job_id': 'job_003', 'parameters': parameters}
+        ])
+        assert 'parameter_hash' in columns
+        assert f'"{parameter_hash(parameters)}"' in payload
@@ -0,0 +1,86 @@
+"""Unit tests for memoized config loading."""
+
+import os
+
+import pytest
+
+from src.config import loader
+from src.config.loader import clear_config_cache, load_config
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    """Isolate tests from configs cached by other tests."""
+    clear_config_cache()
+    yield
+    clear_config_cache()
+
+
+@pytest.fixture
+def count_parses(monkeypatch):
+    """Count YAML parses done by load_config."""
+    calls = []
+    safe_load = loader.yaml.safe_load
+
+    def counting(stream):
+        calls.append(stream)
+        return safe_load(stream)
+
+    monkeypatch.setattr(loader.yaml, "safe_load", counting)
+    return calls
+
+
+class TestLoadConfigCache:
+    """Tests for the process-wide config cache."""
+
+    def test_parsed_once(self, tmp_path, count_parses):
+        """Test that repeated loads reuse the parsed file."""
+        path = tmp_path / "job.yml"
+        path.write_text("base: /data\nout: ${base}/out\n", encoding="utf-8")
+
+        first = load_config(path)
+        second = load_config(str(path))
+        assert first == second == {'base': '/data', 'out': '/data/out'}
+        assert len(count_parses) == 1
+
+        # Results are copies: mutating one does not leak into the cache
+        first['base'] = 'changed'
+        assert load_config(path)['base'] == '/data'
+
+    def test_edited_file_reloaded(self, tmp_path, count_parses):
+        """Test that a changed mtime or size invalidates the cache."""
+        path = tmp_path / "job.yml"
+        path.write_text("value: 1\n", encoding="utf-8")
+        assert load_config(path) == {'value': 1}
+
+        path.write_text("value: 22\n", encoding="utf-8")
+        assert load_config(path) == {'value': 22}
+
+        # Same size, only the mtime changes
+        path.write_text("value: 33\n", encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert load_config(path) == {'value': 33}
+        assert len(count_parses) == 3
+
+    def test_explicit_invalidation(self, tmp_path, count_parses):
+        """Test clear_config_cache for a single path."""
+        path = tmp_path / "job.yml"
+        path.write_text("value: 1\n", encoding="utf-8")
+        load_config(path)
+        load_config(path, resolve_vars=False)
+
+        clear_config_cache(path)
+        load_config(path)
+        assert len(count_parses) == 3
+
+    def test_dotenv_loaded_once(self, monkeypatch):
+        """Test that get_current_env reads .env only once per process."""
+        dotenv = pytest.importorskip("dotenv")
+        calls = []
+        monkeypatch.setattr(dotenv, "load_dotenv", lambda *a, **k: calls.append(1))
+        monkeypatch.setattr(loader, "_dotenv_loaded", False)
+
+        for _ in range(3):
+            loader.get_current_env()
+        assert len(calls) == 1
@@ -0,0 +1,100 @@
+"""Unit tests for DatabaseManager bulk insert and upsert."""
+
+import csv
+import datetime
+import io
+import json
+
+import pytest
+from sqlalchemy import func, select
+
+from src.data.db import DatabaseConfig, DatabaseManager, copy_csv_payload
+from src.data.models import ComsolJob, MaterialSystem
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    """File-backed SQLite database with all tables."""
+    manager = DatabaseManager(DatabaseConfig(f"sqlite:///{tmp_path / 'esp.db'}", bulk_batch_size=7))
+    manager.initialize()
+    manager.create_tables()
+    yield manager
+    manager.close()
+
+
+def _materials(n, offset=0):
+    for i in range(offset, offset + n):
+        yield {'id': i + 1, 'name': f"material_{i}", 'formula': 'Al', 'num_atoms': i}
+
+
+class TestBulkInsert:
+    """Tests for DatabaseManager.bulk_insert."""
+
+    def test_insert_in_batches(self, db_manager):
+        """Test that a generator is inserted across batches with column defaults."""
+        assert db_manager.bulk_insert(MaterialSystem, _materials(50)) == 50
+
+        with db_manager.session_scope() as session:
+            assert session.scalar(select(func.count()).select_from(MaterialSystem)) == 50
+            material = session.get(MaterialSystem, 50)
+            assert material.name == 'material_49'
+            assert material.created_at is not None
+
+    def test_failed_batch_rolls_back(self, db_manager):
+        """Test that the whole call is one transaction."""
+        rows = list(_materials(20)) + list(_materials(1))  # duplicate primary key
+        with pytest.raises(Exception):
+            db_manager.bulk_insert(MaterialSystem.__table__, rows)
+
+        with db_manager.session_scope() as session:
+            assert session.scalar(select(func.count()).select_from(MaterialSystem)) == 0
+
+    def test_copy_payload(self):
+        """Test NULLs, quoting, JSON values and defaults in the COPY CSV."""
+        rows = [
+            {'comsol_run_id': 1, 'job_id': 'job_001', 'status': '', 'parameters': {'sphere.radius': 1.0},
+             'parameter_hash': 'a"b', 'mesh_size': None,
+             'generated_at': datetime.datetime(2026, 1, 2, 3, 4, 5)},
+        ]
+        columns, payload = copy_csv_payload(ComsolJob.__table__, rows)
+
+        assert columns[:7] == list(rows[0])
+        assert {'created_at', 'updated_at'} <= set(columns)
+        line = payload.splitlines()[0]
+        assert line.startswith('1,"job_001","","{""sphere.radius"": 1.0}","a""b",,"2026-01-02T03:04:05",')
+
+        fields = next(csv.reader(io.StringIO(payload)))
+        assert json.loads(fields[3]) == {'sphere.radius': 1.0}
+        assert fields[4] == 'a"b'
+
+    def test_copy_requires_postgresql(self, db_manager):
+        """Test that COPY and unknown methods are rejected on SQLite."""
+        with pytest.raises(ValueError):
+            db_manager.bulk_insert(MaterialSystem, _materials(1), method='copy')
+        with pytest.raises(ValueError):
+            db_manager.bulk_insert(MaterialSystem, _materials(1), method='orm')
+
+
+class TestUpsert:
+    """Tests for DatabaseManager.upsert."""
+
+    def test_upsert_is_idempotent(self, db_manager):
+        """Test that re-running an ingestion updates instead of duplicating."""
+        db_manager.upsert(MaterialSystem, _materials(30))
+        updated = ({**row, 'formula': 'Cu'} for row in _materials(40))
+        assert db_manager.upsert(MaterialSystem, updated) == 40
+
+        with db_manager.session_scope() as session:
+            assert session.scalar(select(func.count()).select_from(MaterialSystem)) == 40
+            formulas = set(session.scalars(select(MaterialSystem.formula)))
+            assert formulas == {'Cu'}
+
+    def test_upsert_without_update_columns_keeps_rows(self, db_manager):
+        """Test that update_columns=[] only inserts missing rows."""
+        db_manager.upsert(MaterialSystem, _materials(5))
+        changed = ({**row, 'formula': 'Cu'} for row in _materials(10))
+        db_manager.upsert(MaterialSystem, changed, update_columns=[])
+
+        with db_manager.session_scope() as session:
+            assert session.get(MaterialSystem, 1).formula == 'Al'
+            assert session.get(MaterialSystem, 10).formula == 'Cu'
@@ -0,0 +1,139 @@
+"""Unit tests for the structured JSONL event log."""
+
+import os
+import threading
+
+import pytest
+
+from src.services.batch_executor import BatchExecutor
+from src.services.event_log import EVENTS_FILENAME, EventLog, read_events, summarize_stages
+from src.services.job_generator import JobGenerator
+
+
+class TestEventLog:
+    """Tests for EventLog."""
+
+    def test_stage_events(self, tmp_path):
+        """Test stage timing, bound fields and error status."""
+        events = EventLog(tmp_path / EVENTS_FILENAME, run_id='run_1').bind(job_id='job_001')
+
+        with events.stage('render') as info:
+            info['bytes'] = 10
+        with pytest.raises(ValueError):
+            with events.stage('validate'):
+                raise ValueError("bad")
+
+        render, validate = read_events(tmp_path)
+        assert render['stage'] == 'render'
+        assert render['run_id'] == 'run_1' and render['job_id'] == 'job_001'
+        assert render['status'] == 'ok' and render['bytes'] == 10
+        assert render['duration_ms'] >= 0
+        assert validate['status'] == 'error' and validate['error'] == 'ValueError'
+
+    def test_disabled_log_writes_nothing(self, tmp_path):
+        """Test that an EventLog without a path is a no-op."""
+        events = EventLog(None, run_id='run_1')
+        with events.stage('render') as info:
+            info['bytes'] = 10
+        events.emit('run_generated')
+        assert not events.enabled
+        assert not any(tmp_path.iterdir())
+
+    def test_bound_logs_share_one_handle(self, tmp_path):
+        """Test that the file is opened once and reopened after close()."""
+        with EventLog(tmp_path / EVENTS_FILENAME, run_id='run_1') as events:
+            assert not any(tmp_path.iterdir())
+            events.emit('run_started')
+            handle = events._file.file
+            events.bind(job_id='job_001').emit('job_started')
+            assert events._file.file is handle
+        assert handle.closed
+
+        events.emit('run_generated')
+        events.close()
+        assert [e['event'] for e in read_events(tmp_path)] == ['run_started', 'job_started', 'run_generated']
+
+    def test_concurrent_writers(self, tmp_path):
+        """Test that events from many threads are complete lines."""
+        events = EventLog(tmp_path / EVENTS_FILENAME)
+
+        def work(n):
+            for _ in range(100):
+                with events.bind(job_id=f"job_{n}").stage('render'):
+                    pass
+
+        threads = [threading.Thread(target=work, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert summarize_stages(tmp_path)['render']['count'] == 800
+
+    def test_summarize_stages(self):
+        """Test per-stage percentiles and error counts."""
+        records = [
+            {'event': 'stage', 'stage': 'render', 'duration_ms': float(ms), 'status': 'ok'}
+            for ms in range(1, 101)
+        ]
+        records.append({'event': 'stage', 'stage': 'job', 'duration_ms': 5.0, 'status': 'error'})
+        records.append({'event': 'run_generated', 'duration_ms': 1000.0})
+
+        summary = summarize_stages(records)
+        assert list(summary) == ['render', 'job']
+        assert summary['render']['p50_ms'] == pytest.approx(50.5)
+        assert summary['render']['p95_ms'] == pytest.approx(95.05)
+        assert summary['render']['max_ms'] == 100.0
+        assert summary['job'] == {
+            'count': 1, 'errors': 1, 'p50_ms': 5.0, 'p95_ms': 5.0, 'max_ms': 5.0, 'total_ms': 5.0
+        }
+
+
+class TestPipelineEvents:
+    """Tests for events emitted by JobGenerator and BatchExecutor."""
+
+    def test_generation_stages(self, tmp_path, custom_job, templates_dir):
+        """Test that a parametric study records every generation stage."""
+        generator = JobGenerator(
+            template_dir=templates_dir,
+            output_base_dir=tmp_path,
+            record_events=True
+        )
+        result = generator.generate_parametric_study_jobs(custom_job, run_id='run')
+
+        summary = summarize_stages(result['run_dir'])
+        for stage in ['geometry_build', 'geometry_validation', 'render',
+                      'java_validation', 'write_java', 'batch_file', 'metadata']:
+            assert summary[stage]['count'] == result['total_jobs']
+        assert summary['job']['count'] == result['total_jobs'] + result['skipped_jobs']
+
+        run_event, = read_events(result['run_dir'], 'run_generated')
+        assert run_event['jobs_generated'] == result['total_jobs']
+
+    def test_generation_without_events(self, tmp_path, custom_job, templates_dir):
+        """Test that record_events=False writes no event log."""
+        generator = JobGenerator(
+            template_dir=templates_dir,
+            output_base_dir=tmp_path,
+            record_events=False
+        )
+        result = generator.generate_parametric_study_jobs(custom_job, run_id='run')
+        assert not (result['run_dir'] / EVENTS_FILENAME).exists()
+
+    @pytest.mark.skipif(os.name != 'posix', reason="runs a shell script as the batch file")
+    def test_execution_stages(self, tmp_path):
+        """Test that batch execution records its stages in the run directory."""
+        job_dir = tmp_path / 'run_1' / 'job_001'
+        job_dir.mkdir(parents=True)
+        batch_file = job_dir / 'run.bat'
+        batch_file.write_text("#!/bin/sh\necho done\n", encoding='utf-8')
+        batch_file.chmod(0o755)
+
+        executor = BatchExecutor(timeout=30)
+        executor.is_wsl = False
+        result = executor.execute_batch(batch_file, convert_path=False)
+        assert result.returncode == 0
+
+        events = list(read_events(tmp_path / 'run_1'))
+        assert [e['stage'] for e in events] == ['convert_path', 'subprocess', 'decode_output', 'execution']
+        assert all(e['run_id'] == 'run_1' and e['job_id'] == 'job_001' for e in events)
+        assert events[1]['stdout_bytes'] == len("done\n")
@@ -0,0 +1,74 @@
+"""Unit tests for safe parameter expressions."""
+
+import numpy as np
+import pytest
+
+from src.utils.expressions import compile_expression
+
+
+class TestExpression:
+    """Tests for parsing and evaluating expressions."""
+
+    def test_dotted_parameter_names(self):
+        """Test that dotted and indexed parameter names are recognized."""
+        expr = compile_expression("beam.0.ratio <= 2 * beam.1.ratio and sphere.radius > 0.5")
+
+        assert expr.parameters == ['beam.0.ratio', 'beam.1.ratio', 'sphere.radius']
+        assert expr.evaluate({'beam.0.ratio': 1.0, 'beam.1.ratio': 0.6, 'sphere.radius': 1.0})
+        assert not expr.evaluate({'beam.0.ratio': 1.5, 'beam.1.ratio': 0.6, 'sphere.radius': 1.0})
+
+    def test_vectorized_broadcast(self):
+        """Test that array values broadcast over a grid."""
+        expr = compile_expression("beam.thickness * 0.795 / 2 < sphere.radius - 0.01")
+        radius = np.array([0.5, 1.0, 2.0]).reshape(3, 1)
+        thickness = np.array([1.0, 3.0]).reshape(1, 2)
+
+        mask = expr.evaluate({'sphere.radius': radius, 'beam.thickness': thickness})
+
+        assert mask.shape == (3, 2)
+        assert mask.tolist() == [[True, False], [True, False], [True, True]]
+
+    def test_chained_comparison_and_functions(self):
+        """Test chained comparisons and whitelisted functions."""
+        expr = compile_expression("0 < abs(sphere.radius - beam.thickness) <= max(sphere.radius, 1)")
+
+        assert expr.evaluate({'sphere.radius': 2.0, 'beam.thickness': 1.0})
+        assert not expr.evaluate({'sphere.radius': 1.0, 'beam.thickness': 1.0})
+
+    def test_min_max_with_many_arguments(self):
+        """Test that min/max reduce over more than two arguments."""
+        expr = compile_expression("max(beam.0.ratio, beam.1.ratio, beam.2.ratio) > 1")
+        values = {'beam.0.ratio': np.array([0.5, 0.5]), 'beam.1.ratio': 0.8,
+                  'beam.2.ratio': np.array([0.9, 1.2])}
+
+        assert expr.evaluate(values).tolist() == [False, True]
+        assert compile_expression("min(beam.0.ratio, beam.1.ratio, 2) < 0.6").evaluate(values).tolist() == [True, True]
+
+    @pytest.mark.parametrize("source", [
+        "abs(sphere.radius, 1)",
+        "sqrt()",
+        "max()",
+    ])
+    def test_rejects_wrong_arity(self, source):
+        """Test that function arity is checked when compiling."""
+        with pytest.raises(ValueError, match="argument"):
+            compile_expression(source)
+
+    @pytest.mark.parametrize("source", [
+        "__import__('os').system('ls')",
+        "sphere.radius.__class__",
+        "open('x')",
+        "radius > 1",
+        "sphere.radius if True else 0",
+        "[sphere.radius]",
+        "sphere.radius >",
+    ])
+    def test_rejects_unsafe_or_invalid(self, source):
+        """Test that anything outside the whitelist is rejected."""
+        with pytest.raises(ValueError):
+            compile_expression(source)
+
+    def test_missing_parameter(self):
+        """Test evaluating without a referenced parameter."""
+        with pytest.raises(KeyError):
+            compile_expression("sphere.radius > 1").evaluate({})
@@ -0,0 +1,72 @@
+"""Unit tests for sortable run and job IDs."""
+
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import pytest
+
+from src.services.job_generator import JobGenerator
+from src.utils import ids
+from src.utils.ids import generate_id, id_timestamp
+
+
+ID_PATTERN = re.compile(r'^run_\d{8}_\d{6}_\d{6}_[0-9a-f]{6}$')
+
+
+class TestGenerateId:
+    """Tests for generate_id."""
+
+    def test_format_and_timestamp(self):
+        """Test the ID layout and that the timestamp can be recovered."""
+        run_id = generate_id("run")
+        assert ID_PATTERN.match(run_id)
+        assert id_timestamp(run_id) is not None
+        assert id_timestamp("run_001") is None
+
+    def test_timestamp_is_utc(self):
+        """Test that the encoded time is UTC, independent of the local time zone."""
+        before = datetime.now(timezone.utc).replace(microsecond=0)
+        created = id_timestamp(generate_id("run"))
+        assert created.tzinfo is timezone.utc
+        assert before <= created <= datetime.now(timezone.utc)
+
+    def test_unique_and_sorted_in_tight_loop(self):
+        """Test that IDs generated in the same second are unique and ordered."""
+        generated = [generate_id("job") for _ in range(2000)]
+        assert len(set(generated)) == len(generated)
+        assert generated == sorted(generated)
+
+    def test_unique_across_threads(self):
+        """Test that concurrent generators never share an ID."""
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            generated = list(pool.map(lambda _: generate_id("run"), range(2000)))
+        assert len(set(generated)) == len(generated)
+
+    def test_clock_going_backwards(self, monkeypatch):
+        """Test that IDs stay increasing if the wall clock steps back."""
+        first = generate_id("run")
+        monkeypatch.setattr(ids.time, "time_ns", lambda: 0)
+        second = generate_id("run")
+        assert second > first
+
+    def test_node_differs_per_process(self, monkeypatch):
+        """Test that the node suffix depends on the process ID."""
+        node = generate_id("run").rsplit('_', 1)[1]
+        monkeypatch.setattr(ids.os, "getpid", lambda: -1)
+        other = generate_id("run").rsplit('_', 1)[1]
+        assert node != other
+
+
+class TestJobDirectories:
+    """Tests for job directory creation."""
+
+    def test_existing_job_directory_not_reused(self, tmp_path, templates_dir):
+        """Test that creating the same job directory twice fails."""
+        generator = JobGenerator(template_dir=templates_dir, output_base_dir=tmp_path)
+        job_id = generator.generate_job_id()
+        generator.create_job_directory(job_id)
+
+        with pytest.raises(FileExistsError):
+            generator.create_job_directory(job_id)
+        assert generator.generate_job_id() != job_id
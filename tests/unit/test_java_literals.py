@@ -0,0 +1,113 @@
+"""Unit tests for Java array literal formatting."""
+
+import numpy as np
+import pytest
+
+from src.services.geometry_builder import BeamData, GeometryData, SphereData
+from src.services.job_generator import JobGenerator
+from src.services.template_cache import clear_template_environments
+from src.utils.java_literals import format_values, java_doubles, java_rows
+
+
+class TestFormatValues:
+    """Tests for format_values."""
+
+    def test_fixed_precision_and_trimming(self):
+        """Test rounding to precision and removal of trailing zeros."""
+        values = [1.5, 2.0, 1.7500000000000002, 0.1234567, -0.0, -1e-9, 15.0]
+        assert format_values(values) == ['1.5', '2.0', '1.75', '0.123457', '0.0', '0.0', '15.0']
+
+    def test_precision_argument(self):
+        """Test custom precision, including zero."""
+        assert format_values([1.26, 3.0], precision=1) == ['1.3', '3.0']
+        assert format_values([1.6, 2.0], precision=0) == ['2.0', '2.0']
+
+    def test_integers(self):
+        """Test that integer arrays are formatted as integers."""
+        assert format_values(np.array([[0, 12], [3, 4]])) == ['0', '12', '3', '4']
+
+    def test_non_finite_rejected(self):
+        """Test that NaN cannot be emitted."""
+        with pytest.raises(ValueError, match="NaN"):
+            format_values([1.0, np.nan])
+
+    def test_empty(self):
+        """Test that empty arrays produce no values."""
+        assert format_values([]) == []
+
+
+class TestJavaDoubles:
+    """Tests for java_doubles."""
+
+    def test_wraps_within_max_line_length(self):
+        """Test that long arrays wrap and no line exceeds the limit."""
+        values = np.linspace(0.0, 100.0, 1000)
+        text = java_doubles(values, indent=16, max_line_length=80)
+        lines = text.split('\n')
+
+        assert len(lines) > 1
+        assert all(len(line) <= 80 for line in lines)
+        assert all(line.startswith(' ' * 16) for line in lines)
+        assert all(line.endswith(',') for line in lines[:-1])
+        assert not lines[-1].endswith(',')
+
+        parsed = [float(x) for x in text.replace('\n', ' ').split(',')]
+        np.testing.assert_allclose(parsed, values, atol=1e-6)
+
+    def test_single_line(self):
+        """Test a short array."""
+        assert java_doubles([0.99, 0.7623], indent=4) == '    0.99, 0.7623'
+
+
+class TestJavaRows:
+    """Tests for java_rows."""
+
+    def test_rows_with_labels(self):
+        """Test one initializer per row with comment labels."""
+        text = java_rows([[0.0, 0.0, 15.0], [1.5, 2.25, 3.0]], indent=4, labels=['a', 'b'])
+        assert text == (
+            '    {0.0, 0.0, 15.0},  // a\n'
+            '    {1.5, 2.25, 3.0}  // b'
+        )
+
+    def test_item_pattern(self):
+        """Test wrapping each value in a pattern (index references)."""
+        text = java_rows(np.array([[0, 1], [1, 2]]), indent=0, item='points[{}]')
+        assert text == '{points[0], points[1]},\n{points[1], points[2]}'
+
+    def test_invalid_shape_and_labels(self):
+        """Test that shape and label mismatches are rejected."""
+        with pytest.raises(ValueError, match="2D"):
+            java_rows([1.0, 2.0])
+        with pytest.raises(ValueError, match="labels"):
+            java_rows([[1.0], [2.0]], labels=['only_one'])
+
+
+class TestTemplateFilters:
+    """Tests for the filters in custom_lattice.java.j2."""
+
+    def test_large_supercell_renders(self, tmp_path, templates_dir):
+        """Test rendering geometry arrays of a large supercell."""
+        clear_template_environments()
+        rng = np.random.default_rng(0)
+        spheres = [
+            SphereData(
+                id=i + 1, position=list(rng.random(3) * 30.0), radius=1.0 + i % 3 * 0.25, ratio=1.0
+            )
+            for i in range(2000)
+        ]
+        beams = [
+            BeamData(id=i + 1, endpoint1_index=i, endpoint2_index=i + 1, thickness=0.5, ratio=1.0)
+            for i in range(1999)
+        ]
+        geometry = GeometryData(
+            spheres=spheres, beams=beams, lattice_constant=30.0, unit_cell_size=[30.0, 30.0, 30.0]
+        )
+
+        generator = JobGenerator(template_dir=templates_dir, output_base_dir=tmp_path)
+        template = generator.get_template('custom_lattice.java.j2')
+        java = ''.join(template.blocks['geometry_data'](template.new_context({'geometry': geometry})))
+
+        assert '{points[1998], points[1999]}  // beam_1999' in java
+        assert '// sphere_2000' in java
+        assert max(len(line) for line in java.split('\n')) <= 120
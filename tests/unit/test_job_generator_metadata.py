@@ -0,0 +1,102 @@
+"""Unit tests for JobGenerator outputs using the current lattice schema."""
+
+import pytest
+
+from src.data.metadata_io import RUN_TABLE_FILENAME, load_metadata, load_run_metadata
+from src.services.job_generator import JobGenerator
+from src.services.run_manifest import read_manifest, summarize_manifest
+
+
+class TestMetadataFormat:
+    """Tests for configurable metadata output."""
+
+    def test_json_metadata(self, tmp_path, custom_job, templates_dir):
+        """Test that job and run metadata are written as JSON."""
+        generator = JobGenerator(
+            template_dir=templates_dir,
+            output_base_dir=tmp_path,
+            metadata_format='json',
+            metadata_run_table=False
+        )
+
+        result = generator.generate_parametric_study_jobs(custom_job, run_id="run_json")
+
+        assert result['run_metadata'].name == "metadata.json"
+        run_metadata = load_metadata(result['run_metadata'])
+        assert run_metadata['jobs_generated'] == 6
+
+        job_metadata_file = result['jobs'][0]['metadata_file']
+        assert job_metadata_file.name == "metadata.json"
+        assert load_metadata(job_metadata_file)['job_id'] == "job_001"
+
+    def test_run_table(self, tmp_path, custom_job, templates_dir):
+        """Test that all job metadata can be bulk-loaded from one table."""
+        pytest.importorskip("pyarrow")
+
+        generator = JobGenerator(
+            template_dir=templates_dir,
+            output_base_dir=tmp_path,
+            metadata_format='yaml',
+            metadata_run_table=True
+        )
+
+        result = generator.generate_parametric_study_jobs(custom_job, run_id="run_table")
+
+        assert (result['run_dir'] / RUN_TABLE_FILENAME).exists()
+        df = load_run_metadata(result['run_dir'])
+        assert len(df) == 6
+        assert sorted(df['parametric.applied_parameters.sphere.radius'].unique()) == [
+            1.5, 1.75, 2.0
+        ]
+
+    def test_invalid_metadata_format(self, tmp_path, templates_dir):
+        """Test that an unknown metadata format fails at construction."""
+        with pytest.raises(ValueError):
+            JobGenerator(
+                template_dir=templates_dir,
+                output_base_dir=tmp_path,
+                metadata_format='xml'
+            )
+
+
+class TestRunManifest:
+    """Tests for streaming job records during parametric studies."""
+
+    def test_manifest_written(self, tmp_path, custom_job, templates_dir):
+        """Test that each job is recorded in the manifest with a footer."""
+        generator = JobGenerator(template_dir=templates_dir, output_base_dir=tmp_path)
+
+        result = generator.generate_parametric_study_jobs(
+            custom_job,
+            run_id="run_manifest",
+            keep_job_results=False
+        )
+
+        assert result['jobs'] == []
+        assert result['total_jobs'] == 6
+
+        records = list(read_manifest(result['manifest']))
+        assert records[0]['type'] == 'run'
+        assert records[-1]['type'] == 'summary'
+        assert records[-1]['jobs_generated'] == 6
+        job_records = [r for r in records if r['type'] == 'job']
+        assert [r['job_id'] for r in job_records] == [f"job_{i:03d}" for i in range(1, 7)]
+
+        run_metadata = load_metadata(result['run_metadata'])
+        assert run_metadata['manifest'] == "manifest.jsonl"
+        assert 'skipped_jobs' not in run_metadata
+
+    def test_skipped_jobs_in_manifest(self, tmp_path, custom_job, templates_dir):
+        """Test that invalid parameter sets are recorded as skipped."""
+        # Beams thicker than the spheres fail geometry validation
+        custom_job.job.parametric.sweeps[1].values = [1.0, 10.0]
+        generator = JobGenerator(template_dir=templates_dir, output_base_dir=tmp_path)
+
+        result = generator.generate_parametric_study_jobs(custom_job, run_id="run_skip")
+
+        summary = summarize_manifest(result['manifest'])
+        assert summary['completed'] is True
+        assert summary['jobs_generated'] == result['total_jobs'] == 3
+        assert summary['jobs_skipped'] == result['skipped_jobs'] == 3
+        skipped = list(read_manifest(result['manifest'], 'skipped'))
+        assert all(r['parameters']['beam.thickness'] == 10.0 for r in skipped)
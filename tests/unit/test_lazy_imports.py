@@ -0,0 +1,62 @@
+"""Unit tests for lazy package exports and fast CLI startup."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+HEAVY_MODULES = ['pymatgen', 'matplotlib', 'sqlalchemy', 'scipy', 'jinja2']
+
+
+def imported_heavy_modules(statement: str):
+    """Run an import statement in a fresh interpreter and list heavy modules."""
+    code = f"import sys\n{statement}\nprint(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    proc = subprocess.run(
+        [sys.executable, '-c', code],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+    )
+    return [m for m in proc.stdout.strip().split(',') if m]
+
+
+class TestStartupImports:
+    """Tests that CLI entry points do not import heavy dependencies."""
+
+    @pytest.mark.parametrize("statement", [
+        "import src.services.batch_executor",
+        "import src.data.metadata_io",
+        "from src.config.loader import setup_logging, get_logger",
+        "import src.services, src.validators, src.visualization, src.optimizers, src.data.models",
+    ])
+    def test_no_heavy_imports(self, statement):
+        """Test that lightweight modules stay lightweight."""
+        assert imported_heavy_modules(statement) == []
+
+
+class TestLazyExports:
+    """Tests for attribute access on lazy packages."""
+
+    def test_lazy_attribute_resolves(self):
+        """Test that exported names resolve to the defining module's objects."""
+        import src.services as services
+        from src.services.batch_executor import BatchExecutor
+
+        assert services.BatchExecutor is BatchExecutor
+        assert 'BatchExecutor' in vars(services)
+        assert 'JobGenerator' in dir(services)
+
+    def test_unknown_attribute(self):
+        """Test that unknown names raise AttributeError."""
+        import src.validators as validators
+
+        with pytest.raises(AttributeError):
+            validators.does_not_exist
+
+    def test_tables_registered_for_create_all(self):
+        """Test that src.data.db registers every table on Base."""
+        pytest.importorskip("sqlalchemy")
+        from src.data.db import Base
+
+        assert {'material_system', 'vasp_results', 'elastic_constants', 'mechanical_properties'} <= set(Base.metadata.tables)
@@ -0,0 +1,108 @@
+"""Unit tests for queue-based (non-blocking) logging."""
+
+import logging
+import multiprocessing
+import queue
+import threading
+
+import pytest
+
+from src.config.loader import (
+    get_log_queue,
+    get_logger,
+    setup_logging,
+    setup_worker_logging,
+    shutdown_logging,
+)
+from src.config.loader import _BoundedQueueHandler
+
+
+def queue_config(log_dir, **queue_options):
+    """Logging config writing to a file through the queue."""
+    return {
+        'logging': {
+            'level': 'INFO',
+            'fmt': '%(processName)s | %(message)s',
+            'console': {'enabled': False},
+            'file': {'enabled': True, 'dir': str(log_dir), 'filename': 'run.log', 'rotate': False},
+            'queue': {'enabled': True, **queue_options},
+        }
+    }
+
+
+@pytest.fixture(autouse=True)
+def restore_logging():
+    """Reset the project logger to console-only logging after each test."""
+    yield
+    shutdown_logging()
+    setup_logging({'logging': {'file': {'enabled': False}}})
+
+
+class TestQueueLogging:
+    """Tests for logging.queue mode in setup_logging."""
+
+    def test_records_written_by_listener(self, tmp_path):
+        """Test that records from many threads reach the file after shutdown."""
+        logger = setup_logging(queue_config(tmp_path))
+        assert [type(h) for h in logger.handlers] == [_BoundedQueueHandler]
+        assert get_log_queue() is not None
+
+        def work(n):
+            for i in range(50):
+                get_logger('services.test').info("thread %d line %d", n, i)
+
+        threads = [threading.Thread(target=work, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        shutdown_logging()
+
+        lines = (tmp_path / 'run.log').read_text(encoding='utf-8').splitlines()
+        assert len(lines) == 400
+        assert get_log_queue() is None
+
+    def test_drop_policy(self):
+        """Test that a full queue drops info records but keeps warnings."""
+        log_queue = queue.Queue(1)
+        handler = _BoundedQueueHandler(log_queue, drop_policy='drop')
+        record = logging.LogRecord('esp', logging.INFO, __file__, 1, "msg", None, None)
+        handler.handle(record)
+        handler.handle(record)
+        assert handler.dropped == 1
+
+        # A warning waits for room instead of being dropped
+        warning = logging.LogRecord('esp', logging.WARNING, __file__, 1, "warn", None, None)
+        threading.Timer(0.05, log_queue.get).start()
+        handler.handle(warning)
+        assert log_queue.get(timeout=1).levelno == logging.WARNING
+        assert handler.dropped == 1
+
+    def test_invalid_drop_policy(self, tmp_path):
+        """Test that unknown drop policies are rejected."""
+        with pytest.raises(ValueError):
+            setup_logging(queue_config(tmp_path, drop_policy='discard'))
+
+    @pytest.mark.skipif(
+        'fork' not in multiprocessing.get_all_start_methods(),
+        reason="requires the fork start method"
+    )
+    def test_worker_processes_forward_to_one_writer(self, tmp_path):
+        """Test that worker process records are written by the parent."""
+        setup_logging(queue_config(tmp_path, multiprocess=True))
+        log_queue = get_log_queue()
+
+        def worker(n):
+            setup_worker_logging(log_queue, 'INFO')
+            get_logger('worker').info("from worker %d", n)
+
+        context = multiprocessing.get_context('fork')
+        processes = [context.Process(target=worker, args=(n,), name=f"w{n}") for n in range(3)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=30)
+        shutdown_logging()
+
+        lines = (tmp_path / 'run.log').read_text(encoding='utf-8').splitlines()
+        assert sorted(lines) == [f"w{n} | from worker {n}" for n in range(3)]
@@ -0,0 +1,112 @@
+"""Unit tests for metadata sidecar reading and writing."""
+
+import pytest
+from pathlib import Path
+
+from src.data.metadata_io import (
+    RUN_TABLE_FILENAME,
+    check_metadata_format,
+    convert_metadata,
+    find_metadata_file,
+    flatten_metadata,
+    load_metadata,
+    load_run_metadata,
+    write_metadata,
+    write_metadata_table,
+)
+
+
+SAMPLE_METADATA = {
+    'job_id': 'job_001',
+    'job_name': 'Simple Cubic Lattice',
+    'geometry': {'num_spheres': 8, 'num_beams': 12},
+    'unit_cell_size': [10.0, 10.0, 10.0],
+    'parametric': {
+        'applied_parameters': {'sphere.radius': 1.5, 'beam.thickness': 1.0},
+        'sweep_indices': [0, 1],
+    },
+}
+
+
+class TestMetadataFormats:
+    """Tests for per-file metadata formats."""
+
+    @pytest.mark.parametrize("fmt,suffix", [
+        ('yaml', '.yml'),
+        ('json', '.json'),
+        ('msgpack', '.msgpack'),
+    ])
+    def test_round_trip(self, tmp_path, fmt, suffix):
+        """Test that metadata survives a write/load round trip."""
+        if fmt == 'msgpack':
+            pytest.importorskip("msgpack")
+
+        path = write_metadata(tmp_path, SAMPLE_METADATA, fmt=fmt)
+
+        assert path.name == f"metadata{suffix}"
+        assert load_metadata(path) == SAMPLE_METADATA
+
+    def test_load_from_directory_detects_format(self, tmp_path):
+        """Test that loading a directory finds the sidecar in any format."""
+        write_metadata(tmp_path, SAMPLE_METADATA, fmt='json')
+
+        assert find_metadata_file(tmp_path) == tmp_path / "metadata.json"
+        assert load_metadata(tmp_path)['job_id'] == 'job_001'
+
+    def test_missing_metadata(self, tmp_path):
+        """Test errors for directories without metadata."""
+        assert find_metadata_file(tmp_path) is None
+        with pytest.raises(FileNotFoundError):
+            load_metadata(tmp_path)
+
+    def test_invalid_format(self):
+        """Test that unknown formats are rejected."""
+        with pytest.raises(ValueError, match="Unsupported metadata format"):
+            check_metadata_format('xml')
+
+    def test_convert_to_yaml(self, tmp_path):
+        """Test converting binary metadata to YAML for inspection."""
+        write_metadata(tmp_path, SAMPLE_METADATA, fmt='json')
+
+        yaml_path = convert_metadata(tmp_path, fmt='yaml')
+
+        assert yaml_path == tmp_path / "metadata.yml"
+        assert load_metadata(yaml_path) == SAMPLE_METADATA
+
+
+class TestRunMetadataTable:
+    """Tests for run-level metadata tables."""
+
+    def test_flatten_metadata(self):
+        """Test that nested keys are joined with dots."""
+        row = flatten_metadata(SAMPLE_METADATA)
+
+        assert row['geometry.num_spheres'] == 8
+        assert row['parametric.applied_parameters.sphere.radius'] == 1.5
+        assert row['unit_cell_size'] == [10.0, 10.0, 10.0]
+
+    def test_table_round_trip(self, tmp_path):
+        """Test writing and bulk-loading a run table."""
+        pytest.importorskip("pyarrow")
+
+        records = [
+            dict(SAMPLE_METADATA, job_id=f"job_{i:03d}") for i in range(1, 4)
+        ]
+        write_metadata_table(tmp_path / RUN_TABLE_FILENAME, records)
+
+        df = load_run_metadata(tmp_path)
+
+        assert len(df) == 3
+        assert list(df['job_id']) == ['job_001', 'job_002', 'job_003']
+        assert (df['geometry.num_beams'] == 12).all()
+
+    def test_load_run_metadata_falls_back_to_sidecars(self, tmp_path):
+        """Test that runs without a table are read from job sidecars."""
+        for i, fmt in enumerate(['yaml', 'json'], 1):
+            job_dir = tmp_path / f"job_{i:03d}"
+            job_dir.mkdir()
+            write_metadata(job_dir, dict(SAMPLE_METADATA, job_id=job_dir.name), fmt=fmt)
+
+        df = load_run_metadata(tmp_path)
+
+        assert list(df['job_id']) == ['job_001', 'job_002']
@@ -0,0 +1,110 @@
+"""Unit tests for the metrics registry and Prometheus exposition."""
+
+import os
+import subprocess
+import urllib.request
+
+import pytest
+
+from src.services.batch_executor import BatchExecutor
+from src.services.job_generator import JobGenerator
+from src.services.metrics import CONTENT_TYPE, JobMetrics, MetricsExporter, MetricsRegistry
+
+
+class TestMetricsRegistry:
+    """Tests for MetricsRegistry and the metric types."""
+
+    def test_exposition_format(self):
+        """Test counters, gauges and histograms in the text format."""
+        registry = MetricsRegistry()
+        finished = registry.counter("jobs_finished_total", "Finished jobs", ["status"])
+        finished.inc(status="succeeded")
+        finished.inc(2, status="failed")
+        registry.gauge("jobs_queued", "Queued jobs").set(7)
+        runtime = registry.histogram("job_runtime_seconds", "Runtime", buckets=(1, 10))
+        for value in (0.5, 5, 50):
+            runtime.observe(value)
+
+        text = registry.render()
+        assert "# TYPE jobs_finished_total counter" in text
+        assert 'jobs_finished_total{status="failed"} 2' in text
+        assert 'jobs_finished_total{status="succeeded"} 1' in text
+        assert "jobs_queued 7" in text
+        assert "# TYPE job_runtime_seconds histogram" in text
+        assert 'job_runtime_seconds_bucket{le="1"} 1' in text
+        assert 'job_runtime_seconds_bucket{le="10"} 2' in text
+        assert 'job_runtime_seconds_bucket{le="+Inf"} 3' in text
+        assert "job_runtime_seconds_sum 55.5" in text
+        assert "job_runtime_seconds_count 3" in text
+
+    def test_registration_and_label_errors(self):
+        """Test get-or-create semantics, type clashes and label checks."""
+        registry = MetricsRegistry()
+        counter = registry.counter("jobs_total", "Jobs", ["status"])
+        assert registry.counter("jobs_total", "Jobs", ["status"]) is counter
+        with pytest.raises(ValueError):
+            registry.gauge("jobs_total", "Jobs")
+        with pytest.raises(ValueError):
+            counter.inc(kind="x")
+        with pytest.raises(ValueError):
+            counter.inc(-1, status="ok")
+
+    def test_exporter_http_and_textfile(self, tmp_path):
+        """Test serving /metrics over HTTP and the textfile written on stop."""
+        registry = MetricsRegistry()
+        registry.gauge("jobs_running", "Running jobs").set(3)
+        textfile = tmp_path / "esp.prom"
+
+        with MetricsExporter(registry, port=0, textfile=textfile, interval=60) as exporter:
+            with urllib.request.urlopen(exporter.url, timeout=5) as response:
+                assert response.headers["Content-Type"] == CONTENT_TYPE
+                assert "jobs_running 3" in response.read().decode("utf-8")
+            registry.gauge("jobs_running", "Running jobs").set(0)
+
+        assert "jobs_running 0" in textfile.read_text(encoding="utf-8")
+        assert [p.name for p in tmp_path.iterdir()] == ["esp.prom"]
+
+
+class TestJobMetrics:
+    """Tests for metrics updated by JobGenerator and BatchExecutor."""
+
+    def test_generation_metrics(self, tmp_path, custom_job, templates_dir):
+        """Test that generated jobs are counted and timed."""
+        metrics = JobMetrics(MetricsRegistry())
+        generator = JobGenerator(
+            template_dir=templates_dir,
+            output_base_dir=tmp_path,
+            record_events=False,
+            metrics=metrics
+        )
+        result = generator.generate_parametric_study_jobs(custom_job, run_id='run')
+
+        assert metrics.jobs_generated.value(status="ok") == result['total_jobs']
+        assert metrics.jobs_generated.value(status="error") == result['skipped_jobs']
+        assert metrics.generation_seconds.count(status="ok") == result['total_jobs']
+        assert metrics.generation_seconds.count(status="error") == result['skipped_jobs']
+
+    @pytest.mark.skipif(os.name != 'posix', reason="runs a shell script as the batch file")
+    def test_execution_metrics(self, tmp_path):
+        """Test running gauge, runtime histogram and outcome counters."""
+        job_dir = tmp_path / 'run_1' / 'job_001'
+        job_dir.mkdir(parents=True)
+        batch_file = job_dir / 'run.bat'
+        metrics = JobMetrics(MetricsRegistry())
+        executor = BatchExecutor(timeout=30, record_events=False, metrics=metrics)
+        executor.is_wsl = False
+
+        for script, timeout in [("exit 0", 30), ("exit 3", 30), ("sleep 5", 0.2)]:
+            batch_file.write_text(f"#!/bin/sh\n{script}\n", encoding='utf-8')
+            batch_file.chmod(0o755)
+            try:
+                executor.execute_batch(batch_file, timeout=timeout, convert_path=False)
+            except subprocess.TimeoutExpired:
+                pass
+
+        assert metrics.jobs_finished.value(status="succeeded") == 1
+        assert metrics.jobs_finished.value(status="failed") == 1
+        assert metrics.jobs_finished.value(status="timeout") == 1
+        assert metrics.jobs_running.value() == 0
+        assert metrics.runtime_seconds.count() == 3
+        assert metrics.last_finished.value() > 0
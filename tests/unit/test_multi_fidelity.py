@@ -0,0 +1,96 @@
+"""Unit tests for multi-fidelity successive halving."""
+
+import pytest
+
+from src.data.metadata_io import load_metadata
+from src.optimizers.multi_fidelity import SuccessiveHalving
+
+
+def fake_parser(job_result):
+    """Synthetic result with a small mesh-dependent bias."""
+    params = job_result['metadata']['parametric']['applied_parameters']
+    mesh_size = job_result['metadata']['mesh']['size']
+    return {
+        'zener_ratio': params['sphere.radius'] - params['beam.thickness'] + 0.01 * mesh_size
+    }
+
+
+def score(properties):
+    """Distance to a Zener ratio of 0.75."""
+    return abs(properties['zener_ratio'] - 0.75)
+
+
+class TestMeshSizeOverride:
+    """Tests for generating jobs at a given fidelity."""
+
+    def test_mesh_size_in_java_and_metadata(self, generator, custom_job):
+        """Test that the mesh size override reaches the template and metadata."""
+        result = generator.generate_custom_lattice_job(
+            custom_job, run_id="run_mesh", mesh_size=9
+        )
+
+        assert "autoMeshSize(9)" in result['java_file'].read_text()
+        assert load_metadata(result['metadata_file'])['mesh']['size'] == 9
+
+    def test_invalid_mesh_size(self, generator, custom_job):
+        """Test that out-of-range mesh sizes are rejected."""
+        with pytest.raises(ValueError, match="Mesh size"):
+            generator.generate_custom_lattice_job(custom_job, mesh_size=0)
+
+
+class TestSuccessiveHalving:
+    """Tests for the successive-halving schedule."""
+
+    def test_schedule(self, generator, custom_job, fake_executor):
+        """Test that only promoted candidates are rerun at finer mesh."""
+        schedule = SuccessiveHalving(
+            custom_job,
+            generator,
+            result_parser=fake_parser,
+            score=score,
+            mesh_sizes=[9, 5],
+            eta=3,
+            executor=fake_executor,
+            run_id="run_sh"
+        )
+
+        rungs = schedule.run()
+
+        assert [r.mesh_size for r in rungs] == [9, 5]
+        assert len(rungs[0].results) == 6
+        assert len(rungs[1].results) == 2
+        assert {r.parameter_set_index for r in rungs[1].results} == set(rungs[0].promoted)
+        assert all(r.mesh_size == 5 for r in schedule.results(mesh_size=5))
+
+        best = schedule.best()
+        assert best.mesh_size == 5
+        assert best.parameters['sphere.radius'] - best.parameters['beam.thickness'] == pytest.approx(0.75)
+
+        df = schedule.results_frame()
+        assert len(df) == 8
+        assert set(df['mesh_size']) == {9, 5}
+
+    def test_uncertainty_margin_promotes_ties(self, generator, custom_job, fake_executor):
+        """Test that candidates close to the cut-off are also promoted."""
+        schedule = SuccessiveHalving(
+            custom_job,
+            generator,
+            result_parser=fake_parser,
+            score=lambda p: round(p['zener_ratio'], 1),
+            mesh_sizes=[9, 5],
+            eta=6,
+            uncertainty=3.0,
+            executor=fake_executor,
+            run_id="run_margin"
+        )
+
+        rungs = schedule.run()
+
+        assert len(rungs[0].promoted) == 2
+
+    def test_mesh_sizes_must_refine(self, generator, custom_job):
+        """Test that fidelities must go from coarse to fine."""
+        with pytest.raises(ValueError, match="coarse to fine"):
+            SuccessiveHalving(
+                custom_job, generator, fake_parser, score, mesh_sizes=[2, 5]
+            )
@@ -0,0 +1,144 @@
+"""Unit tests for the closed-loop optimization controller."""
+
+import threading
+
+import pytest
+
+pytest.importorskip("optuna")
+
+from src.optimizers.optuna_optimizer import (
+    OptimizationController,
+    SearchParameter,
+    search_space_from_sweeps,
+    target_objective,
+)
+from src.services.run_manifest import read_manifest, summarize_manifest
+
+
+def fake_parser(job_result):
+    """Synthetic Zener ratio computed from the applied parameters."""
+    params = job_result['metadata']['parametric']['applied_parameters']
+    return {'zener_ratio': params['sphere.radius'] - params['beam.thickness']}
+
+
+class TestSearchSpace:
+    """Tests for search space construction."""
+
+    def test_from_sweeps(self, custom_job):
+        """Test that sweeps become min/max bounded dimensions."""
+        space = {dim.name: dim for dim in search_space_from_sweeps(custom_job)}
+
+        assert set(space) == {'sphere.radius', 'beam.thickness'}
+        assert (space['sphere.radius'].low, space['sphere.radius'].high) == (1.5, 2.0)
+
+    def test_invalid_bounds(self):
+        """Test that empty ranges are rejected."""
+        with pytest.raises(ValueError):
+            SearchParameter('sphere.radius', 2.0, 2.0)
+
+    def test_target_objective(self):
+        """Test relative distance to target properties."""
+        objective = target_objective({'zener_ratio': 2.0})
+
+        assert objective({'zener_ratio': 2.0}) == 0.0
+        assert objective({'zener_ratio': 3.0}) == pytest.approx(0.5)
+
+
+class TestOptimizationController:
+    """Tests for the ask/tell loop."""
+
+    def test_optimize(self, custom_job, generator, fake_executor):
+        """Test that trials generate jobs and results are told back."""
+        controller = OptimizationController(
+            custom_job,
+            generator,
+            result_parser=fake_parser,
+            objective=target_objective({'zener_ratio': 0.8}),
+            executor=fake_executor,
+            n_parallel=3,
+            run_id="opt_test"
+        )
+
+        study = controller.optimize(n_trials=8)
+
+        assert len(study.trials) == 8
+        assert len(controller.trials) == 8
+        assert (generator.output_base_dir / "opt_test" / "job_001" / "run.bat").exists()
+
+        best = controller.best_trial
+        assert best.value == pytest.approx(study.best_value)
+        assert 1.5 <= best.parameters['sphere.radius'] <= 2.0
+
+        summary = summarize_manifest(controller.run_dir)
+        assert summary['completed'] is True
+        assert summary['jobs_generated'] == 8
+        assert summary['summary']['best_job_id'] == best.job_id
+
+    def test_parallel_execution(self, custom_job, generator):
+        """Test that several jobs run concurrently."""
+        active = []
+        peak = []
+        lock = threading.Lock()
+        barrier = threading.Barrier(2, timeout=5)
+
+        def executor(job_dir):
+            with lock:
+                active.append(job_dir)
+                peak.append(len(active))
+            barrier.wait()
+            with lock:
+                active.remove(job_dir)
+
+        controller = OptimizationController(
+            custom_job,
+            generator,
+            result_parser=fake_parser,
+            objective=target_objective({'zener_ratio': 0.8}),
+            executor=executor,
+            n_parallel=2,
+            run_id="opt_parallel"
+        )
+        controller.optimize(n_trials=4)
+
+        assert max(peak) == 2
+
+    def test_failed_trials(self, custom_job, generator):
+        """Test that execution errors mark trials as failed."""
+        def failing_executor(job_dir):
+            raise RuntimeError("COMSOL crashed")
+
+        controller = OptimizationController(
+            custom_job,
+            generator,
+            result_parser=fake_parser,
+            objective=target_objective({'zener_ratio': 0.8}),
+            executor=failing_executor,
+            run_id="opt_fail"
+        )
+        study = controller.optimize(n_trials=3)
+
+        assert controller.best_trial is None
+        assert all(t.state.name == 'FAIL' for t in study.trials)
+        skipped = list(read_manifest(controller.run_dir, 'skipped'))
+        assert len(skipped) == 3
+        assert "COMSOL crashed" in skipped[0]['error']
+
+    def test_generation_errors_fail_trials(self, custom_job, generator, fake_executor, monkeypatch):
+        """Test that any generation error fails the trial instead of the loop."""
+        def broken_generation(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(generator, 'generate_custom_lattice_job', broken_generation)
+        controller = OptimizationController(
+            custom_job,
+            generator,
+            result_parser=fake_parser,
+            objective=target_objective({'zener_ratio': 0.8}),
+            executor=fake_executor,
+            run_id="opt_generation_error"
+        )
+        study = controller.optimize(n_trials=2)
+
+        assert all(t.state.name == 'FAIL' for t in study.trials)
+        skipped = list(read_manifest(controller.run_dir, 'skipped'))
+        assert [s['error'] for s in skipped] == ["OSError: disk full"] * 2
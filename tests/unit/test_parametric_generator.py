@@ -10,6 +10,7 @@ from src.services.parametric_generator import (
     get_parameter_summary
 )
 from src.parsers import load_custom_lattice_yaml
+from src.parsers.yaml_loader import YAMLParseError
 
 
 # Fixture paths
@@ -166,6 +167,15 @@ study:
                     for ps in param_sets
                 )
 
+    def test_iter_parameter_sets_is_lazy(self, custom_job):
+        """Test that iter_parameter_sets yields the same sets one at a time."""
+        generator = ParametricGenerator(custom_job)
+
+        iterator = generator.iter_parameter_sets()
+        assert next(iterator).job_id == "job_001"
+        assert [ps.job_id for ps in iterator] == [f"job_{i:03d}" for i in range(2, 7)]
+        assert list(generator.iter_parameter_sets()) == generator.generate_parameter_sets()
+
     def test_three_sweeps(self, tmp_path):
         """Test generator with three parametric sweeps."""
         yaml_content = """
@@ -336,3 +346,237 @@ class TestBackwardCompatibility:
         assert len(job.job.parametric.sweeps) == 2
         assert job.job.parametric.sweeps[0].parameter == "sphere.radius"
         assert job.job.parametric.sweeps[1].parameter == "beam.thickness"
+
+
+def _write_sampling_yaml(tmp_path, base_yaml, sampling, sweeps=None):
+    """Write base_yaml with a sampling block (and optional sweeps)."""
+    import yaml
+
+    data = yaml.safe_load(base_yaml.read_text(encoding='utf-8'))
+    data['job']['parametric']['sweeps'] = sweeps or []
+    data['job']['parametric']['sampling'] = sampling
+    yaml_file = tmp_path / "sampling.yml"
+    yaml_file.write_text(yaml.safe_dump(data), encoding='utf-8')
+    return yaml_file
+
+
+class TestSampling:
+    """Tests for space-filling sampling over parameter ranges."""
+
+    SAMPLING = {
+        'method': 'lhs',
+        'num_samples': 8,
+        'seed': 42,
+        'ranges': [
+            {'parameter': 'sphere.radius', 'min': 1.5, 'max': 2.0},
+            {'parameter': 'beam.thickness', 'min': 0.5, 'max': 1.5},
+        ],
+    }
+
+    @pytest.mark.parametrize("method", ['lhs', 'sobol', 'halton'])
+    def test_samples_within_ranges(self, tmp_path, simple_cubic_yaml, method):
+        """Test that each method yields the requested samples inside the ranges."""
+        sampling = dict(self.SAMPLING, method=method)
+        job = load_custom_lattice_yaml(_write_sampling_yaml(tmp_path, simple_cubic_yaml, sampling), strict=False)
+
+        param_sets = ParametricGenerator(job).generate_parameter_sets()
+
+        assert len(param_sets) == 8
+        radii = [ps.parameters['sphere.radius'] for ps in param_sets]
+        thicknesses = [ps.parameters['beam.thickness'] for ps in param_sets]
+        assert all(1.5 <= r <= 2.0 for r in radii)
+        assert all(0.5 <= t <= 1.5 for t in thicknesses)
+        assert len(set(radii)) == 8
+
+    def test_latin_hypercube_stratified(self, tmp_path, simple_cubic_yaml):
+        """Test that LHS puts exactly one sample in each stratum."""
+        job = load_custom_lattice_yaml(_write_sampling_yaml(tmp_path, simple_cubic_yaml, self.SAMPLING), strict=False)
+
+        param_sets = ParametricGenerator(job).generate_parameter_sets()
+
+        strata = sorted(int((ps.parameters['sphere.radius'] - 1.5) / 0.5 * 8) for ps in param_sets)
+        assert strata == list(range(8))
+
+    def test_fixed_seed_is_reproducible(self, tmp_path, simple_cubic_yaml):
+        """Test that the same seed gives the same design."""
+        job = load_custom_lattice_yaml(_write_sampling_yaml(tmp_path, simple_cubic_yaml, self.SAMPLING), strict=False)
+
+        first = ParametricGenerator(job).generate_parameter_sets()
+        second = ParametricGenerator(job).generate_parameter_sets()
+
+        assert [ps.parameters for ps in first] == [ps.parameters for ps in second]
+
+    def test_combined_with_sweeps(self, tmp_path, simple_cubic_yaml):
+        """Test that samples are combined with every sweep value."""
+        sampling = dict(self.SAMPLING, num_samples=4, ranges=self.SAMPLING['ranges'][:1])
+        sweeps = [{'parameter': 'beam.thickness', 'values': [1.0, 1.5]}]
+        job = load_custom_lattice_yaml(
+            _write_sampling_yaml(tmp_path, simple_cubic_yaml, sampling, sweeps), strict=False
+        )
+        generator = ParametricGenerator(job)
+
+        param_sets = generator.generate_parameter_sets()
+        info = generator.get_sweep_info()
+
+        assert len(param_sets) == info['total_jobs'] == 8
+        assert info['sampling']['method'] == 'lhs'
+        assert param_sets[0].sweep_indices == (0, 0)
+        assert param_sets[-1].sweep_indices == (1, 3)
+
+    def test_duplicate_parameter_rejected(self, tmp_path, simple_cubic_yaml):
+        """Test that a parameter cannot be both swept and sampled."""
+        sweeps = [{'parameter': 'sphere.radius', 'values': [1.5, 2.0]}]
+        yaml_file = _write_sampling_yaml(tmp_path, simple_cubic_yaml, self.SAMPLING, sweeps)
+
+        with pytest.raises(YAMLParseError, match="more than once"):
+            load_custom_lattice_yaml(yaml_file, strict=False)
+
+
+class TestConstraints:
+    """Tests for pruning the parameter space with constraint expressions."""
+
+    def _load(self, tmp_path, base_yaml, constraints, sweeps=None, sampling=None):
+        import yaml
+
+        data = yaml.safe_load(base_yaml.read_text(encoding='utf-8'))
+        if sweeps is not None:
+            data['job']['parametric']['sweeps'] = sweeps
+        if sampling is not None:
+            data['job']['parametric']['sampling'] = sampling
+        data['job']['parametric']['constraints'] = constraints
+        yaml_file = tmp_path / "constraints.yml"
+        yaml_file.write_text(yaml.safe_dump(data), encoding='utf-8')
+        return load_custom_lattice_yaml(yaml_file, strict=False)
+
+    def test_infeasible_combinations_pruned(self, tmp_path, simple_cubic_yaml):
+        """Test that violating combinations are never generated."""
+        sweeps = [
+            {'parameter': 'sphere.radius', 'values': [1.0, 1.5, 2.0]},
+            {'parameter': 'beam.thickness', 'values': [1.0, 2.0, 3.0, 4.0]},
+        ]
+        job = self._load(
+            tmp_path, simple_cubic_yaml, ["beam.thickness * 0.795 / 2 < sphere.radius - 0.01"], sweeps
+        )
+        generator = ParametricGenerator(job)
+
+        param_sets = generator.generate_parameter_sets()
+        info = generator.get_sweep_info()
+
+        for ps in param_sets:
+            p = ps.parameters
+            assert p['beam.thickness'] * 0.795 / 2 < p['sphere.radius'] - 0.01
+        assert info['total_combinations'] == 12
+        assert info['pruned_by_constraints'] == 12 - len(param_sets)
+        assert info['total_jobs'] == len(param_sets) == 9
+        # Job IDs are contiguous; sweep indices keep the grid position
+        assert [ps.job_id for ps in param_sets] == [f"job_{i:03d}" for i in range(1, 10)]
+        assert param_sets[-1].sweep_indices == (2, 3)
+
+    def test_constraint_over_sampled_and_default_parameters(self, tmp_path, simple_cubic_yaml):
+        """Test constraints mixing sampled, swept and default parameters."""
+        sampling = {
+            'method': 'sobol',
+            'num_samples': 16,
+            'ranges': [{'parameter': 'sphere.radius', 'min': 0.5, 'max': 2.5}],
+        }
+        sweeps = [{'parameter': 'beam.thickness', 'values': [1.0, 2.0]}]
+        job = self._load(tmp_path, simple_cubic_yaml, ["sphere.radius > beam.thickness"], sweeps, sampling)
+
+        param_sets = ParametricGenerator(job).generate_parameter_sets()
+
+        assert 0 < len(param_sets) < 32
+        assert all(
+            ps.parameters['sphere.radius'] > ps.parameters['beam.thickness'] for ps in param_sets
+        )
+
+    def test_unseeded_sampling_matches_sweep_info(self, tmp_path, simple_cubic_yaml):
+        """Test that sweep info counts the same random design that is generated."""
+        sampling = {
+            'method': 'lhs',
+            'num_samples': 64,
+            'seed': None,
+            'ranges': [{'parameter': 'sphere.radius', 'min': 0.5, 'max': 2.5}],
+        }
+        sweeps = [{'parameter': 'beam.thickness', 'values': [1.0, 1.5, 2.0]}]
+        job = self._load(tmp_path, simple_cubic_yaml, ["sphere.radius > beam.thickness"], sweeps, sampling)
+
+        generator = ParametricGenerator(job)
+        info = generator.get_sweep_info()
+        param_sets = generator.generate_parameter_sets()
+
+        assert info['total_jobs'] == len(param_sets)
+        assert info['pruned_by_constraints'] == 192 - len(param_sets)
+        assert generator.generate_parameter_sets() == param_sets
+
+    def test_unknown_parameter_rejected(self, tmp_path, simple_cubic_yaml):
+        """Test that constraints may only reference known parameters."""
+        with pytest.raises(YAMLParseError, match="neither swept nor defaulted"):
+            self._load(tmp_path, simple_cubic_yaml, ["sphere.3.radius > 1.0"])
+
+    def test_unsafe_constraint_rejected(self, tmp_path, simple_cubic_yaml):
+        """Test that constraints outside the expression whitelist are rejected."""
+        with pytest.raises(YAMLParseError, match="Invalid expression"):
+            self._load(tmp_path, simple_cubic_yaml, ["__import__('os')"])
+
+
+class TestLinkedSweeps:
+    """Tests for linked (zipped) sweep groups."""
+
+    def _load(self, tmp_path, base_yaml, sweeps):
+        import yaml
+
+        data = yaml.safe_load(base_yaml.read_text(encoding='utf-8'))
+        data['job']['parametric']['sweeps'] = sweeps
+        yaml_file = tmp_path / "linked.yml"
+        yaml_file.write_text(yaml.safe_dump(data), encoding='utf-8')
+        return load_custom_lattice_yaml(yaml_file, strict=False)
+
+    def test_zip_group_is_linear(self, tmp_path, simple_cubic_yaml):
+        """Test that linked parameters vary together in lockstep."""
+        job = self._load(tmp_path, simple_cubic_yaml, [{'zip': [
+            {'parameter': 'sphere.radius', 'values': [1.5, 1.75, 2.0]},
+            {'parameter': 'beam.thickness', 'values': [1.0, 1.25, 1.5]},
+        ]}])
+        generator = ParametricGenerator(job)
+
+        param_sets = generator.generate_parameter_sets()
+        info = generator.get_sweep_info()
+
+        assert [(ps.parameters['sphere.radius'], ps.parameters['beam.thickness'])
+                for ps in param_sets] == [(1.5, 1.0), (1.75, 1.25), (2.0, 1.5)]
+        assert info['total_jobs'] == 3
+        assert info['sweep_dimensions'][0]['linked'] is True
+        assert info['sweep_dimensions'][0]['parameters'] == ['sphere.radius', 'beam.thickness']
+
+    def test_product_of_zips(self, tmp_path, simple_cubic_yaml):
+        """Test that groups and plain sweeps combine as a product."""
+        job = self._load(tmp_path, simple_cubic_yaml, [
+            {'zip': [
+                {'parameter': 'beam.0.ratio', 'values': [1.0, 0.9]},
+                {'parameter': 'beam.1.ratio', 'values': [1.0, 1.1]},
+            ]},
+            {'parameter': 'sphere.radius', 'values': [1.5, 2.0, 2.5]},
+        ])
+
+        param_sets = ParametricGenerator(job).generate_parameter_sets()
+
+        assert len(param_sets) == 6
+        assert param_sets[4].sweep_indices == (1, 1)
+        assert param_sets[4].parameters['beam.0.ratio'] == 0.9
+        assert param_sets[4].parameters['beam.1.ratio'] == 1.1
+        assert param_sets[4].parameters['sphere.radius'] == 2.0
+
+    def test_unequal_lengths_rejected(self, tmp_path, simple_cubic_yaml):
+        """Test that linked sweeps must have the same length."""
+        with pytest.raises(YAMLParseError, match="same number of values"):
+            self._load(tmp_path, simple_cubic_yaml, [{'zip': [
+                {'parameter': 'sphere.radius', 'values': [1.5, 2.0]},
+                {'parameter': 'beam.thickness', 'values': [1.0]},
+            ]}])
+
+    def test_linked_parameters_validated(self, tmp_path, simple_cubic_yaml):
+        """Test that group members are validated like plain sweeps."""
+        with pytest.raises(YAMLParseError, match="out of bounds"):
+            self._load(tmp_path, simple_cubic_yaml, [{'zip': [
+                {'parameter': 'beam.99.ratio', 'values': [1.0]},
+            ]}])
@@ -0,0 +1,81 @@
+"""Unit tests for opt-in pipeline profiling."""
+
+import pstats
+import re
+import time
+
+import pytest
+
+from src.services.job_generator import JobGenerator
+from src.utils.profiling import PROFILE_ENV_VAR, Profiler, profiled, profiling_enabled
+
+
+COLLAPSED_LINE = re.compile(r'^\S+ \d+$')
+
+
+def busy_loop(seconds):
+    """Keep the CPU busy so that the sampler sees this frame."""
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        sum(range(100))
+
+
+class TestProfiler:
+    """Tests for Profiler and profiled."""
+
+    def test_enabled_by_flag_or_env(self, monkeypatch):
+        """Test the explicit flag and the ESP_PROFILE variable."""
+        monkeypatch.delenv(PROFILE_ENV_VAR, raising=False)
+        assert not profiling_enabled()
+        monkeypatch.setenv(PROFILE_ENV_VAR, "1")
+        assert profiling_enabled()
+        assert not profiling_enabled(False)
+        monkeypatch.setenv(PROFILE_ENV_VAR, "off")
+        assert not profiling_enabled()
+        assert profiling_enabled(True)
+
+    def test_artifacts(self, tmp_path):
+        """Test pstats, collapsed stacks and summary output."""
+        profiler = Profiler(sample_interval=0.001)
+        with profiler:
+            busy_loop(0.1)
+        paths = profiler.save(tmp_path / 'profile', 'generation')
+
+        assert set(paths) == {'pstats', 'collapsed', 'summary'}
+        stats = pstats.Stats(str(paths['pstats']))
+        assert any(func[2] == 'busy_loop' for func in stats.stats)
+
+        lines = paths['collapsed'].read_text(encoding='utf-8').splitlines()
+        assert lines and all(COLLAPSED_LINE.match(line) for line in lines)
+        assert any('test_profiling.py:busy_loop' in line for line in lines)
+        assert 'busy_loop' in paths['summary'].read_text(encoding='utf-8')
+
+    def test_profiled_disabled(self, tmp_path, monkeypatch):
+        """Test that a disabled profile writes nothing."""
+        monkeypatch.delenv(PROFILE_ENV_VAR, raising=False)
+        with profiled(tmp_path / 'profile', 'generation') as profiler:
+            assert profiler is None
+        assert not (tmp_path / 'profile').exists()
+
+
+class TestGeneratorProfiling:
+    """Tests for profiling in JobGenerator."""
+
+    @pytest.mark.parametrize("profile", [True, False])
+    def test_generation_profile(self, tmp_path, monkeypatch, profile, custom_job, templates_dir):
+        """Test that profile=True writes artifacts to the run directory."""
+        monkeypatch.setenv(PROFILE_ENV_VAR, "1")
+        generator = JobGenerator(
+            template_dir=templates_dir,
+            output_base_dir=tmp_path,
+            profile=profile
+        )
+        result = generator.generate_parametric_study_jobs(custom_job, run_id='run')
+
+        profile_dir = result['run_dir'] / 'profile'
+        if profile:
+            assert sorted(p.name for p in profile_dir.iterdir()) == [
+                'generation.collapsed', 'generation.pstats', 'generation.txt'
+            ]
+        else:
+            assert not profile_dir.exists()
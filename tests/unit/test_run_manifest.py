@@ -0,0 +1,68 @@
+"""Unit tests for the JSONL run manifest."""
+
+import pytest
+
+from src.services.run_manifest import (
+    MANIFEST_FILENAME,
+    RunManifest,
+    read_manifest,
+    summarize_manifest,
+)
+
+
+class TestRunManifest:
+    """Tests for RunManifest writing and reading."""
+
+    def test_records_round_trip(self, tmp_path):
+        """Test that header, job, skipped and summary records are streamed."""
+        path = tmp_path / MANIFEST_FILENAME
+
+        with RunManifest(path) as manifest:
+            manifest.write_header(run_id="run_001", total_jobs=2)
+            manifest.write_job({'job_id': 'job_001', 'metadata': {'a': 1}})
+            manifest.write_skipped({'parameter_set_index': 2, 'error': 'too thick'})
+            manifest.write_summary(jobs_generated=1, jobs_skipped=1)
+
+        records = list(read_manifest(path))
+
+        assert [r['type'] for r in records] == ['run', 'job', 'skipped', 'summary']
+        assert records[1]['metadata'] == {'a': 1}
+        assert [r['job_id'] for r in read_manifest(tmp_path, 'job')] == ['job_001']
+
+    def test_partial_manifest_is_readable(self, tmp_path):
+        """Test that an interrupted run still yields its complete records."""
+        path = tmp_path / MANIFEST_FILENAME
+        manifest = RunManifest(path)
+        manifest.write_header(run_id="run_001")
+        manifest.write_job({'job_id': 'job_001'})
+        manifest.close()
+
+        # Simulate a write cut off mid-line
+        with open(path, 'ab') as f:
+            f.write(b'{"type": "job", "job_id": "job_0')
+
+        summary = summarize_manifest(path)
+
+        assert summary['jobs_generated'] == 1
+        assert summary['completed'] is False
+        assert summary['run']['run_id'] == "run_001"
+
+    def test_manifest_appends(self, tmp_path):
+        """Test that reopening a manifest appends instead of truncating."""
+        path = tmp_path / MANIFEST_FILENAME
+        for job_id in ['job_001', 'job_002']:
+            with RunManifest(path) as manifest:
+                manifest.write_job({'job_id': job_id})
+
+        assert summarize_manifest(path)['jobs_generated'] == 2
+
+    def test_header_starts_new_manifest(self, tmp_path):
+        """Test that regenerating a run replaces the previous records."""
+        path = tmp_path / MANIFEST_FILENAME
+        for _ in range(2):
+            with RunManifest(path) as manifest:
+                manifest.write_header(run_id='run_001')
+                manifest.write_job({'job_id': 'job_001'})
+
+        records = list(read_manifest(path))
+        assert [r['type'] for r in records] == ['run', 'job']
@@ -0,0 +1,161 @@
+"""Unit tests for surrogate-model prescreening."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("sklearn")
+
+from src.optimizers.surrogate import SurrogateModel, load_training_frame
+from src.services.job_generator import JobGenerator
+from src.services.parametric_generator import ParameterSet, ParametricGenerator
+
+
+def _zener_ratio(radius, thickness):
+    """Smooth synthetic response standing in for simulated results."""
+    return 0.5 + 0.4 * radius - 0.3 * thickness
+
+
+def _grid(n=5):
+    """Build an n x n grid of parameter sets."""
+    sets = []
+    for i, radius in enumerate(np.linspace(1.5, 2.5, n)):
+        for j, thickness in enumerate(np.linspace(0.5, 1.5, n)):
+            sets.append(ParameterSet(
+                job_id=f"job_{len(sets) + 1:03d}",
+                parameters={'sphere.radius': float(radius), 'beam.thickness': float(thickness)},
+                sweep_indices=(i, j)
+            ))
+    return sets
+
+
+@pytest.fixture
+def training_data():
+    """Completed jobs on a coarse grid with synthetic results."""
+    candidates = _grid(4)
+    targets = [
+        {'zener_ratio': _zener_ratio(c.parameters['sphere.radius'], c.parameters['beam.thickness'])}
+        for c in candidates
+    ]
+    return candidates, targets
+
+
+class TestSurrogateModel:
+    """Tests for training and prediction."""
+
+    @pytest.mark.parametrize("model_type", ['gp', 'forest'])
+    def test_predict_with_uncertainty(self, training_data, model_type):
+        """Test that predictions track the response with finite std."""
+        candidates, targets = training_data
+        model = SurrogateModel(model_type=model_type).fit(candidates, targets)
+
+        grid = _grid(5)
+        prediction = model.predict(grid)
+        mean, std = prediction.get('zener_ratio')
+
+        expected = [
+            _zener_ratio(c.parameters['sphere.radius'], c.parameters['beam.thickness'])
+            for c in grid
+        ]
+        assert mean.shape == std.shape == (25,)
+        assert np.all(std >= 0)
+        assert np.max(np.abs(mean - expected)) < 0.15
+
+    def test_unknown_model_type(self):
+        """Test that unknown model types are rejected."""
+        with pytest.raises(ValueError, match="Unknown surrogate model type"):
+            SurrogateModel(model_type='svm')
+
+    def test_predict_before_fit(self):
+        """Test that predicting requires a fitted model."""
+        with pytest.raises(RuntimeError):
+            SurrogateModel().predict(_grid(2))
+
+
+class TestPrescreen:
+    """Tests for ranking and pruning candidates."""
+
+    def test_prunes_infeasible_candidates(self, training_data):
+        """Test that candidates far from the target range are pruned."""
+        candidates, targets = training_data
+        model = SurrogateModel(model_type='gp').fit(candidates, targets)
+
+        grid = _grid(5)
+        result = model.prescreen(grid, {'zener_ratio': (0.9, 1.1)}, kappa=2.0)
+
+        assert result.summary['num_candidates'] == 25
+        assert len(result.selected) + len(result.pruned) == 25
+        assert len(result.pruned) > len(grid) // 2
+
+        best = result.selected[0].parameters
+        assert abs(_zener_ratio(best['sphere.radius'], best['beam.thickness']) - 1.0) < 0.1
+
+    def test_max_candidates(self, training_data):
+        """Test limiting the number of selected candidates."""
+        candidates, targets = training_data
+        model = SurrogateModel(model_type='forest').fit(candidates, targets)
+
+        result = model.prescreen(_grid(5), {'zener_ratio': (None, 10.0)}, max_candidates=3)
+
+        assert len(result.selected) == 3
+        assert len(result.pruned) == 22
+
+    def test_plain_mappings_become_parameter_sets(self, training_data):
+        """Test that mapping candidates are returned as numbered ParameterSets."""
+        candidates, targets = training_data
+        model = SurrogateModel(model_type='forest').fit(candidates, targets)
+
+        mappings = [dict(p.parameters) for p in _grid(2)]
+        result = model.prescreen(mappings, {'zener_ratio': (None, 10.0)})
+
+        assert all(isinstance(p, ParameterSet) for p in result.selected + result.pruned)
+        assert sorted(p.job_id for p in result.selected) == ['job_001', 'job_002', 'job_003', 'job_004']
+        assert {p.job_id: p.parameters for p in result.selected}['job_002'] == mappings[1]
+
+    def test_unknown_target(self, training_data):
+        """Test that ranges for unmodelled targets are rejected."""
+        candidates, targets = training_data
+        model = SurrogateModel(model_type='forest').fit(candidates, targets)
+
+        with pytest.raises(KeyError):
+            model.prescreen(_grid(2), {'C11': (0.0, 1.0)})
+
+
+class TestGeneratorIntegration:
+    """Tests for feeding prescreened candidates to the job generator."""
+
+    def test_training_frame_and_selected_generation(self, tmp_path, custom_job, templates_dir):
+        """Test training from run metadata and generating selected jobs."""
+        generator = JobGenerator(
+            template_dir=templates_dir,
+            output_base_dir=tmp_path,
+            metadata_run_table=False
+        )
+        run = generator.generate_parametric_study_jobs(custom_job, run_id="run_train")
+
+        results = pd.DataFrame([
+            {
+                'job_id': job['job_id'],
+                'zener_ratio': _zener_ratio(
+                    job['metadata']['parametric']['applied_parameters']['sphere.radius'],
+                    job['metadata']['parametric']['applied_parameters']['beam.thickness']
+                )
+            }
+            for job in run['jobs']
+        ])
+        df = load_training_frame(run['run_dir'], results)
+        assert len(df) == 6
+        assert {'sphere.radius', 'beam.thickness', 'zener_ratio'} <= set(df.columns)
+
+        model = SurrogateModel(model_type='forest').fit_frame(
+            df, ['sphere.radius', 'beam.thickness'], ['zener_ratio']
+        )
+        candidates = ParametricGenerator(custom_job).generate_parameter_sets()
+        screened = model.prescreen(candidates, {'zener_ratio': (None, 10.0)}, max_candidates=2)
+
+        selected_run = generator.generate_parametric_study_jobs(
+            custom_job,
+            run_id="run_selected",
+            param_sets=screened.selected
+        )
+        assert selected_run['total_jobs'] == 2
@@ -0,0 +1,96 @@
+"""Unit tests for shared Jinja2 environments and the bytecode cache."""
+
+import pytest
+
+from src.services.job_generator import JobGenerator
+from src.services.template_cache import (
+    clear_bytecode_cache,
+    clear_template_environments,
+    get_template_environment,
+    resolve_cache_dir,
+)
+
+
+JINJA_CONFIG = {
+    'block_start_string': '<%',
+    'block_end_string': '%>',
+    'variable_start_string': '<<',
+    'variable_end_string': '>>',
+    'comment_start_string': '<#',
+    'comment_end_string': '#>',
+    'trim_blocks': True,
+    'lstrip_blocks': True,
+    'keep_trailing_newline': True,
+}
+
+
+@pytest.fixture(autouse=True)
+def fresh_environments():
+    """Isolate tests from environments shared by other tests."""
+    clear_template_environments()
+    yield
+    clear_template_environments()
+
+
+class TestTemplateEnvironment:
+    """Tests for shared environments."""
+
+    def test_environment_is_shared(self, tmp_path, templates_dir):
+        """Test that the same settings return the same environment."""
+        env1 = get_template_environment(templates_dir, JINJA_CONFIG, cache_dir=tmp_path)
+        env2 = get_template_environment(templates_dir, JINJA_CONFIG, cache_dir=tmp_path)
+        env3 = get_template_environment(templates_dir, JINJA_CONFIG)
+
+        assert env1 is env2
+        assert env1 is not env3
+
+    def test_bytecode_written_and_reused(self, tmp_path, templates_dir):
+        """Test that compiled templates are stored and survive a new environment."""
+        cache_dir = tmp_path / "cache"
+        env = get_template_environment(templates_dir, JINJA_CONFIG, cache_dir=cache_dir)
+        env.get_template('run.bat.j2')
+
+        files = list(cache_dir.iterdir())
+        assert len(files) == 1
+
+        clear_template_environments()
+        env = get_template_environment(templates_dir, JINJA_CONFIG, cache_dir=cache_dir)
+        assert env.get_template('run.bat.j2') is not None
+        assert list(cache_dir.iterdir()) == files
+
+        clear_bytecode_cache(cache_dir)
+        assert list(cache_dir.iterdir()) == []
+
+    def test_edited_template_recompiled(self, tmp_path):
+        """Test that a changed template source is not served from the cache."""
+        template_dir = tmp_path / "templates"
+        template_dir.mkdir()
+        template_file = template_dir / "t.j2"
+        template_file.write_text("v1 << x >>")
+        cache_dir = tmp_path / "cache"
+
+        env = get_template_environment(template_dir, JINJA_CONFIG, cache_dir=cache_dir)
+        assert env.get_template("t.j2").render(x=1) == "v1 1"
+
+        template_file.write_text("v2 << x >>")
+        clear_template_environments()
+        env = get_template_environment(template_dir, JINJA_CONFIG, cache_dir=cache_dir)
+        assert env.get_template("t.j2").render(x=1) == "v2 1"
+
+    def test_resolve_cache_dir(self, project_root):
+        """Test resolving the cache directory from config."""
+        assert resolve_cache_dir({'enabled': False, 'dir': 'x'}) is None
+        assert resolve_cache_dir(None) is None
+        assert resolve_cache_dir({'enabled': True, 'dir': '.cache/j'}) == project_root.resolve() / '.cache/j'
+
+
+class TestGeneratorTemplates:
+    """Tests for template resolution in JobGenerator."""
+
+    def test_templates_resolved_once(self, tmp_path, templates_dir):
+        """Test that generators share an environment and resolve templates once."""
+        gen1 = JobGenerator(templates_dir, tmp_path / "a", template_cache_dir=tmp_path / "cache")
+        gen2 = JobGenerator(templates_dir, tmp_path / "b", template_cache_dir=tmp_path / "cache")
+
+        assert gen1.jinja_env is gen2.jinja_env
+        assert gen1.get_template('run.bat.j2') is gen1.get_template('run.bat.j2')
@@ -0,0 +1,148 @@
+"""Unit tests for once-per-run template certification."""
+
+import shutil
+
+import pytest
+from jinja2 import DictLoader, Environment
+
+from src.parsers import load_custom_lattice_yaml
+from src.services.geometry_builder import GeometryBuilder
+from src.services.job_generator import JobGenerator
+from src.services.parametric_generator import ParametricGenerator
+from src.services.template_cache import clear_template_environments
+from src.services.template_certifier import (
+    TemplateCertifier,
+    representative_contexts,
+    template_fingerprint,
+)
+from src.validators import template_validator
+from src.validators.template_validator import load_validation_checks, quick_validate_java
+
+
+@pytest.fixture(autouse=True)
+def fresh_environments():
+    """Isolate tests from environments shared by other tests."""
+    clear_template_environments()
+    yield
+    clear_template_environments()
+
+
+def make_template(source: str):
+    """Compile a template from a string."""
+    return Environment(loader=DictLoader({'t.j2': source})).get_template('t.j2')
+
+
+class TestTemplateCertifier:
+    """Tests for TemplateCertifier."""
+
+    def test_certified_once_and_marker_reused(self, tmp_path):
+        """Test that a valid template is rendered once and remembered on disk."""
+        template = make_template("class {{ name }} { int x = {{ value }}; }\n")
+        fingerprint = template_fingerprint(template)
+        rendered = []
+
+        def render(context):
+            rendered.append(context)
+            return template.render(**context)
+
+        certifier = TemplateCertifier(tmp_path)
+        contexts = [{'name': 'A', 'value': 1}, {'name': 'B', 'value': 2}]
+        assert certifier.certify(fingerprint, render, contexts, name='t.j2')
+        assert certifier.certify(fingerprint, render, contexts, name='t.j2')
+        assert len(rendered) == 2
+        assert (tmp_path / f"{fingerprint}.json").is_file()
+
+        # A new certifier (next run) trusts the marker without rendering
+        assert TemplateCertifier(tmp_path).is_certified(fingerprint)
+
+    def test_invalid_template_not_certified(self, tmp_path):
+        """Test that a template rendering unbalanced braces is not certified."""
+        template = make_template("class {{ name }} {{ '{' }}\n")
+        fingerprint = template_fingerprint(template)
+        certifier = TemplateCertifier(tmp_path)
+
+        assert not certifier.certify(fingerprint, lambda c: template.render(**c), [{'name': 'A'}])
+        assert not certifier.is_certified(fingerprint)
+        assert not any(tmp_path.iterdir())
+
+    def test_fingerprint_depends_on_source_and_settings(self):
+        """Test that source and settings changes produce new fingerprints."""
+        a = make_template("{{ x }}")
+        b = make_template("{{ x }} ")
+        assert template_fingerprint(a) != template_fingerprint(b)
+        assert template_fingerprint(a, {'precision': 6}) != template_fingerprint(a, {'precision': 3})
+        assert template_fingerprint(a) == template_fingerprint(make_template("{{ x }}"))
+
+    def test_representative_contexts(self, custom_job):
+        """Test the minimal and large geometries built from a real job."""
+        param_set = ParametricGenerator(custom_job).generate_parameter_sets()[0]
+        geometry = GeometryBuilder().build_geometry_data(custom_job, param_set)
+
+        real, minimal, wide = representative_contexts({'geometry': geometry, 'density': 8960.0})
+        assert real['geometry'] is geometry
+        assert len(minimal['geometry'].spheres) == 1
+        assert len(wide['geometry'].spheres) >= len(geometry.spheres)
+        assert len(repr(wide['density'])) > len(repr(8960.0))
+
+
+class TestQuickValidation:
+    """Tests for the cheap per-job check."""
+
+    def test_quick_validate(self):
+        """Test size and unrendered-variable checks."""
+        assert quick_validate_java("class A {}", min_size=5).is_valid
+
+        too_small = quick_validate_java("class A {}", min_size=100)
+        assert [e.error_type for e in too_small.errors] == ['size_mismatch']
+
+        leftover = quick_validate_java("class A {\n String s = \"<< name >>\";\n}")
+        assert [e.error_type for e in leftover.errors] == ['rendering_error']
+        assert leftover.errors[0].line_number == 2
+
+    def test_resolved_checks_skip_config(self, monkeypatch):
+        """Test that checks resolved once per run are used without reloading config."""
+        checks = load_validation_checks()
+
+        def no_config(path):
+            raise AssertionError("config reloaded per job")
+
+        monkeypatch.setattr(template_validator, 'load_config', no_config)
+        leftover = quick_validate_java("String s = \"<< name >>\";", checks=checks)
+        assert [e.error_type for e in leftover.errors] == ['rendering_error']
+
+
+class TestJobGeneratorCertification:
+    """Tests for certification in JobGenerator."""
+
+    def generate(self, template_dir, lattice_yaml, output_dir, certify):
+        """Generate the study in lattice_yaml and return the Java sources."""
+        generator = JobGenerator(
+            template_dir=template_dir,
+            output_base_dir=output_dir,
+            certify_templates=certify
+        )
+        custom_job = load_custom_lattice_yaml(lattice_yaml, strict=False)
+        generator.generate_parametric_study_jobs(custom_job, run_id='run')
+        sources = sorted((output_dir / 'run').glob('job_*/*.java'))
+        return generator, [path.read_text(encoding='utf-8') for path in sources]
+
+    def test_certified_generation_matches(self, tmp_path, templates_dir, simple_cubic_yaml):
+        """Test that certification does not change generated jobs."""
+        _, plain = self.generate(templates_dir, simple_cubic_yaml, tmp_path / 'plain', certify=False)
+        generator, certified = self.generate(templates_dir, simple_cubic_yaml, tmp_path / 'certified', certify=True)
+
+        assert certified == plain
+        assert len(generator._template_certificates) == 1
+
+    def test_edited_template_recertified(self, tmp_path, templates_dir, simple_cubic_yaml):
+        """Test that editing the template yields a new fingerprint."""
+        template_dir = tmp_path / 'templates'
+        shutil.copytree(templates_dir, template_dir, ignore=shutil.ignore_patterns('lattice_setting'))
+
+        first, _ = self.generate(template_dir, simple_cubic_yaml, tmp_path / 'a', certify=True)
+        path = template_dir / 'custom_lattice.java.j2'
+        path.write_text(path.read_text(encoding='utf-8') + '\n', encoding='utf-8')
+        clear_template_environments()
+        second, _ = self.generate(template_dir, simple_cubic_yaml, tmp_path / 'b', certify=True)
+
+        assert first._template_certificates != second._template_certificates
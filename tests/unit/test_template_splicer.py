@@ -0,0 +1,112 @@
+"""Unit tests for rendering templates as static skeleton plus per-job blocks."""
+
+import pytest
+
+from jinja2 import DictLoader, Environment
+
+from src.services.geometry_builder import GeometryBuilder
+from src.services.job_generator import JobGenerator
+from src.services.parametric_generator import ParametricGenerator
+from src.services.template_splicer import SplicedTemplate
+
+
+def make_template(source: str):
+    """Compile a template with the repo's custom delimiters."""
+    env = Environment(
+        loader=DictLoader({'t.j2': source}),
+        block_start_string='<%',
+        block_end_string='%>',
+        variable_start_string='<<',
+        variable_end_string='>>',
+        trim_blocks=True,
+        lstrip_blocks=True,
+        keep_trailing_newline=True,
+    )
+    return env.get_template('t.j2')
+
+
+SOURCE = (
+    "header << title >>\n"
+    "<% block name %>\n"
+    "name = << name >>\n"
+    "<% endblock %>\n"
+    "static middle\n"
+    "<% block values %>\n"
+    "<% for v in values %>\n"
+    "  << v >>\n"
+    "<% endfor %>\n"
+    "<% endblock %>\n"
+    "footer << name >>\n"
+)
+
+
+class TestSplicedTemplate:
+    """Tests for SplicedTemplate."""
+
+    def test_matches_full_render(self):
+        """Test that spliced output equals a full render for several contexts."""
+        template = make_template(SOURCE)
+        spliced = SplicedTemplate(template, blocks=['name', 'values'])
+
+        for i in range(3):
+            context = {'title': 'T', 'name': f'job_{i}', 'values': list(range(i))}
+            assert spliced.render(context) == template.render(**context)
+
+    def test_static_skeleton_rendered_once(self):
+        """Test that the skeleton is reused while static variables are unchanged."""
+        template = make_template(SOURCE)
+        spliced = SplicedTemplate(template)
+
+        # 'name' is also used in the footer, outside any block
+        assert spliced.static_variables == {'title', 'name'}
+
+        spliced.render({'title': 'A', 'name': 'x', 'values': [1]})
+        spliced.render({'title': 'A', 'name': 'x', 'values': [2, 3]})
+        assert spliced.num_skeletons == 1
+
+        context = {'title': 'B', 'name': 'y', 'values': [4]}
+        assert spliced.render(context) == template.render(**context)
+        assert spliced.num_skeletons == 2
+
+    def test_template_without_blocks_rejected(self):
+        """Test that a template without blocks cannot be spliced."""
+        with pytest.raises(ValueError, match="no blocks"):
+            SplicedTemplate(make_template("plain << x >>\n"))
+
+    def test_unknown_block_rejected(self):
+        """Test that naming a block the template does not define fails."""
+        with pytest.raises(ValueError, match="missing"):
+            SplicedTemplate(make_template(SOURCE), blocks=['missing'])
+
+
+class TestCustomLatticeSplicing:
+    """Tests for splicing custom_lattice.java.j2."""
+
+    def test_custom_lattice_matches_full_render(self, tmp_path, custom_job, templates_dir):
+        """Test that every job of a parametric study renders identically."""
+        generator = JobGenerator(template_dir=templates_dir, output_base_dir=tmp_path)
+        template = generator.get_template('custom_lattice.java.j2')
+        spliced = generator.get_spliced_template('custom_lattice.java.j2')
+
+        # Per-job values must all live inside blocks
+        assert spliced.static_variables == set()
+
+        builder = GeometryBuilder()
+        for param_set in ParametricGenerator(custom_job).generate_parameter_sets():
+            geometry = builder.build_geometry_data(custom_job, param_set)
+            context = {
+                'class_name': param_set.job_id,
+                'file_name': param_set.job_id,
+                'youngs_modulus': 1.0e9,
+                'poissons_ratio': 0.3,
+                'density': 8960,
+                'mesh_size': 5,
+                'strain_delta': 0.001,
+                'strain_steps': 'range(0,1,2)',
+                'lattice_constant': geometry.lattice_constant,
+                'geometry': geometry,
+            }
+            assert spliced.render(context) == template.render(**context)
+
+        assert spliced.num_skeletons == 1
+        assert generator.get_spliced_template('custom_lattice.java.j2') is spliced
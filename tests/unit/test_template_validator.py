@@ -0,0 +1,119 @@
+"""Unit tests for rendered Java validation."""
+
+from src.validators.template_validator import (
+    JavaCodeValidator,
+    validate_generated_java,
+)
+
+
+VALID_JAVA = '''public class Job {
+    public static void main(String[] args) {
+        double[] values = new double[]{1.0, 2.0};
+        String s = "unbalanced ( [ { in a string";
+        char c = '}';
+        // a comment with ) and ]
+        /* block comment
+           with { and ( */
+        System.out.println(values[0]);
+    }
+}
+'''
+
+
+def error_types(result):
+    """Error types of a validation result."""
+    return [e.error_type for e in result.errors]
+
+
+class TestBracketBalance:
+    """Tests for the bracket-balance check."""
+
+    def test_brackets_in_literals_and_comments_ignored(self):
+        """Test that brackets inside strings, chars and comments are not counted."""
+        result = validate_generated_java(VALID_JAVA)
+        assert result.is_valid
+        assert result.errors == []
+
+    def test_unclosed_brace_located(self):
+        """Test that an unclosed brace is reported as never closed."""
+        code = VALID_JAVA.replace('double[] values', 'if (true) { double[] values')
+        result = validate_generated_java(code)
+
+        assert not result.is_valid
+        assert error_types(result) == ['brace_mismatch']
+        assert 'never closed' in result.errors[0].message
+
+    def test_crossed_brackets_detected(self):
+        """Test that misnested brackets are errors even when counts balance."""
+        code = VALID_JAVA.replace('println(values[0]);', 'println(values[0)];')
+        result = validate_generated_java(code)
+
+        # Recovery at the matching '(' avoids cascading brace errors
+        assert not result.is_valid
+        assert error_types(result) == ['bracket_mismatch']
+        assert result.errors[0].line_number == 9
+
+
+class TestLineChecks:
+    """Tests for per-line checks."""
+
+    def test_unrendered_variable_inside_string(self):
+        """Test that Jinja2 leftovers are found inside string literals."""
+        code = VALID_JAVA.replace('"unbalanced', '"<< file_name >> unbalanced')
+        result = validate_generated_java(code)
+
+        assert error_types(result) == ['rendering_error']
+        assert result.errors[0].line_number == 4
+        assert result.errors[0].message == 'Unrendered Jinja2 variable'
+
+    def test_unrendered_block(self):
+        """Test that an unrendered block tag is an error."""
+        code = VALID_JAVA.replace('// a comment', '<% for x in xs %> // a comment')
+        result = validate_generated_java(code)
+
+        assert error_types(result) == ['rendering_error']
+        assert result.errors[0].message == 'Unrendered Jinja2 block'
+
+    def test_long_line_and_whitespace_warnings(self):
+        """Test long-line and excessive-whitespace warnings with line numbers."""
+        validator = JavaCodeValidator()
+        long_line = '        String s = "' + 'x' * validator.MAX_LINE_LENGTH + '";'
+        code = VALID_JAVA.replace('        char c', long_line + '\n        char c')
+        code = code.replace('// a comment', ' ' * 24 + '// a comment')
+        result = validator.validate_rendered_java(code)
+
+        assert result.is_valid
+        assert [(w.error_type, w.line_number) for w in result.warnings] == [
+            ('long_line', 5),
+            ('code_quality', 7),
+        ]
+
+    def test_tab_whitespace(self):
+        """Test that runs of tabs and spaces also count as excessive whitespace."""
+        code = VALID_JAVA.replace('// a comment', '\t' * 4 + ' ' * 16 + '// a comment')
+        result = validate_generated_java(code)
+
+        assert [w.error_type for w in result.warnings] == ['code_quality']
+
+
+class TestConfiguredChecks:
+    """Tests for validation settings read from config."""
+
+    def test_config_changes_take_effect(self, monkeypatch):
+        """Test that settings are re-read instead of frozen on first use."""
+        from src.validators import template_validator
+
+        load_config = template_validator.load_config
+        code = 'class A {\n    String s = "' + 'x' * 50 + '";\n}\n'
+        assert JavaCodeValidator().MAX_LINE_LENGTH != 40
+        assert not validate_generated_java(code).warnings
+
+        def edited_config(path):
+            config = load_config(path)
+            config['validation']['max_line_length'] = 40
+            return config
+
+        monkeypatch.setattr(template_validator, 'load_config', edited_config)
+        assert JavaCodeValidator().MAX_LINE_LENGTH == 40
+        result = validate_generated_java(code)
+        assert [(w.error_type, w.line_number) for w in result.warnings] == [('long_line', 2)]